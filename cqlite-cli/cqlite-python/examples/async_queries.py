@@ -9,6 +9,7 @@ execution, and batch processing - all revolutionary firsts for SSTable querying!
 
 import asyncio
 import cqlite
+import pyarrow as pa
 import tempfile
 import time
 from pathlib import Path
@@ -84,17 +85,21 @@ async def example_streaming_large_datasets():
         # Process 1 million+ rows efficiently
         sql = "SELECT user_id, event_type, timestamp FROM large_events WHERE date >= '2023-01-01'"
         
-        async for row in cqlite.stream_query_results(
+        # Arrow batches: one counter update per batch instead of per row.
+        # Memory is bounded by chunk_size (one batch is held at a time), so
+        # there is no max_memory_mb to pass here.
+        batch_index = 0
+        async for batch in cqlite.stream_query_batches(
             sstable_path, 
             sql, 
-            chunk_size=5000,  # Process 5K rows at a time
-            max_memory_mb=100  # Limit memory usage
+            chunk_size=5000,  # Up to 5K rows per batch
         ):
-            # Process each row
-            processed_count += 1
+            # Count the rows actually received; the last batch may be short
+            processed_count += batch.num_rows
+            batch_index += 1
             
-            # Show progress every 10K rows
-            if processed_count % 10000 == 0:
+            # Show progress every second batch
+            if batch_index % 2 == 0:
                 elapsed = time.time() - start_time
                 rate = processed_count / elapsed if elapsed > 0 else 0
                 print(f"   📈 Processed {processed_count:,} rows ({rate:.0f} rows/sec)")
@@ -114,15 +119,16 @@ async def example_streaming_large_datasets():
         total_rows = 0
         
         async with cqlite.AsyncSSTableReader(sstable_path, chunk_size=10000) as reader:
-            async for chunk in reader.query_chunks(sql, chunk_size=10000):
+            # Columnar chunks: one Arrow array per column instead of a dict per row
+            async for batch in reader.query_column_chunks(sql, chunk_size=10000):
                 chunk_count += 1
-                chunk_size = len(chunk)
+                chunk_size = batch.num_rows
                 total_rows += chunk_size
                 
                 print(f"   📦 Chunk {chunk_count}: {chunk_size:,} rows")
                 
                 # Process chunk (e.g., aggregate, transform, export)
-                # chunk_df = pd.DataFrame(chunk)
+                # chunk_df = batch.to_pandas()
                 # aggregated_data = chunk_df.groupby('event_type').size()
                 
                 if chunk_count >= 5:  # Limit for demo
@@ -156,29 +162,26 @@ async def example_concurrent_queries():
             "SELECT MAX(timestamp) FROM events",
         ]
         
+        query_names = [
+            "Login events", "Purchase events", "Signup events", 
+            "Avg session duration", "Unique users", "Latest timestamp"
+        ]
+        
         start_time = time.time()
         
-        # Run all queries in parallel
-        results = await cqlite.parallel_query_execution(
+        # Run all queries in parallel, displaying each result as soon as it lands
+        async for index, result in cqlite.iter_parallel_query_results(
             sstable_path, 
             queries, 
             max_concurrent=4
-        )
+        ):
+            value = result[0] if result else {"value": "N/A"}
+            print(f"   📊 {query_names[index]}: {value}")
         
         execution_time = time.time() - start_time
         
         print(f"✅ Executed {len(queries)} queries in {execution_time:.2f}s")
         
-        # Display results
-        query_names = [
-            "Login events", "Purchase events", "Signup events", 
-            "Avg session duration", "Unique users", "Latest timestamp"
-        ]
-        
-        for name, result in zip(query_names, results):
-            value = result[0] if result else {"value": "N/A"}
-            print(f"   📊 {name}: {value}")
-        
         # Compare with sequential execution
         print("\n⏱️  Performance comparison...")
         
@@ -246,13 +249,14 @@ async def example_async_exports():
     
     try:
         async with cqlite.AsyncSSTableReader(sstable_path) as reader:
-            # Async CSV export
+            # Async CSV export (O_DIRECT: skips the page cache on the write side)
             print("📄 Async CSV export...")
             
             csv_result = await reader.export_async(
                 "SELECT user_id, name, email, signup_date FROM users",
                 "/tmp/async_users.csv",
-                format="csv"
+                format="csv",
+                direct=True
             )
             
             print(f"   ✅ CSV export: {csv_result}")
@@ -326,10 +330,10 @@ async def example_batch_processing():
         
         print(f"📁 Created {len(sstable_files)} SSTable files for batch processing")
         
-        # Initialize batch processor
+        # Initialize batch processor (opens every file once, up front)
         processor = cqlite.AsyncBatchProcessor(
             sstable_files, 
-            max_concurrent=2  # Process 2 files at a time
+            max_concurrent=64  # Scans in flight across all files, not file count
         )
         
         # Process same query across all files
@@ -361,7 +365,7 @@ async def example_batch_processing():
         batch_stats = {
             'total_files': len(sstable_files),
             'total_rows': 0,
-            'total_users': set(),
+            'total_users': [],
             'total_revenue': 0.0,
         }
         
@@ -375,23 +379,32 @@ async def example_batch_processing():
                 rows = file_stats[0]['rows'] if file_stats else 0
                 batch_stats['total_rows'] += rows
                 
-                # Get unique users
-                users = await reader.query("SELECT DISTINCT user_id FROM events")
-                for user_row in users:
-                    batch_stats['total_users'].add(user_row['user_id'])
+                # Get unique users (deduplicated natively, merged across files below)
+                users = await reader.distinct_column("SELECT user_id FROM events", "user_id")
+                batch_stats['total_users'].append(users)
                 
-                # Get revenue
-                revenue = await reader.query("SELECT SUM(revenue) as total FROM events")
-                file_revenue = revenue[0]['total'] if revenue else 0
+                # Get revenue (reducer runs once per chunk on a NumPy column;
+                # a Numba @njit function can be passed the same way)
+                file_revenue = await reader.reduce(
+                    "SELECT revenue FROM events",
+                    lambda total, revenue: total + float(revenue.sum()),
+                    0.0,
+                    columns=["revenue"],
+                )
                 batch_stats['total_revenue'] += file_revenue
                 
                 print(f"      📊 File stats: {rows:,} rows, ${file_revenue:,.2f} revenue")
         
+        # Merge per-file distinct users into one distinct array. Files with no
+        # users give null-typed arrays, which can't be chunked with the others.
+        user_arrays = [users for users in batch_stats['total_users'] if users.type != pa.null()]
+        total_users = pa.chunked_array(user_arrays).unique() if user_arrays else pa.array([])
+        
         # Final batch statistics
         print(f"\n📈 Final batch processing results:")
         print(f"   📁 Files processed: {batch_stats['total_files']}")
         print(f"   📊 Total rows: {batch_stats['total_rows']:,}")
-        print(f"   👥 Unique users: {len(batch_stats['total_users']):,}")
+        print(f"   👥 Unique users: {len(total_users):,}")
         print(f"   💰 Total revenue: ${batch_stats['total_revenue']:,.2f}")
         
         # Performance metrics
@@ -472,11 +485,12 @@ async def example_performance_benchmarking():
                 processed_rows = 0
                 max_memory = start_memory
                 
-                async for chunk in reader.query_chunks(sql, chunk_size=5000):
-                    processed_rows += len(chunk)
+                async for batch in reader.query_column_chunks(sql, chunk_size=5000):
+                    batch_rows = batch.num_rows
+                    processed_rows += batch_rows
                     
                     # Simulate memory usage (in real scenario, would measure actual usage)
-                    current_memory = start_memory + (len(chunk) * 0.001)  # Mock calculation
+                    current_memory = start_memory + (batch_rows * 0.001)  # Mock calculation
                     max_memory = max(max_memory, current_memory)
                     
                     if processed_rows >= 20000:  # Limit for demo
@@ -499,8 +513,11 @@ async def example_performance_benchmarking():
         
         latencies = []
         
+        # Pool the reader so the open cost is paid once, not inside each measurement
+        pool = cqlite.ReaderPool()
+        
         for sql in latency_queries:
-            async with cqlite.AsyncSSTableReader(sstable_path) as reader:
+            async with pool.get(sstable_path) as reader:
                 start_time = time.time()
                 await reader.query(sql)
                 latency = (time.time() - start_time) * 1000  # Convert to milliseconds
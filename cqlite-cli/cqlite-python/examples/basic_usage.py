@@ -8,15 +8,21 @@ SSTable files directly with Python, without running Cassandra!
 This is the FIRST EVER Python library to provide this functionality!
 """
 
+import atexit
+import functools
+import shutil
+import sys
 import cqlite
 import tempfile
 import json
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def create_mock_sstable():
-    """Create a mock SSTable file for demonstration."""
+    """Create a mock SSTable file for demonstration (once per process)."""
     temp_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
     sstable_path = Path(temp_dir) / "users-big-Data.db"
     
     # Create empty file (in real usage, this would be an actual SSTable file)
@@ -25,14 +31,33 @@ def create_mock_sstable():
     return str(sstable_path)
 
 
-def example_basic_querying():
+def _print_rows(rows, numbered=True, flush_bytes=4096):
+    """Print rows through one buffered write per ~4 KiB; return the row count."""
+    buffer = []
+    buffered = 0
+    count = 0
+    
+    for count, row in enumerate(rows, 1):
+        line = f"   Row {count}: {row}\n" if numbered else f"   {row}\n"
+        buffer.append(line)
+        buffered += len(line)
+        if buffered >= flush_bytes:
+            sys.stdout.write("".join(buffer))
+            buffer.clear()
+            buffered = 0
+    
+    if buffer:
+        sys.stdout.write("".join(buffer))
+    return count
+
+
+def example_basic_querying(sstable_path):
     """Demonstrate basic SSTable querying."""
     print("🚀 Example 1: Basic SSTable Querying")
     print("=" * 50)
     
     # In real usage, you would point to an actual SSTable file:
     # sstable_path = "/path/to/cassandra/data/keyspace/table/users-big-Data.db"
-    sstable_path = create_mock_sstable()
     
     try:
         # Open SSTable file for querying
@@ -42,19 +67,17 @@ def example_basic_querying():
             
             # Execute SELECT queries directly on the SSTable!
             print("\n🔍 Executing: SELECT * FROM users LIMIT 5")
-            results = reader.query("SELECT * FROM users LIMIT 5")
-            
-            print(f"✅ Found {len(results)} rows:")
-            for i, row in enumerate(results, 1):
-                print(f"   Row {i}: {row}")
+            # iter_query streams rows instead of building the full list first
+            row_count = _print_rows(reader.iter_query("SELECT * FROM users LIMIT 5"))
+            print(f"✅ Found {row_count} rows")
             
             # Query with WHERE clause
             print("\n🔍 Executing: SELECT name, email FROM users WHERE age > 25")
-            results = reader.query("SELECT name, email FROM users WHERE age > 25")
-            
-            print(f"✅ Found {len(results)} users over 25:")
-            for row in results:
-                print(f"   {row}")
+            row_count = _print_rows(
+                reader.iter_query("SELECT name, email FROM users WHERE age > 25"),
+                numbered=False,
+            )
+            print(f"✅ Found {row_count} users over 25")
     
     except Exception as e:
         print(f"❌ Error (expected with mock data): {e}")
@@ -62,13 +85,11 @@ def example_basic_querying():
     print("\n" + "=" * 50 + "\n")
 
 
-def example_pandas_integration():
+def example_pandas_integration(sstable_path):
     """Demonstrate pandas DataFrame integration."""
     print("🐼 Example 2: Pandas DataFrame Integration")
     print("=" * 50)
     
-    sstable_path = create_mock_sstable()
-    
     try:
         with cqlite.SSTableReader(sstable_path) as reader:
             # Get results as pandas DataFrame
@@ -95,13 +116,11 @@ def example_pandas_integration():
     print("\n" + "=" * 50 + "\n")
 
 
-def example_schema_discovery():
+def example_schema_discovery(sstable_path):
     """Demonstrate schema discovery and validation."""
     print("🔍 Example 3: Schema Discovery and Validation")
     print("=" * 50)
     
-    sstable_path = create_mock_sstable()
-    
     try:
         # Discover SSTable files in directory
         directory = Path(sstable_path).parent
@@ -110,11 +129,12 @@ def example_schema_discovery():
         sstables = cqlite.discover_sstables(str(directory))
         print(f"✅ Found {len(sstables)} SSTable files:")
         
-        for sstable in sstables:
+        # Validate all SSTables in one call, with the GIL released
+        validations = cqlite.validate_sstables([sstable['path'] for sstable in sstables])
+        
+        for sstable, validation in zip(sstables, validations):
             print(f"   📄 {sstable['name']} ({sstable['size_bytes']} bytes)")
             
-            # Validate each SSTable
-            validation = cqlite.validate_sstable(sstable['path'])
             if validation['valid']:
                 print(f"      ✅ Valid SSTable")
             else:
@@ -143,13 +163,11 @@ def example_schema_discovery():
     print("\n" + "=" * 50 + "\n")
 
 
-def example_export_formats():
+def example_export_formats(sstable_path):
     """Demonstrate exporting to different formats."""
     print("📤 Example 4: Export to Multiple Formats")
     print("=" * 50)
     
-    sstable_path = create_mock_sstable()
-    
     try:
         with cqlite.SSTableReader(sstable_path) as reader:
             # Export to CSV
@@ -187,13 +205,11 @@ def example_export_formats():
     print("\n" + "=" * 50 + "\n")
 
 
-def example_query_optimization():
+def example_query_optimization(sstable_path):
     """Demonstrate query optimization features."""
     print("⚡ Example 5: Query Optimization")
     print("=" * 50)
     
-    sstable_path = create_mock_sstable()
-    
     try:
         with cqlite.SSTableReader(sstable_path) as reader:
             # Validate query before execution
@@ -230,8 +246,13 @@ def example_query_optimization():
             
             perf = benchmark_query_performance(reader, sql, iterations=3)
             print(f"   Average time: {perf['avg_time_seconds']:.3f} seconds")
+            print(f"   Min / median / p99: {perf['min_time_seconds']:.6f} / "
+                  f"{perf['median_time_seconds']:.6f} / {perf['p99_time_seconds']:.6f} seconds")
+            if perf['below_timer_resolution']:
+                print(f"   ⚠️  Query time is close to timer resolution ({perf['timer_resolution_ns']} ns)")
             print(f"   Rows per second: {perf['rows_per_second']:.0f}")
             print(f"   Results: {perf['results_count']} rows")
+            print(f"   Prepared plan reused: {perf['prepared']}")
     
     except Exception as e:
         print(f"❌ Error (expected with mock data): {e}")
@@ -239,13 +260,11 @@ def example_query_optimization():
     print("\n" + "=" * 50 + "\n")
 
 
-def example_convenience_functions():
+def example_convenience_functions(sstable_path):
     """Demonstrate convenience functions."""
     print("🛠️  Example 6: Convenience Functions")
     print("=" * 50)
     
-    sstable_path = create_mock_sstable()
-    
     try:
         # Quick one-liner queries
         print("🔍 Quick query (one-liner):")
@@ -278,13 +297,11 @@ def example_convenience_functions():
     print("\n" + "=" * 50 + "\n")
 
 
-def example_advanced_usage():
+def example_advanced_usage(sstable_path):
     """Demonstrate advanced usage patterns."""
     print("🔥 Example 7: Advanced Usage Patterns")
     print("=" * 50)
     
-    sstable_path = create_mock_sstable()
-    
     try:
         with cqlite.SSTableReader(sstable_path) as reader:
             # Enhanced query methods
@@ -342,14 +359,15 @@ def main():
         print("❌ CQLite metadata not available")
         print()
     
-    # Run examples
-    example_basic_querying()
-    example_pandas_integration()
-    example_schema_discovery()
-    example_export_formats()
-    example_query_optimization()
-    example_convenience_functions()
-    example_advanced_usage()
+    # Run examples (all share one mock SSTable)
+    sstable_path = create_mock_sstable()
+    example_basic_querying(sstable_path)
+    example_pandas_integration(sstable_path)
+    example_schema_discovery(sstable_path)
+    example_export_formats(sstable_path)
+    example_query_optimization(sstable_path)
+    example_convenience_functions(sstable_path)
+    example_advanced_usage(sstable_path)
     
     print("🎉 All examples completed!")
     print("\n💡 Next steps:")
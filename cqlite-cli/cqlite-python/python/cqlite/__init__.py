@@ -54,6 +54,10 @@ Advanced Usage:
     ```
 """
 
+import importlib.util
+import sys
+from types import MappingProxyType
+
 from ._core import (
     # Main reader class
     SSTableReader,
@@ -68,6 +72,7 @@ from ._core import (
     discover_sstables,
     infer_schema,
     validate_sstable,
+    validate_sstables,
     
     # Version info
     __version__,
@@ -76,7 +81,10 @@ from ._core import (
 
 from .reader import (
     # High-level Python API wrappers
+    QueryResult,
+    QueryRow,
     open_sstable,
+    open_cached,
     query_sstable,
     query_sstable_df,
 )
@@ -87,11 +95,14 @@ from .types import (
     PYTHON_TYPE_MAPPING,
     infer_python_type,
     convert_cql_value,
+    convert_cql_column,
+    make_row_converter,
 )
 
 from .utils import (
     # Helper utilities
     format_query_results,
+    format_query_results_stream,
     estimate_memory_usage,
     optimize_query,
     create_schema_from_cql,
@@ -101,7 +112,14 @@ from .async_support import (
     # Async support
     AsyncSSTableReader,
     AsyncBatchProcessor,
+    ReaderPool,
     stream_query_results,
+    stream_query_batches,
+    iter_rows,
+    process_multiple_sstables,
+    parallel_query_execution,
+    iter_parallel_query_results,
+    benchmark_async_performance,
 )
 
 # Version and metadata
@@ -117,6 +135,9 @@ __all__ = [
     "SSTableReader",
     "AsyncSSTableReader", 
     "AsyncBatchProcessor",
+    "ReaderPool",
+    "QueryResult",
+    "QueryRow",
     
     # Exception types
     "CQLiteError",
@@ -126,21 +147,32 @@ __all__ = [
     
     # Main functions
     "open_sstable",
+    "open_cached",
     "query_sstable",
     "query_sstable_df",
     "discover_sstables",
     "infer_schema",
     "validate_sstable",
+    "validate_sstables",
     "stream_query_results",
+    "stream_query_batches",
+    "iter_rows",
+    "process_multiple_sstables",
+    "parallel_query_execution",
+    "iter_parallel_query_results",
+    "benchmark_async_performance",
     
     # Type utilities
     "CQLType",
     "PYTHON_TYPE_MAPPING",
     "infer_python_type",
     "convert_cql_value",
+    "convert_cql_column",
+    "make_row_converter",
     
     # Helper utilities
     "format_query_results",
+    "format_query_results_stream",
     "estimate_memory_usage", 
     "optimize_query",
     "create_schema_from_cql",
@@ -153,56 +185,56 @@ __all__ = [
     "__url__",
 ]
 
-# Optional pandas integration
-try:
-    import pandas as pd
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    _PANDAS_AVAILABLE = False
+# Optional integrations are detected without importing them, so
+# `import cqlite` doesn't pay pandas/numpy/pyarrow's import time; the code
+# paths that need them import them on first use
+_OPTIONAL = MappingProxyType({
+    name: importlib.util.find_spec(name) is not None
+    for name in ("pandas", "numpy", "pyarrow")
+})
+
+# Optional modules exposed as cqlite.pd / cqlite.np / cqlite.pa
+_LAZY_MODULES = {"pd": "pandas", "np": "numpy", "pa": "pyarrow"}
+
+def __getattr__(name):
+    """Import an optional module the first time it is accessed (PEP 562)."""
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(module_name)
+    # Cache as a real attribute so later lookups skip __getattr__
+    globals()[name] = module
+    return module
+
+# Feature detection results never change within a process
+_FEATURES = MappingProxyType({
+    **_OPTIONAL,
+    "async": True,  # Always available
+    "streaming": True,  # Always available
+})
 
-# Optional numpy integration  
-try:
-    import numpy as np
-    _NUMPY_AVAILABLE = True
-except ImportError:
-    _NUMPY_AVAILABLE = False
+def _status_line(label: str, available: bool) -> str:
+    return f"   {label}: {'✅' if available else '❌'}"
 
-# Optional pyarrow integration
-try:
-    import pyarrow as pa
-    _PYARROW_AVAILABLE = True
-except ImportError:
-    _PYARROW_AVAILABLE = False
+_DEPENDENCY_REPORT = "\n".join(
+    ["🚀 CQLite Feature Status:",
+     _status_line("📊 Pandas DataFrame support", _FEATURES["pandas"]),
+     _status_line("🔢 NumPy array support", _FEATURES["numpy"]),
+     _status_line("📦 Parquet export support", _FEATURES["pyarrow"]),
+     _status_line("⚡ Async query support", _FEATURES["async"]),
+     _status_line("🌊 Streaming support", _FEATURES["streaming"])]
+    + [f"   💡 Install {name}: pip install {name}"
+       for name, available in _OPTIONAL.items() if not available]
+)
 
-# Feature detection
 def get_available_features():
     """Get list of available optional features."""
-    features = {
-        "pandas": _PANDAS_AVAILABLE,
-        "numpy": _NUMPY_AVAILABLE, 
-        "pyarrow": _PYARROW_AVAILABLE,
-        "async": True,  # Always available
-        "streaming": True,  # Always available
-    }
-    return features
+    return dict(_FEATURES)
 
 def check_dependencies():
     """Check and report on optional dependencies."""
-    features = get_available_features()
-    
-    print("🚀 CQLite Feature Status:")
-    print(f"   📊 Pandas DataFrame support: {'✅' if features['pandas'] else '❌'}")
-    print(f"   🔢 NumPy array support: {'✅' if features['numpy'] else '❌'}")
-    print(f"   📦 Parquet export support: {'✅' if features['pyarrow'] else '❌'}")
-    print(f"   ⚡ Async query support: {'✅' if features['async'] else '❌'}")
-    print(f"   🌊 Streaming support: {'✅' if features['streaming'] else '❌'}")
-    
-    if not features['pandas']:
-        print("   💡 Install pandas: pip install pandas")
-    if not features['numpy']:
-        print("   💡 Install numpy: pip install numpy")
-    if not features['pyarrow']:
-        print("   💡 Install pyarrow: pip install pyarrow")
+    print(_DEPENDENCY_REPORT)
 
 # Convenience function for quick usage
 def quick_query(sstable_path: str, sql: str, **kwargs):
@@ -242,7 +274,7 @@ def quick_query_df(sstable_path: str, sql: str, **kwargs):
         df = cqlite.quick_query_df("users-Data.db", "SELECT * FROM users")
         ```
     """
-    if not _PANDAS_AVAILABLE:
+    if not _OPTIONAL["pandas"]:
         raise ImportError("pandas is required for DataFrame output. Install with: pip install pandas")
     
     with SSTableReader(sstable_path, **kwargs) as reader:
@@ -259,12 +291,11 @@ __all__.extend([
 # Banner for interactive use
 def _show_banner():
     """Show welcome banner when imported interactively."""
-    import sys
-    if hasattr(sys, 'ps1'):  # Interactive mode
-        print("🚀 Welcome to CQLite - The World's First Python SSTable Querying Library!")
-        print("   📖 Documentation: https://docs.cqlite.dev")
-        print("   💡 Quick start: cqlite.check_dependencies()")
-        print("   🔥 Example: cqlite.quick_query('data.db', 'SELECT * FROM users LIMIT 5')")
+    print("🚀 Welcome to CQLite - The World's First Python SSTable Querying Library!")
+    print("   📖 Documentation: https://docs.cqlite.dev")
+    print("   💡 Quick start: cqlite.check_dependencies()")
+    print("   🔥 Example: cqlite.quick_query('data.db', 'SELECT * FROM users LIMIT 5')")
 
-# Show banner on import
-_show_banner()
\ No newline at end of file
+# Show banner on import, only in an interactive session
+if hasattr(sys, 'ps1'):
+    _show_banner()
@@ -6,9 +6,244 @@ async functionality implemented in Rust.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional, AsyncIterator, Union
+import csv
+import io
+import json
+import mmap
+import os
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, AsyncIterator, Union, Callable, Sequence, Tuple
 from ._core import AsyncQueryIterator, AsyncQueryExecutor, AsyncBatchProcessor
 
+# O_DIRECT requires block-aligned buffers, offsets and lengths
+_DIRECT_IO_ALIGNMENT = 4096
+_DIRECT_IO_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Query executors shared by every reader of the same SSTable, most recently
+# used last. Keyed by (path, max_concurrent, mtime) so a rewritten file gets
+# a fresh executor; evicting an entry only drops the cache's reference.
+_EXECUTOR_CACHE: "OrderedDict[Tuple[str, int, Optional[int]], AsyncQueryExecutor]" = OrderedDict()
+_EXECUTOR_CACHE_SIZE = 256
+
+
+def _shared_executor(sstable_path: str, max_concurrent: int) -> AsyncQueryExecutor:
+    """Return the process-wide executor for an SSTable, creating it on first use."""
+    try:
+        mtime = os.stat(sstable_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    key = (sstable_path, max_concurrent, mtime)
+    executor = _EXECUTOR_CACHE.get(key)
+    if executor is not None:
+        _EXECUTOR_CACHE.move_to_end(key)
+        return executor
+    
+    executor = AsyncQueryExecutor(sstable_path, max_concurrent)
+    _EXECUTOR_CACHE[key] = executor
+    if len(_EXECUTOR_CACHE) > _EXECUTOR_CACHE_SIZE:
+        _EXECUTOR_CACHE.popitem(last=False)
+    return executor
+
+
+def _hint_readahead(path: str) -> None:
+    """
+    Ask the kernel to start reading a file that a scan is about to stream.
+    
+    The core reads Data.db itself, so the map only carries the hint: the
+    readahead lands in the page cache, which outlives the map, and the map
+    and its descriptor are closed before returning.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            _advise(data, "MADV_WILLNEED")
+    except (OSError, ValueError):
+        # Missing or empty file: nothing to read ahead
+        pass
+
+
+def _advise(mapped: mmap.mmap, *names: str) -> None:
+    """Apply madvise hints to a map, skipping ones this platform lacks."""
+    if not hasattr(mapped, "madvise"):
+        return
+    for name in names:
+        advice = getattr(mmap, name, None)
+        if advice is not None:
+            try:
+                mapped.madvise(advice)
+            except OSError:
+                pass
+
+
+class _DirectFileSink:
+    """
+    Incremental O_DIRECT file writer, bypassing the page cache.
+    
+    Data is staged in a page-aligned anonymous mmap buffer and written out in
+    block-aligned pieces with O_DIRECT; the short tail left at close is
+    appended with a regular buffered write.
+    """
+    
+    def __init__(self, output_path: str, fd: int):
+        self.output_path = output_path
+        self._fd = fd
+        self._buf = mmap.mmap(-1, _DIRECT_IO_BUFFER_SIZE)
+        self._view = memoryview(self._buf)
+        self._used = 0
+        self._offset = 0
+    
+    def write(self, data: bytes) -> None:
+        data = memoryview(data)
+        while data:
+            size = min(len(data), _DIRECT_IO_BUFFER_SIZE - self._used)
+            self._view[self._used:self._used + size] = data[:size]
+            self._used += size
+            data = data[size:]
+            if self._used == _DIRECT_IO_BUFFER_SIZE:
+                self._flush_aligned()
+    
+    def _flush_aligned(self) -> None:
+        aligned = self._used - self._used % _DIRECT_IO_ALIGNMENT
+        if aligned:
+            os.write(self._fd, self._view[:aligned])
+            self._offset += aligned
+            # Keep the unaligned remainder at the start of the buffer
+            self._view[:self._used - aligned] = self._view[aligned:self._used]
+            self._used -= aligned
+    
+    def close(self) -> None:
+        try:
+            self._flush_aligned()
+            tail = bytes(self._view[:self._used])
+        finally:
+            self._view.release()
+            self._buf.close()
+            os.close(self._fd)
+        
+        if tail:
+            with open(self.output_path, "r+b") as f:
+                f.seek(self._offset)
+                f.write(tail)
+
+
+def _open_export_sink(output_path: str, direct: bool) -> Any:
+    """
+    Open an export output file, with O_DIRECT if requested and supported.
+    
+    Falls back to a regular buffered file on platforms or filesystems without
+    O_DIRECT support (e.g. tmpfs). Both sinks expose ``write`` and ``close``.
+    """
+    o_direct = getattr(os, "O_DIRECT", 0)
+    if direct and o_direct:
+        try:
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | o_direct, 0o644)
+        except OSError:
+            pass
+        else:
+            return _DirectFileSink(output_path, fd)
+    
+    return open(output_path, "wb")
+
+
+class _CsvChunkEncoder:
+    """
+    Encodes result chunks as CSV, header taken from the first row.
+    
+    The writer emits into a UTF-8 text layer over one byte buffer that
+    serves the whole export, so rows are encoded as they are written and
+    each chunk comes out as bytes with no separate str -> bytes copy. The
+    buffer is rewound after each chunk instead of being reallocated.
+    """
+    
+    def __init__(self):
+        self._buffer = None
+        self._text = None
+        self._writer = None
+    
+    def encode(self, chunk: List[Dict[str, Any]]) -> bytes:
+        if self._writer is None:
+            self._buffer = io.BytesIO()
+            self._text = io.TextIOWrapper(self._buffer, encoding="utf-8", newline="")
+            self._writer = csv.DictWriter(self._text, fieldnames=list(chunk[0].keys()))
+            self._writer.writeheader()
+        
+        self._writer.writerows(chunk)
+        self._text.flush()
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        return data
+    
+    def finish(self) -> bytes:
+        return b""
+
+
+class _JsonChunkEncoder:
+    """Encodes result chunks as one indented JSON array, same layout as json.dumps(rows, indent=2)."""
+    
+    def __init__(self):
+        self._started = False
+    
+    def encode(self, chunk: List[Dict[str, Any]]) -> bytes:
+        parts = []
+        for row in chunk:
+            item = json.dumps(row, indent=2, default=str).replace("\n", "\n  ")
+            parts.append(("[\n  " if not self._started else ",\n  ") + item)
+            self._started = True
+        return "".join(parts).encode('utf-8')
+    
+    def finish(self) -> bytes:
+        return b"\n]" if self._started else b"[]"
+
+
+class _HotQueryTracker:
+    """
+    Counts executions per statement and prepares hot ones in the background.
+    
+    Once a statement has been seen ``min_count`` times its plan is cached on
+    the executor, but only when the event loop is idle: the preparation
+    callback measures its own scheduling lag and backs off while the loop is
+    busy, so planning never adds latency to queries already in flight. The
+    executor keeps a bounded, least-recently-used set of plans, so a long
+    tail of one-off hot statements can't grow it for the process lifetime.
+    """
+    
+    def __init__(self, executor: Any, min_count: int = 3, max_entries: int = 1024,
+                 idle_threshold: float = 0.005):
+        self.executor = executor
+        self.min_count = min_count
+        self.max_entries = max_entries
+        self.idle_threshold = idle_threshold
+        self._hits: "OrderedDict[str, int]" = OrderedDict()
+    
+    def record(self, sql: str) -> None:
+        """Count one execution of a statement, scheduling preparation when it turns hot."""
+        key = sql.strip()
+        hits = self._hits.pop(key, 0) + 1
+        self._hits[key] = hits
+        if len(self._hits) > self.max_entries:
+            self._hits.popitem(last=False)
+        
+        if hits == self.min_count:
+            loop = asyncio.get_running_loop()
+            loop.call_soon(self._prepare_when_idle, loop, key, loop.time())
+    
+    def _prepare_when_idle(self, loop: asyncio.AbstractEventLoop, sql: str, queued_at: float) -> None:
+        # A callback that waited longer than the threshold means the loop is busy
+        if loop.time() - queued_at > self.idle_threshold:
+            loop.call_later(self.idle_threshold, self._requeue, loop, sql)
+            return
+        
+        try:
+            self.executor.prepare(sql)
+        except Exception:
+            # The statement will simply keep being planned per execution
+            pass
+    
+    def _requeue(self, loop: asyncio.AbstractEventLoop, sql: str) -> None:
+        loop.call_soon(self._prepare_when_idle, loop, sql, loop.time())
+
 
 class AsyncSSTableReader:
     """
@@ -23,7 +258,8 @@ class AsyncSSTableReader:
         sstable_path: str,
         schema: Optional[Union[str, Dict[str, Any]]] = None,
         max_concurrent: int = 4,
-        chunk_size: int = 1000,
+        chunk_size: int = 4096,
+        use_mmap: bool = True,
     ):
         """
         Create async SSTable reader.
@@ -32,15 +268,19 @@ class AsyncSSTableReader:
             sstable_path: Path to SSTable Data.db file
             schema: Optional schema file path or dictionary
             max_concurrent: Maximum concurrent operations
-            chunk_size: Default chunk size for streaming
+            chunk_size: Default chunk size for streaming (rows per await)
+            use_mmap: Briefly map Data.db before streaming scans to ask the
+                kernel to read it ahead of the scan
         """
         self.sstable_path = sstable_path
         self.schema = schema
         self.max_concurrent = max_concurrent
         self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
         
-        # Initialize executor
-        self.executor = AsyncQueryExecutor(sstable_path, max_concurrent)
+        # Share one executor (open file, plan cache) with other readers of this SSTable
+        self.executor = _shared_executor(sstable_path, max_concurrent)
+        self._hot_queries = _HotQueryTracker(self.executor)
     
     async def query(self, sql: str, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """
@@ -48,16 +288,70 @@ class AsyncSSTableReader:
         
         Args:
             sql: SELECT statement to execute
-            timeout: Query timeout in seconds
+            timeout: Query timeout in seconds (no timeout if None)
             
         Returns:
             Query results
+            
+        Raises:
+            asyncio.TimeoutError: If the query exceeds ``timeout``
         """
+        self._hot_queries.record(sql)
+        
+        # The deadline lives on the asyncio side, so outer cancellation and
+        # timeouts compose; no timer is armed when no timeout is given
         if timeout:
-            return await self.executor.execute_with_timeout(sql, timeout)
-        else:
-            # Use executor directly for simple query
-            return await self.executor.execute_with_timeout(sql, 300.0)  # Default 5 min timeout
+            return await asyncio.wait_for(self.executor.execute(sql), timeout)
+        return await self.executor.execute(sql)
+    
+    async def query_arrow(self, sql: str) -> Any:
+        """
+        Execute async query and return a pyarrow Table.
+        
+        The result comes back from the core column-wise and each column
+        becomes one Arrow array, so no per-row dicts are built.
+        
+        Args:
+            sql: SELECT statement to execute
+            
+        Returns:
+            pyarrow.Table with query results
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for query_arrow(). Install with: pip install pyarrow")
+        
+        self._hot_queries.record(sql)
+        return pa.table(await self.executor.execute_columns(sql))
+    
+    async def query_df(self, sql: str) -> Any:
+        """
+        Execute async query and return a pandas DataFrame.
+        
+        Built from ``query_arrow`` rather than from row dicts.
+        
+        Args:
+            sql: SELECT statement to execute
+            
+        Returns:
+            pandas.DataFrame with query results
+        """
+        table = await self.query_arrow(sql)
+        return table.to_pandas()
+    
+    def _iterator(
+        self,
+        sql: str,
+        chunk_size: Optional[int] = None,
+        columnar: bool = False,
+    ) -> AsyncQueryIterator:
+        """Create a chunk iterator for a full scan, hinting readahead first."""
+        if self.use_mmap:
+            _hint_readahead(self.sstable_path)
+        
+        chunk_size = chunk_size or self.chunk_size
+        return AsyncQueryIterator(self.sstable_path, sql, chunk_size, columnar=columnar)
     
     async def query_streaming(
         self, 
@@ -67,6 +361,9 @@ class AsyncSSTableReader:
         """
         Execute query with streaming results.
         
+        Rows are fetched from the core a whole chunk per await; only the
+        per-row hand-off to the caller happens in Python.
+        
         Args:
             sql: SELECT statement to execute
             chunk_size: Number of rows per chunk
@@ -74,11 +371,9 @@ class AsyncSSTableReader:
         Yields:
             Individual result rows
         """
-        chunk_size = chunk_size or self.chunk_size
-        iterator = AsyncQueryIterator(self.sstable_path, sql, chunk_size)
-        
-        async for row in iterator:
-            yield row
+        async for chunk in self._iterator(sql, chunk_size):
+            for row in chunk:
+                yield row
     
     async def query_chunks(
         self, 
@@ -95,19 +390,147 @@ class AsyncSSTableReader:
         Yields:
             Chunks of result rows
         """
-        chunk_size = chunk_size or self.chunk_size
-        iterator = AsyncQueryIterator(self.sstable_path, sql, chunk_size)
+        async for chunk in self._iterator(sql, chunk_size):
+            yield chunk
+    
+    async def _column_chunks(
+        self,
+        sql: str,
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, List[Any]]]:
+        """Yield chunks in columnar form: column name -> list of values."""
+        async for columns in self._iterator(sql, chunk_size, columnar=True):
+            yield columns
+    
+    async def query_column_chunks(
+        self,
+        sql: str,
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Execute query and yield chunks as columnar Arrow record batches.
         
-        chunk = []
-        async for row in iterator:
-            chunk.append(row)
-            if len(chunk) >= chunk_size:
-                yield chunk
-                chunk = []
+        Chunks arrive from the core as one list per column rather than one
+        dict per row, so no per-row dicts are ever built. Use
+        ``batch.column(name)`` for column access, ``batch.num_rows`` for the
+        row count and ``batch.to_pandas()`` for a DataFrame.
         
-        # Yield final partial chunk
-        if chunk:
-            yield chunk
+        Args:
+            sql: SELECT statement to execute
+            chunk_size: Number of rows per chunk
+            
+        Yields:
+            pyarrow.RecordBatch per chunk
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for query_column_chunks(). Install with: pip install pyarrow")
+        
+        async for columns in self._column_chunks(sql, chunk_size):
+            yield pa.RecordBatch.from_pydict(columns)
+    
+    async def reduce(
+        self,
+        sql: str,
+        reducer: Callable[..., Any],
+        initial: Any,
+        columns: Sequence[str],
+        chunk_size: Optional[int] = None,
+    ) -> Any:
+        """
+        Fold a reducer over query results one chunk at a time.
+        
+        The reducer is called as ``reducer(acc, *arrays)`` with one NumPy
+        array per requested column and returns the new accumulator. Since it
+        sees whole columns rather than single rows, the inner loop can be a
+        vectorized NumPy expression or a Numba ``@njit`` function instead of
+        interpreted Python.
+        
+        Args:
+            sql: SELECT statement to execute
+            reducer: Function (acc, *column_arrays) -> acc
+            initial: Initial accumulator value
+            columns: Columns to pass to the reducer, in order
+            chunk_size: Number of rows per chunk
+            
+        Returns:
+            Final accumulator value
+            
+        Raises:
+            KeyError: If a requested column is not in the query result
+            
+        Example:
+            ```python
+            total = await reader.reduce(
+                "SELECT revenue FROM events",
+                lambda acc, revenue: acc + revenue.sum(),
+                0.0,
+                columns=["revenue"],
+            )
+            ```
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for reduce(). Install with: pip install numpy")
+        
+        acc = initial
+        async for chunk in self._column_chunks(sql, chunk_size):
+            missing = [col for col in columns if col not in chunk]
+            if missing:
+                raise KeyError(f"Columns not in the query result: {', '.join(missing)}")
+            acc = reducer(acc, *[np.asarray(chunk[col]) for col in columns])
+        return acc
+    
+    async def distinct_column(
+        self,
+        sql: str,
+        column: str,
+        chunk_size: Optional[int] = None,
+    ) -> Any:
+        """
+        Compute the distinct values of one column as a pyarrow array.
+        
+        Each chunk is deduplicated with Arrow's native hash kernel and the
+        per-chunk results are merged the same way, so no per-row Python set
+        or dict operations are involved in the deduplication.
+        
+        Args:
+            sql: SELECT statement producing the column
+            column: Column to deduplicate
+            chunk_size: Number of rows per chunk
+            
+        Returns:
+            pyarrow.Array of distinct values (null-typed if there are no rows)
+            
+        Raises:
+            KeyError: If the query result has no such column
+            
+        Example:
+            ```python
+            users = await reader.distinct_column("SELECT user_id FROM events", "user_id")
+            print(len(users))
+            ```
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for distinct_column(). Install with: pip install pyarrow")
+        
+        uniques = []
+        async for chunk in self._column_chunks(sql, chunk_size):
+            if column not in chunk:
+                raise KeyError(f"Column '{column}' is not in the query result")
+            uniques.append(pa.array(chunk[column]).unique())
+        
+        # Chunks of only NULLs infer the null type; cast them to the type of
+        # the other chunks so they concatenate. No rows at all gives an empty
+        # null-typed array.
+        value_type = next((u.type for u in uniques if u.type != pa.null()), pa.null())
+        if not uniques:
+            return pa.array([], type=value_type)
+        return pa.concat_arrays([u.cast(value_type) for u in uniques]).unique()
     
     async def query_with_progress(
         self, 
@@ -117,16 +540,29 @@ class AsyncSSTableReader:
         """
         Execute query with progress reporting.
         
+        Progress is reported in batches (every 64K rows or 50 ms, whichever
+        comes first), not per row. Without a callback the query runs
+        without progress tracking at all; pass e.g.
+        ``lambda p, m: print(f"{p:.0%} {m}")`` to print progress.
+        
         Args:
             sql: SELECT statement to execute
-            progress_callback: Function called with (progress, message)
+            progress_callback: Function or coroutine function called with
+                (progress, message)
             
         Returns:
             Query results
         """
         if progress_callback is None:
-            # Default progress callback
-            progress_callback = lambda p, m: print(f"Progress: {p:.1%} - {m}")
+            return await self.executor.execute(sql)
+        
+        if asyncio.iscoroutinefunction(progress_callback):
+            # The core calls back from a worker thread; hand coroutines to the loop
+            async_callback = progress_callback
+            loop = asyncio.get_running_loop()
+            progress_callback = lambda p, m: asyncio.run_coroutine_threadsafe(
+                async_callback(p, m), loop
+            )
         
         return await self.executor.execute_with_progress(sql, progress_callback)
     
@@ -134,37 +570,29 @@ class AsyncSSTableReader:
         """
         Get count of rows matching query.
         
+        Matches are counted in the core without building any result rows.
+        
         Args:
-            sql: SELECT statement (will be converted to COUNT)
+            sql: SELECT statement whose matching rows are counted
             
         Returns:
             Number of matching rows
         """
-        # Convert to COUNT query
-        if sql.strip().upper().startswith("SELECT"):
-            parts = sql.split(" FROM ", 1)
-            if len(parts) == 2:
-                count_sql = f"SELECT COUNT(*) FROM {parts[1]}"
-                results = await self.query(count_sql)
-                if results and 'count' in results[0]:
-                    return results[0]['count']
-        
-        # Fallback: count results
-        results = await self.query(sql)
-        return len(results)
+        return await self.executor.count_only(sql)
     
     async def exists(self, sql: str) -> bool:
         """
         Check if query returns any results.
         
+        The scan in the core stops at the first matching row.
+        
         Args:
             sql: SELECT statement to check
             
         Returns:
             True if query returns at least one row
         """
-        results = await self.query(f"{sql} LIMIT 1")
-        return len(results) > 0
+        return await self.executor.any_match(sql)
     
     async def sample(self, n: int = 10) -> List[Dict[str, Any]]:
         """
@@ -182,7 +610,8 @@ class AsyncSSTableReader:
         self, 
         sql: str, 
         output_path: str, 
-        format: str = "csv"
+        format: str = "csv",
+        direct: bool = False,
     ) -> Dict[str, Any]:
         """
         Export query results asynchronously.
@@ -191,66 +620,75 @@ class AsyncSSTableReader:
             sql: SELECT statement to execute
             output_path: Output file path
             format: Export format ("csv", "json", "parquet")
+            direct: Write with O_DIRECT so the export does not pass through
+                the page cache (falls back to buffered writes where unsupported)
             
         Returns:
             Export statistics
         """
-        # This would use async file operations
-        # For now, delegate to sync operations
-        import aiofiles
-        
-        results = await self.query(sql)
-        
         if format == "csv":
-            return await self._export_csv_async(results, output_path)
+            encoder = _CsvChunkEncoder()
         elif format == "json":
-            return await self._export_json_async(results, output_path)
+            encoder = _JsonChunkEncoder()
         else:
             raise ValueError(f"Unsupported async export format: {format}")
-    
-    async def _export_csv_async(self, results: List[Dict[str, Any]], output_path: str) -> Dict[str, Any]:
-        """Export results to CSV asynchronously."""
-        import aiofiles
-        import csv
-        import io
-        
-        if not results:
-            return {"rows_written": 0, "file_size_bytes": 0}
         
-        # Build CSV content in memory
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=results[0].keys())
-        writer.writeheader()
-        writer.writerows(results)
-        
-        csv_content = output.getvalue()
+        return await self._export_pipelined(sql, output_path, format, encoder, direct)
+    
+    async def _export_pipelined(
+        self, sql: str, output_path: str, format: str, encoder: Any, direct: bool
+    ) -> Dict[str, Any]:
+        """
+        Export with the scan and the encode+write stages running concurrently.
         
-        # Write to file asynchronously
-        async with aiofiles.open(output_path, 'w') as f:
-            await f.write(csv_content)
+        A producer coroutine pulls chunks from the core into a small bounded
+        queue while the consumer encodes and writes the previous chunk in a
+        worker thread, so total time approaches max(scan, encode+write)
+        rather than their sum.
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Optional[List[Dict[str, Any]]]]" = asyncio.Queue(maxsize=4)
         
-        return {
-            "format": "csv",
-            "output_path": output_path,
-            "rows_written": len(results),
-            "file_size_bytes": len(csv_content.encode('utf-8')),
-        }
-    
-    async def _export_json_async(self, results: List[Dict[str, Any]], output_path: str) -> Dict[str, Any]:
-        """Export results to JSON asynchronously."""
-        import aiofiles
-        import json
+        async def produce() -> None:
+            try:
+                async for chunk in self.query_chunks(sql):
+                    await queue.put(chunk)
+            finally:
+                await queue.put(None)
         
-        json_content = json.dumps(results, indent=2, default=str)
+        def encode_and_write(chunk: List[Dict[str, Any]]) -> int:
+            data = encoder.encode(chunk)
+            sink.write(data)
+            return len(data)
         
-        async with aiofiles.open(output_path, 'w') as f:
-            await f.write(json_content)
+        sink = await loop.run_in_executor(None, _open_export_sink, output_path, direct)
+        producer = asyncio.ensure_future(produce())
+        rows_written = 0
+        bytes_written = 0
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                bytes_written += await loop.run_in_executor(None, encode_and_write, chunk)
+                rows_written += len(chunk)
+            
+            tail = encoder.finish()
+            if tail:
+                await loop.run_in_executor(None, sink.write, tail)
+                bytes_written += len(tail)
+            
+            # Surface scan errors
+            await producer
+        finally:
+            producer.cancel()
+            await loop.run_in_executor(None, sink.close)
         
         return {
-            "format": "json",
+            "format": format,
             "output_path": output_path,
-            "rows_written": len(results),
-            "file_size_bytes": len(json_content.encode('utf-8')),
+            "rows_written": rows_written,
+            "file_size_bytes": bytes_written,
         }
     
     async def __aenter__(self):
@@ -263,10 +701,104 @@ class AsyncSSTableReader:
         pass
 
 
+class ReaderPool:
+    """
+    LRU pool of open AsyncSSTableReader instances, keyed by SSTable path.
+    
+    Opening a reader parses the SSTable header, metadata and bloom filter.
+    The pool pays that cost once per path and hands the same reader back on
+    every later request, which keeps open/close out of hot query loops.
+    
+    Example:
+        ```python
+        pool = cqlite.ReaderPool()
+        
+        for sql in queries:
+            async with pool.get(sstable_path) as reader:
+                await reader.query(sql)
+        ```
+    """
+    
+    def __init__(self, max_size: int = 256, **reader_options: Any):
+        """
+        Create a reader pool.
+        
+        Args:
+            max_size: Maximum number of readers kept open
+            **reader_options: Options passed to AsyncSSTableReader for new readers
+        """
+        self.max_size = max_size
+        self.reader_options = reader_options
+        self._readers: "OrderedDict[str, AsyncSSTableReader]" = OrderedDict()
+    
+    def acquire(self, sstable_path: str) -> AsyncSSTableReader:
+        """
+        Get the pooled reader for a path, opening it on first use.
+        
+        Args:
+            sstable_path: Path to SSTable Data.db file
+            
+        Returns:
+            Open AsyncSSTableReader shared by all users of this pool
+        """
+        reader = self._readers.get(sstable_path)
+        if reader is not None:
+            self._readers.move_to_end(sstable_path)
+            return reader
+        
+        reader = AsyncSSTableReader(sstable_path, **self.reader_options)
+        reader.executor.open()
+        
+        self._readers[sstable_path] = reader
+        if len(self._readers) > self.max_size:
+            self._readers.popitem(last=False)
+        return reader
+    
+    def get(self, sstable_path: str) -> "_PooledReader":
+        """
+        Borrow a reader as an async context manager.
+        
+        Leaving the ``async with`` block returns the reader to the pool
+        instead of closing it.
+        
+        Args:
+            sstable_path: Path to SSTable Data.db file
+            
+        Returns:
+            Async context manager yielding the pooled reader
+        """
+        return _PooledReader(self, sstable_path)
+    
+    def clear(self) -> None:
+        """Drop all pooled readers."""
+        self._readers.clear()
+    
+    def __len__(self) -> int:
+        return len(self._readers)
+    
+    def __contains__(self, sstable_path: str) -> bool:
+        return sstable_path in self._readers
+
+
+class _PooledReader:
+    """Async context manager that borrows a reader from a ReaderPool."""
+    
+    def __init__(self, pool: ReaderPool, sstable_path: str):
+        self._pool = pool
+        self._sstable_path = sstable_path
+    
+    async def __aenter__(self) -> AsyncSSTableReader:
+        return self._pool.acquire(self._sstable_path)
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Reader stays open in the pool
+        pass
+
+
 async def stream_query_results(
     sstable_path: str,
     sql: str,
-    chunk_size: int = 1000,
+    chunk_size: int = 4096,
     max_memory_mb: int = 100
 ) -> AsyncIterator[Dict[str, Any]]:
     """
@@ -286,37 +818,89 @@ async def stream_query_results(
             yield row
 
 
+async def stream_query_batches(
+    sstable_path: str,
+    sql: str,
+    chunk_size: int = 4096,
+) -> AsyncIterator[Any]:
+    """
+    Stream query results as Arrow record batches.
+    
+    Chunks are fetched from the core in columnar form and wrapped as
+    ``pyarrow.RecordBatch`` objects, so consumers pay per-batch rather than
+    per-row Python overhead (e.g. ``processed += batch.num_rows``).
+    
+    Args:
+        sstable_path: Path to SSTable file
+        sql: SELECT statement to execute
+        chunk_size: Number of rows per batch
+        
+    Yields:
+        pyarrow.RecordBatch for each chunk of results
+    """
+    async with AsyncSSTableReader(sstable_path, chunk_size=chunk_size) as reader:
+        async for batch in reader.query_column_chunks(sql, chunk_size):
+            yield batch
+
+
+async def iter_rows(batches: AsyncIterator[Any]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Flatten a stream of record batches back into row dictionaries.
+    
+    Compatibility helper for code that needs per-row dicts. This re-creates
+    a Python object per row, so prefer working on the batches directly.
+    
+    Args:
+        batches: Async iterator of pyarrow.RecordBatch (see stream_query_batches)
+        
+    Yields:
+        Individual result rows
+    """
+    async for batch in batches:
+        for row in batch.to_pylist():
+            yield row
+
+
 async def process_multiple_sstables(
     sstable_paths: List[str],
     sql: str,
     max_concurrent: int = 4,
-    aggregate: bool = False
-) -> Union[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    aggregate: bool = False,
+    as_arrow: bool = False,
+) -> Union[List[List[Dict[str, Any]]], List[Dict[str, Any]], Any]:
     """
     Process the same query across multiple SSTable files.
     
     Args:
         sstable_paths: List of SSTable file paths
         sql: SELECT statement to execute on each
-        max_concurrent: Maximum concurrent operations
+        max_concurrent: Maximum number of files scanned at once on the native pool
         aggregate: Whether to aggregate results or return separately
+        as_arrow: With ``aggregate=True``, return one pyarrow.Table with a
+            record batch per file instead of a list of row dicts
         
     Returns:
         Results from each SSTable (or aggregated if aggregate=True)
     """
+    # One native call scans all files on the blocking pool, outside the GIL
     processor = AsyncBatchProcessor(sstable_paths, max_concurrent)
     
+    if aggregate and as_arrow:
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for as_arrow=True. Install with: pip install pyarrow")
+        
+        # Each file's batch becomes one chunk of the table; nothing is concatenated
+        per_file = await processor.process_all_columns(sql)
+        if not per_file:
+            return pa.table({})
+        return pa.Table.from_batches([pa.RecordBatch.from_pydict(columns) for columns in per_file])
+    
     if aggregate:
         return await processor.process_all(sql)
     else:
-        # Process each file separately
-        tasks = []
-        for path in sstable_paths:
-            async with AsyncSSTableReader(path, max_concurrent=1) as reader:
-                task = asyncio.create_task(reader.query(sql))
-                tasks.append(task)
-        
-        return await asyncio.gather(*tasks)
+        return await processor.process_each(sql)
 
 
 async def parallel_query_execution(
@@ -335,10 +919,48 @@ async def parallel_query_execution(
     Returns:
         Results for each query
     """
-    executor = AsyncQueryExecutor(sstable_path, max_concurrent)
+    executor = _shared_executor(sstable_path, max_concurrent)
     return await executor.execute_concurrent(queries)
 
 
+async def iter_parallel_query_results(
+    sstable_path: str,
+    queries: List[str],
+    max_concurrent: int = 4
+) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Execute multiple queries in parallel, yielding each result as it completes.
+    
+    Unlike parallel_query_execution, which returns once the slowest query
+    finishes, results are handed to the caller in completion order, so
+    result handling overlaps with the queries still running. At most
+    ``max_concurrent`` queries run at once; all share one open reader.
+    
+    Args:
+        sstable_path: Path to SSTable file
+        queries: List of SELECT statements
+        max_concurrent: Maximum concurrent queries
+        
+    Yields:
+        (index, results) tuples, where index is the query's position in ``queries``
+    """
+    reader = AsyncSSTableReader(sstable_path, max_concurrent=max_concurrent)
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def run(index: int, sql: str) -> Tuple[int, List[Dict[str, Any]]]:
+        async with semaphore:
+            return index, await reader.query(sql)
+    
+    tasks = [asyncio.ensure_future(run(i, sql)) for i, sql in enumerate(queries)]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        # Consumer stopped early (or failed): don't leave queries running
+        for task in tasks:
+            task.cancel()
+
+
 async def benchmark_async_performance(
     sstable_path: str,
     sql: str,
@@ -357,14 +979,15 @@ async def benchmark_async_performance(
     Returns:
         Performance metrics
     """
-    import time
+    # Open once so iterations time the query, not reader setup
+    reader = AsyncSSTableReader(sstable_path)
+    reader.executor.open()
     
     async def single_query():
-        async with AsyncSSTableReader(sstable_path) as reader:
-            start_time = time.time()
-            results = await reader.query(sql)
-            end_time = time.time()
-            return end_time - start_time, len(results)
+        start_time = time.perf_counter()
+        results = await reader.query(sql)
+        end_time = time.perf_counter()
+        return end_time - start_time, len(results)
     
     if concurrent:
         # Run all iterations concurrently
@@ -6,16 +6,36 @@ making it even easier to work with SSTable files from Python.
 """
 
 import os
+import re
+import csv
 import json
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections.abc import Mapping
 from typing import List, Dict, Any, Optional, Union, Iterator, AsyncIterator
 from pathlib import Path
 
 from ._core import SSTableReader as _CoreSSTableReader
 from ._core import discover_sstables, infer_schema, validate_sstable
-from .types import CQLType, convert_cql_value
+from .types import CQLType, convert_cql_value, convert_cql_column, make_row_converter
 from .utils import format_query_results, estimate_memory_usage
 
 
+# validate_query checks, matched against the original string (no upper-casing)
+_SELECT_STATEMENT = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_MUTATING_KEYWORD = re.compile(
+    r"\b(?:DELETE|INSERT|UPDATE|DROP|ALTER|TRUNCATE|MERGE)\b",
+    re.IGNORECASE,
+)
+
+# Statements built by the convenience methods, kept prepared per reader
+_STATEMENT_CACHE_SIZE = 64
+
+# Rows per batch pulled from the scan by export_all_formats
+_EXPORT_BATCH_ROWS = 65536
+
+
 class SSTableReader(_CoreSSTableReader):
     """
     Enhanced SSTable reader with additional Python convenience methods.
@@ -24,6 +44,34 @@ class SSTableReader(_CoreSSTableReader):
     features and more intuitive APIs for Python developers.
     """
     
+    def __new__(
+        cls,
+        sstable_path: str,
+        schema: Optional[Union[str, Dict[str, Any]]] = None,
+        cache_enabled: bool = True,
+        max_memory_mb: int = 1024,
+        auto_detect_schema: bool = True,
+        prefetch: bool = False,
+        readahead_mb: int = 0,
+    ):
+        # The core reader is built here, not in __init__, and only accepts
+        # its own arguments; the Python-only ones are handled around it.
+        # Start readahead first so it overlaps opening the SSTable
+        if readahead_mb > 0:
+            _advise_readahead(sstable_path, readahead_mb << 20)
+        
+        # Auto-detect schema if not provided and requested
+        if schema is None and auto_detect_schema:
+            try:
+                schema = infer_schema(sstable_path)
+            except Exception:
+                # Continue without schema if detection fails
+                pass
+        
+        # Schema dicts are passed as-is: the core keeps the object and
+        # returns it from get_schema(), so no JSON round trip
+        return super().__new__(cls, sstable_path, schema, cache_enabled, max_memory_mb, prefetch)
+    
     def __init__(
         self,
         sstable_path: str,
@@ -31,6 +79,8 @@ class SSTableReader(_CoreSSTableReader):
         cache_enabled: bool = True,
         max_memory_mb: int = 1024,
         auto_detect_schema: bool = True,
+        prefetch: bool = False,
+        readahead_mb: int = 0,
     ):
         """
         Create a new SSTableReader with enhanced Python features.
@@ -41,26 +91,26 @@ class SSTableReader(_CoreSSTableReader):
             cache_enabled: Enable query result caching
             max_memory_mb: Maximum memory usage in MB
             auto_detect_schema: Automatically detect schema if not provided
+            prefetch: Read the SSTable's metadata components into the OS
+                page cache at open, concurrently, start kernel readahead of
+                Data.db, and read ahead one batch in the background during
+                sequential iter_query/iter_batches scans
+            readahead_mb: Start asynchronous kernel readahead of the first
+                ``readahead_mb`` MB of Data.db before the SSTable is opened,
+                ahead of the first query (0 disables; no-op where
+                posix_fadvise is unavailable)
         """
-        # Auto-detect schema if not provided and requested
-        if schema is None and auto_detect_schema:
-            try:
-                schema = infer_schema(sstable_path)
-            except Exception:
-                # Continue without schema if detection fails
-                pass
-        
-        # Convert schema dict to JSON string if needed
-        if isinstance(schema, dict):
-            schema = json.dumps(schema)
-        
-        # Initialize core reader
-        super().__init__(sstable_path, schema, cache_enabled, max_memory_mb)
-        
+        # The core reader was already constructed by __new__
         # Python-specific attributes
         self._sstable_path = sstable_path
         self._schema_cache = None
         self._stats_cache = None
+        self._table_name = None
+        self._column_index = None
+        self._column_types = None
+        self._row_converter = None
+        self._select_all_sql = None
+        self._statements = OrderedDict()
     
     @property
     def sstable_path(self) -> str:
@@ -69,8 +119,10 @@ class SSTableReader(_CoreSSTableReader):
     
     @property
     def table_name(self) -> str:
-        """Get the table name extracted from SSTable filename."""
-        return self.get_table_name()
+        """Get the table name extracted from SSTable filename (cached)."""
+        if self._table_name is None:
+            self._table_name = self.get_table_name()
+        return self._table_name
     
     @property
     def schema(self) -> Dict[str, Any]:
@@ -86,6 +138,125 @@ class SSTableReader(_CoreSSTableReader):
             self._stats_cache = self.get_stats()
         return self._stats_cache
     
+    @property
+    def row_converter(self):
+        """
+        Converter from raw values in schema column order to a typed row dict.
+        
+        Generated once per reader from the schema (see ``make_row_converter``),
+        so converting a row costs one direct converter call per column.
+        """
+        if self._row_converter is None:
+            self._row_converter = make_row_converter(
+                [(name, column.get("cql_type", "text")) for name, column in self._columns_by_name().items()]
+            )
+        return self._row_converter
+    
+    def query_result(self, sql: str, limit: int = None, offset: int = None) -> "QueryResult":
+        """
+        Execute a query and return a column-oriented result.
+        
+        Args:
+            sql: SELECT statement to execute
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+            
+        Returns:
+            QueryResult supporting ``result["age"]`` (column) and ``result[i]`` (row)
+        """
+        columns = self.query_columnar(sql, limit=limit, offset=offset)
+        column_types = self._column_type_map()
+        types = {name: column_types[name] for name in columns if column_types.get(name)}
+        return QueryResult(columns, types)
+    
+    def query_arrow(self, sql: str, limit: int = None, offset: int = None):
+        """
+        Execute a query and return a pyarrow Table.
+        
+        The table is built from the column-wise result, one Arrow array per
+        column, without going through row dicts or pandas.
+        
+        Args:
+            sql: SELECT statement to execute
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+            
+        Returns:
+            pyarrow.Table with query results
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for Arrow output. Install with: pip install pyarrow")
+        
+        return pa.table(self.query_columnar(sql, limit=limit, offset=offset))
+    
+    def query_df(
+        self,
+        sql: str,
+        auto_downcast: bool = False,
+        categoricals: Optional[List[str]] = None,
+        use_arrow: bool = False,
+    ):
+        """
+        Execute a query and return a pandas DataFrame.
+        
+        By default the frame is built by the core from the column-wise
+        result. With ``use_arrow=True`` the result goes through a pyarrow
+        Table instead and is converted with ``to_pandas(split_blocks=True,
+        self_destruct=True)``: columns are typed once in Arrow's C++ code and
+        the Arrow buffers are released as pandas takes each column over.
+        
+        Args:
+            sql: SELECT statement to execute
+            auto_downcast: Build numeric columns with the narrowest dtype that
+                holds their values (core path only)
+            categoricals: Text columns to return as pandas Categorical
+            use_arrow: Convert through a pyarrow Table
+            
+        Returns:
+            pandas.DataFrame with query results
+        """
+        if not use_arrow:
+            return super().query_df(sql, auto_downcast, categoricals)
+        
+        if auto_downcast:
+            raise ValueError("auto_downcast is not supported with use_arrow=True")
+        
+        table = self.query_arrow(sql)
+        for name in categoricals or ():
+            if name in table.column_names:
+                index = table.column_names.index(name)
+                table = table.set_column(index, name, table.column(index).dictionary_encode())
+        
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    def query_batches(self, sql: str, batch_size: int = 10000):
+        """
+        Execute a query and stream the results as pyarrow RecordBatches.
+        
+        The statement is scanned once, each batch resuming where the previous
+        one stopped, so there is no LIMIT/OFFSET re-scan per chunk. Converting
+        a batch with ``batch.to_pandas(self_destruct=True)`` releases its Arrow
+        buffers as soon as the DataFrame is built.
+        
+        Args:
+            sql: SELECT statement to execute
+            batch_size: Maximum number of rows per batch
+            
+        Returns:
+            Iterator over pyarrow.RecordBatch
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for Arrow output. Install with: pip install pyarrow")
+        
+        return (
+            pa.RecordBatch.from_pydict(columns)
+            for columns in self.iter_batches(sql, batch_size=batch_size)
+        )
+    
     def query_one(self, sql: str) -> Optional[Dict[str, Any]]:
         """
         Execute a query and return only the first result.
@@ -103,25 +274,18 @@ class SSTableReader(_CoreSSTableReader):
         """
         Execute a query and return the count of results.
         
+        Any SELECT form is accepted (``*``, a column list or ``COUNT(*)``,
+        with WHERE/LIMIT/OFFSET); the count is always computed by the core,
+        never by materializing rows.
+        
         Args:
             sql: SELECT statement to execute (COUNT will be applied)
             
         Returns:
             Number of rows that match the query
         """
-        # Convert SELECT to COUNT query
-        if sql.strip().upper().startswith("SELECT"):
-            # Basic transformation: SELECT * FROM table -> SELECT COUNT(*) FROM table
-            parts = sql.split(" FROM ", 1)
-            if len(parts) == 2:
-                count_sql = f"SELECT COUNT(*) FROM {parts[1]}"
-                result = self.query_one(count_sql)
-                if result and 'count' in result:
-                    return result['count']
-        
-        # Fallback: execute original query and count results
-        results = self.query(sql)
-        return len(results)
+        # Count matches in the scan without materializing rows
+        return self.count_matching(sql)
     
     def query_exists(self, sql: str) -> bool:
         """
@@ -133,8 +297,8 @@ class SSTableReader(_CoreSSTableReader):
         Returns:
             True if query returns at least one row
         """
-        results = self.query(sql, limit=1)
-        return len(results) > 0
+        # The core stops the scan at the first match
+        return self.exists(sql)
     
     def query_columns(self, *columns: str, where: str = None, limit: int = None) -> List[Dict[str, Any]]:
         """
@@ -160,20 +324,10 @@ class SSTableReader(_CoreSSTableReader):
             results = reader.query_columns("*", where="city = 'NYC'", limit=100)
             ```
         """
-        # Build SELECT statement
-        if not columns:
-            columns = ("*",)
-        
-        column_list = ", ".join(columns)
-        sql = f"SELECT {column_list} FROM {self.table_name}"
-        
-        if where:
-            sql += f" WHERE {where}"
-        
-        if limit:
-            sql += f" LIMIT {limit}"
-        
-        return self.query(sql)
+        # Build SELECT statement; the limit goes straight to the planner so the
+        # scan stops after `limit` matching rows
+        sql = self._statement(columns, where)
+        return self.query(sql, limit=limit)
     
     def query_columns_df(self, *columns: str, where: str = None, limit: int = None):
         """
@@ -187,9 +341,9 @@ class SSTableReader(_CoreSSTableReader):
         Returns:
             pandas.DataFrame with results
         """
-        # Build SQL and execute
-        sql = self._build_column_query(columns, where, limit)
-        return self.query_df(sql)
+        # Convert each typed column in one cast
+        sql = self._statement(columns, where)
+        return self.query_result(sql, limit=limit).to_pandas()
     
     def sample(self, n: int = 10) -> List[Dict[str, Any]]:
         """
@@ -201,7 +355,8 @@ class SSTableReader(_CoreSSTableReader):
         Returns:
             Sample rows
         """
-        return self.query(f"SELECT * FROM {self.table_name} LIMIT {n}")
+        # One prepared SELECT * serves every sample size
+        return self.query(self._statement(), limit=n)
     
     def sample_df(self, n: int = 10):
         """
@@ -213,7 +368,7 @@ class SSTableReader(_CoreSSTableReader):
         Returns:
             pandas.DataFrame with sample data
         """
-        return self.query_df(f"SELECT * FROM {self.table_name} LIMIT {n}")
+        return self.query_df(self._statement(limit=n))
     
     def head(self, n: int = 5) -> List[Dict[str, Any]]:
         """Get first n rows (alias for sample)."""
@@ -242,57 +397,106 @@ class SSTableReader(_CoreSSTableReader):
         self, 
         sql: str, 
         output_base: str,
-        formats: List[str] = None
+        formats: List[str] = None,
+        batch_size: int = _EXPORT_BATCH_ROWS,
     ) -> Dict[str, Any]:
         """
-        Export query results to multiple formats simultaneously.
+        Export query results to multiple formats from a single scan.
+        
+        CSV, JSON (lines) and Parquet are streamed: the scan is drained in
+        batches of ``batch_size`` rows and each batch is written to every
+        output before the next one is read, so memory stays bounded by the
+        batch instead of the result size. Other formats (Excel) need the
+        whole result and are written by the core exporter.
         
         Args:
             sql: SELECT statement to execute
             output_base: Base path for output files (extension will be added)
             formats: List of formats to export to
+            batch_size: Rows per streamed batch
             
         Returns:
             Dictionary with export results for each format
         """
         if formats is None:
             formats = ["csv", "json", "parquet"]
+        formats = list(formats)
+        
+        streamed = [fmt for fmt in formats if fmt in _BATCH_WRITERS]
+        buffered = [fmt for fmt in formats if fmt not in _BATCH_WRITERS]
         
-        results = {}
+        summary = {}
+        if buffered:
+            summary.update(self.export_multi_format(sql, output_base, buffered))
+        if streamed:
+            summary.update(self._export_batches(sql, output_base, streamed, batch_size))
         
+        return {fmt: summary[fmt] for fmt in formats}
+    
+    def _export_batches(
+        self,
+        sql: str,
+        output_base: str,
+        formats: List[str],
+        batch_size: int,
+    ) -> Dict[str, Any]:
+        """
+        Stream one scan into a batch writer per format.
+        
+        Each batch is handed to all writers at once on a thread pool, and the
+        next batch is read from the scan (which releases the GIL) while they
+        run, so encoding overlaps both the other formats and the scan.
+        """
+        summary = {}
+        writers = {}
         for fmt in formats:
-            output_path = f"{output_base}.{fmt}"
-            
             try:
-                if fmt == "csv":
-                    result = self.export_csv(sql, output_path)
-                elif fmt == "json":
-                    result = self.export_json(sql, output_path)
-                elif fmt == "parquet":
-                    result = self.export_parquet(sql, output_path)
-                else:
-                    raise ValueError(f"Unsupported format: {fmt}")
-                
-                results[fmt] = {
-                    "success": True,
-                    "output_path": output_path,
-                    "stats": result,
-                }
-                
+                writers[fmt] = _BATCH_WRITERS[fmt](f"{output_base}.{fmt}")
             except Exception as e:
-                results[fmt] = {
-                    "success": False,
-                    "error": str(e),
-                }
+                summary[fmt] = {"success": False, "error": str(e)}
+        
+        def drain(pending):
+            # A failing writer is dropped; the others keep going
+            for fmt, future in pending.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    writers.pop(fmt).abort()
+                    summary[fmt] = {"success": False, "error": str(e)}
+        
+        with ThreadPoolExecutor(max_workers=max(len(writers), 1)) as pool:
+            pending = {}
+            try:
+                for batch in self.iter_batches(sql, batch_size):
+                    names = list(batch)
+                    columns = list(batch.values())
+                    # Writes to one file stay in batch order
+                    drain(pending)
+                    pending = {
+                        fmt: pool.submit(writer.write, names, columns)
+                        for fmt, writer in writers.items()
+                    }
+                drain(pending)
+            except Exception as e:
+                wait(pending.values())
+                for fmt, writer in writers.items():
+                    writer.abort()
+                    summary[fmt] = {"success": False, "error": str(e)}
+                return summary
+        
+        for fmt, writer in writers.items():
+            try:
+                stats = writer.close()
+            except Exception as e:
+                summary[fmt] = {"success": False, "error": str(e)}
+            else:
+                summary[fmt] = {"success": True, "output_path": writer.path, "stats": stats}
         
-        return results
+        return summary
     
     def get_column_names(self) -> List[str]:
         """Get list of column names from schema."""
-        schema = self.schema
-        if "columns" in schema:
-            return [col["name"] for col in schema["columns"]]
-        return []
+        return list(self._columns_by_name())
     
     def get_partition_keys(self) -> List[str]:
         """Get partition key column names."""
@@ -314,12 +518,7 @@ class SSTableReader(_CoreSSTableReader):
         Returns:
             CQL type string, or None if column not found
         """
-        schema = self.schema
-        if "columns" in schema:
-            for col in schema["columns"]:
-                if col["name"] == column_name:
-                    return col.get("cql_type")
-        return None
+        return self._column_type_map().get(column_name)
     
     def validate_query(self, sql: str) -> Dict[str, Any]:
         """
@@ -334,15 +533,13 @@ class SSTableReader(_CoreSSTableReader):
         try:
             # This would use the query parser to validate syntax
             # For now, basic validation
-            sql_upper = sql.strip().upper()
-            
             errors = []
             warnings = []
             
-            if not sql_upper.startswith("SELECT"):
+            if not _SELECT_STATEMENT.match(sql):
                 errors.append("Only SELECT statements are supported")
             
-            if "DELETE" in sql_upper or "INSERT" in sql_upper or "UPDATE" in sql_upper:
+            if _MUTATING_KEYWORD.search(sql):
                 errors.append("Only read-only SELECT operations are allowed")
             
             return {
@@ -358,6 +555,53 @@ class SSTableReader(_CoreSSTableReader):
                 "warnings": [],
             }
     
+    def _columns_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """Schema columns indexed by name, built once from the cached schema."""
+        if self._column_index is None:
+            schema = self.schema
+            columns = schema.get("columns", []) if isinstance(schema, dict) else []
+            self._column_index = {col["name"]: col for col in columns}
+        return self._column_index
+    
+    def _column_type_map(self) -> Dict[str, Optional[str]]:
+        """Column name -> CQL type, built once so type lookups are one dict get."""
+        if self._column_types is None:
+            self._column_types = {
+                name: column.get("cql_type") for name, column in self._columns_by_name().items()
+            }
+        return self._column_types
+    
+    def _statement(self, columns=(), where=None, limit=None) -> str:
+        """
+        Get the SQL for a column query, building and preparing it on first use.
+        
+        The built statements are cached per reader (least recently used first
+        out), so repeated sample/head/query_columns calls skip both the string
+        building and the core parser. The unfiltered ``SELECT *`` behind
+        sample()/head() and ``query_columns()``/``query_columns("*")`` is
+        kept in its own slot, outside the LRU bookkeeping. The core's plan
+        cache is bounded as well, so varying ``where``/``limit`` values don't
+        accumulate plans there either.
+        """
+        if where is None and limit is None and columns in ((), ("*",)):
+            if self._select_all_sql is None:
+                self._select_all_sql = self._build_column_query((), None, None)
+                self.prepare(self._select_all_sql)
+            return self._select_all_sql
+        
+        key = (columns, where, limit)
+        sql = self._statements.get(key)
+        if sql is not None:
+            self._statements.move_to_end(key)
+            return sql
+        
+        sql = self._build_column_query(columns, where, limit)
+        self.prepare(sql)
+        self._statements[key] = sql
+        if len(self._statements) > _STATEMENT_CACHE_SIZE:
+            self._statements.popitem(last=False)
+        return sql
+    
     def _build_column_query(self, columns, where, limit):
         """Build SQL query from column parameters."""
         if not columns:
@@ -375,6 +619,290 @@ class SSTableReader(_CoreSSTableReader):
         return sql
 
 
+def _advise_readahead(path: str, readahead_bytes: int) -> None:
+    """
+    Start asynchronous readahead of the leading ``readahead_bytes`` of ``path``.
+    
+    POSIX_FADV_WILLNEED queues the reads and returns without blocking. It acts
+    on the file's page cache rather than on the descriptor, so the core's own
+    reads benefit and the descriptor used for the hint is closed right away.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, readahead_bytes, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _BatchWriter:
+    """Incremental writer for one export format, fed column-wise batches."""
+    
+    format = ""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.rows_written = 0
+        self.columns_written = 0
+    
+    def write(self, names: List[str], columns: List[List[Any]]) -> None:
+        raise NotImplementedError
+    
+    def close(self) -> Dict[str, Any]:
+        """Finish the file and return its export statistics."""
+        return {
+            "format": self.format,
+            "output_path": self.path,
+            "rows_written": self.rows_written,
+            "columns_written": self.columns_written,
+            "file_size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+        }
+    
+    def abort(self) -> None:
+        """Release the output after a failure."""
+
+
+class _CsvBatchWriter(_BatchWriter):
+    format = "csv"
+    
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, lineterminator="\n")
+    
+    def write(self, names, columns):
+        if not self.columns_written:
+            self._writer.writerow(names)
+            self.columns_written = len(names)
+        self._writer.writerows(zip(*columns))
+        self.rows_written += len(columns[0]) if columns else 0
+    
+    def close(self):
+        self._file.close()
+        return super().close()
+    
+    def abort(self):
+        self._file.close()
+
+
+class _JsonLinesBatchWriter(_BatchWriter):
+    format = "json-lines"
+    
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, "w", encoding="utf-8")
+    
+    def write(self, names, columns):
+        dumps = json.dumps
+        self._file.writelines(dumps(dict(zip(names, row))) + "\n" for row in zip(*columns))
+        self.columns_written = self.columns_written or len(names)
+        self.rows_written += len(columns[0]) if columns else 0
+    
+    def close(self):
+        self._file.close()
+        return super().close()
+    
+    def abort(self):
+        self._file.close()
+
+
+class _ParquetBatchWriter(_BatchWriter):
+    """
+    Parquet writer whose schema is unified across batches.
+    
+    A column that is all null in a batch is inferred as Arrow's null type,
+    so batches are held back until every column has a concrete type (or
+    ``max_pending_rows`` rows are waiting) and the file is then opened with
+    the schema unified over them. Later batches are cast to that schema.
+    """
+    
+    format = "parquet"
+    compression = "snappy"
+    max_pending_rows = 100_000
+    
+    def __init__(self, path: str):
+        super().__init__(path)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet export. Install with: pip install pyarrow")
+        self._pa = pa
+        self._pq = pq
+        self._writer = None
+        self._pending = []
+        self._pending_rows = 0
+    
+    def write(self, names, columns):
+        pa = self._pa
+        table = pa.Table.from_arrays([pa.array(values) for values in columns], names=names)
+        if self._writer is not None:
+            if table.schema != self._writer.schema:
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+            self.rows_written += table.num_rows
+            return
+        
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        schema = pa.unify_schemas([pending.schema for pending in self._pending])
+        if self._pending_rows >= self.max_pending_rows or not any(
+            pa.types.is_null(field.type) for field in schema
+        ):
+            self._open(schema)
+    
+    def _open(self, schema):
+        """Open the file with ``schema`` and write the held-back batches."""
+        self._writer = self._pq.ParquetWriter(self.path, schema, compression=self.compression)
+        self.columns_written = len(schema)
+        for table in self._pending:
+            self._writer.write_table(table.cast(schema))
+            self.rows_written += table.num_rows
+        self._pending = []
+        self._pending_rows = 0
+    
+    def close(self):
+        if self._pending:
+            self._open(self._pa.unify_schemas([table.schema for table in self._pending]))
+        if self._writer is None:
+            self._pq.write_table(self._pa.table({}), self.path, compression=self.compression)
+        else:
+            self._writer.close()
+        stats = super().close()
+        stats["compression"] = self.compression
+        return stats
+    
+    def abort(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+# Formats export_all_formats streams batch by batch
+_BATCH_WRITERS = {
+    "csv": _CsvBatchWriter,
+    "json": _JsonLinesBatchWriter,
+    "parquet": _ParquetBatchWriter,
+}
+
+
+class QueryResult:
+    """
+    Column-oriented query result.
+    
+    Values are stored as one list per column. ``result["age"]`` returns the
+    column (as a NumPy array when NumPy is installed, converted once per
+    column with ``convert_cql_column`` when its CQL type is known, and
+    cached), while ``result[i]`` and iteration yield lightweight row views
+    that read from the columns instead of copying into per-row dicts.
+    """
+    
+    __slots__ = ("_columns", "_types", "_arrays", "_length")
+    
+    def __init__(self, columns: Dict[str, List[Any]], types: Optional[Dict[str, str]] = None):
+        self._columns = columns
+        self._types = types or {}
+        self._arrays = {}
+        self._length = len(next(iter(columns.values()))) if columns else 0
+    
+    @property
+    def columns(self) -> List[str]:
+        """Column names in result order."""
+        return list(self._columns)
+    
+    def column(self, name: str) -> List[Any]:
+        """Get a column's values as a plain list."""
+        return self._columns[name]
+    
+    def row(self, index: int) -> "QueryRow":
+        """Get a view of the row at ``index``."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("QueryResult row index out of range")
+        return QueryRow(self, index)
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._array(key)
+        return self.row(key)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator["QueryRow"]:
+        for index in range(self._length):
+            yield QueryRow(self, index)
+    
+    def __repr__(self) -> str:
+        return f"QueryResult(rows={self._length}, columns={self.columns})"
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to the row-oriented ``query()`` format."""
+        return [row.to_dict() for row in self]
+    
+    def to_pandas(self):
+        """Convert to a pandas DataFrame, one column at a time."""
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for DataFrame output. Install with: pip install pandas")
+        
+        if not self._types:
+            return pd.DataFrame(self._columns)
+        return pd.DataFrame({name: self._array(name) for name in self._columns})
+    
+    def _array(self, name: str):
+        if name in self._arrays:
+            return self._arrays[name]
+        
+        values = self._columns[name]
+        try:
+            import numpy as np
+        except ImportError:
+            return values
+        
+        cql_type = self._types.get(name)
+        if cql_type is not None:
+            array = convert_cql_column(values, cql_type)
+        else:
+            array = np.asarray(values)
+        self._arrays[name] = array
+        return array
+
+
+class QueryRow(Mapping):
+    """Read-only view of one row of a QueryResult."""
+    
+    __slots__ = ("_result", "_index")
+    
+    def __init__(self, result: QueryResult, index: int):
+        self._result = result
+        self._index = index
+    
+    def __getitem__(self, column: str) -> Any:
+        return self._result._columns[column][self._index]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._result._columns)
+    
+    def __len__(self) -> int:
+        return len(self._result._columns)
+    
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the row into a plain dictionary."""
+        index = self._index
+        return {name: values[index] for name, values in self._result._columns.items()}
+
+
 def open_sstable(
     sstable_path: str,
     schema: Optional[Union[str, Dict[str, Any]]] = None,
@@ -400,6 +928,36 @@ def open_sstable(
     return SSTableReader(sstable_path, schema=schema, **kwargs)
 
 
+def open_cached(sstable_path: str) -> SSTableReader:
+    """
+    Open an SSTable file, reusing the reader from an earlier call for it.
+    
+    Readers are cached per (absolute path, modification time), so repeated
+    opens in one session skip schema detection and executor setup, while a
+    rewritten file gets a fresh reader. The reader is shared: don't close it
+    or use it as a context manager.
+    
+    Args:
+        sstable_path: Path to SSTable Data.db file
+        
+    Returns:
+        SSTableReader instance
+        
+    Example:
+        ```python
+        reader = cqlite.open_cached("users-Data.db")
+        assert cqlite.open_cached("users-Data.db") is reader
+        ```
+    """
+    path = os.path.abspath(sstable_path)
+    return _open_cached(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _open_cached(path: str, mtime_ns: int) -> SSTableReader:
+    return SSTableReader(path)
+
+
 def query_sstable(
     sstable_path: str,
     sql: str,
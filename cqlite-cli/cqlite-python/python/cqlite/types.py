@@ -8,8 +8,9 @@ enabling seamless data conversion when querying SSTable files.
 import uuid
 import datetime
 import decimal
+import functools
 import ipaddress
-from typing import Any, Dict, List, Set, Tuple, Union, Optional, Type
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple, Union, Optional, Type
 from enum import Enum
 
 
@@ -126,6 +127,7 @@ PYTHON_TO_CQL_MAPPING: Dict[Type, CQLType] = {
 }
 
 
+@functools.lru_cache(maxsize=2048)
 def infer_python_type(cql_type_string: str) -> Type:
     """
     Infer Python type from CQL type string.
@@ -144,11 +146,8 @@ def infer_python_type(cql_type_string: str) -> Type:
         >>> infer_python_type("map<text,int>")
         <class 'dict'>
     """
-    # Parse base type (handle parameterized types)
-    base_type = cql_type_string.split('<')[0].lower().strip()
-    
     try:
-        cql_type = CQLType(base_type)
+        cql_type = CQLType(_base_type(cql_type_string))
         return PYTHON_TYPE_MAPPING.get(cql_type, str)  # Default to str
     except ValueError:
         # Unknown type, default to str
@@ -175,119 +174,339 @@ def convert_cql_value(value: Any, cql_type_string: str) -> Any:
     if value is None:
         return None
     
-    base_type = cql_type_string.split('<')[0].lower().strip()
+    base_type = _base_type(cql_type_string)
+    builtin = _BUILTIN_CONVERTERS.get(base_type)
+    if builtin is not None:
+        return builtin(value)
     
-    try:
-        cql_type = CQLType(base_type)
-    except ValueError:
-        # Unknown type, return as-is
-        return value
-    
-    # Convert based on CQL type
-    if cql_type in (CQLType.TEXT, CQLType.VARCHAR, CQLType.ASCII):
-        return str(value)
-    
-    elif cql_type in (CQLType.INT, CQLType.SMALLINT, CQLType.TINYINT, CQLType.BIGINT, CQLType.COUNTER):
-        return int(value)
-    
-    elif cql_type == CQLType.VARINT:
-        # Handle very large integers
-        return int(value)
-    
-    elif cql_type == CQLType.FLOAT:
-        return float(value)
-    
-    elif cql_type == CQLType.DOUBLE:
-        return float(value)
-    
-    elif cql_type == CQLType.DECIMAL:
-        if isinstance(value, str):
-            return decimal.Decimal(value)
-        return decimal.Decimal(str(value))
-    
-    elif cql_type == CQLType.BOOLEAN:
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
-        return bool(value)
-    
-    elif cql_type == CQLType.BLOB:
-        if isinstance(value, str):
-            # Assume hex string
-            return bytes.fromhex(value)
-        return bytes(value)
-    
-    elif cql_type in (CQLType.UUID, CQLType.TIMEUUID):
-        if isinstance(value, str):
-            return uuid.UUID(value)
-        return value
-    
-    elif cql_type == CQLType.TIMESTAMP:
-        if isinstance(value, str):
-            # Try to parse ISO format
-            try:
-                return datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
-            except ValueError:
-                # Try parsing as timestamp
-                return datetime.datetime.fromtimestamp(float(value))
-        elif isinstance(value, (int, float)):
-            return datetime.datetime.fromtimestamp(value)
-        return value
-    
-    elif cql_type == CQLType.DATE:
-        if isinstance(value, str):
-            return datetime.datetime.strptime(value, '%Y-%m-%d').date()
-        return value
-    
-    elif cql_type == CQLType.TIME:
-        if isinstance(value, str):
-            return datetime.datetime.strptime(value, '%H:%M:%S').time()
-        return value
-    
-    elif cql_type == CQLType.INET:
-        if isinstance(value, str):
-            return ipaddress.ip_address(value)
-        return value
-    
-    elif cql_type == CQLType.LIST:
-        if isinstance(value, (list, tuple)):
-            # Parse element type from cql_type_string
-            element_type = _extract_element_type(cql_type_string)
-            return [convert_cql_value(item, element_type) for item in value]
-        return list(value) if value is not None else []
-    
-    elif cql_type == CQLType.SET:
-        if isinstance(value, (list, tuple, set)):
-            element_type = _extract_element_type(cql_type_string)
-            return {convert_cql_value(item, element_type) for item in value}
-        return set(value) if value is not None else set()
-    
-    elif cql_type == CQLType.MAP:
-        if isinstance(value, dict):
-            key_type, value_type = _extract_map_types(cql_type_string)
-            return {
-                convert_cql_value(k, key_type): convert_cql_value(v, value_type)
-                for k, v in value.items()
-            }
-        return dict(value) if value is not None else {}
-    
-    elif cql_type == CQLType.TUPLE:
-        if isinstance(value, (list, tuple)):
-            element_types = _extract_tuple_types(cql_type_string)
-            converted = []
-            for i, item in enumerate(value):
-                elem_type = element_types[i] if i < len(element_types) else "text"
-                converted.append(convert_cql_value(item, elem_type))
-            return tuple(converted)
-        return tuple(value) if value is not None else tuple()
-    
-    elif cql_type == CQLType.UDT:
-        # UDT should be a dict-like structure
-        return dict(value) if value is not None else {}
-    
-    # Default: return as-is
+    # Unknown types are returned as-is
+    converter = _CONVERTERS.get(base_type, _identity)
+    return converter(value, cql_type_string)
+
+
+# Type strings are low-cardinality (a handful per schema column), so the
+# parsers below are cached; 2048 entries covers many schemas of nested types.
+# Cached results are immutable (str/tuple) since they are shared across calls.
+
+@functools.lru_cache(maxsize=2048)
+def _base_type(cql_type_string: str) -> str:
+    """Lowercased base type of a CQL type string (``map<text,int>`` -> ``map``)."""
+    return cql_type_string.split('<')[0].lower().strip()
+
+
+# Per-type converters, each called as converter(value, cql_type_string)
+# with a non-None value
+
+def _identity(value: Any, cql_type_string: str) -> Any:
+    return value
+
+
+def _to_str(value: Any, cql_type_string: str) -> str:
+    return str(value)
+
+
+def _to_int(value: Any, cql_type_string: str) -> int:
+    # Python ints are arbitrary precision, so varint needs no special case
+    return int(value)
+
+
+def _to_float(value: Any, cql_type_string: str) -> float:
+    return float(value)
+
+
+def _to_decimal(value: Any, cql_type_string: str) -> decimal.Decimal:
+    if isinstance(value, str):
+        return decimal.Decimal(value)
+    return decimal.Decimal(str(value))
+
+
+# Strings read as True, compared case-insensitively
+_TRUE_STRINGS = frozenset({'true', '1', 'yes', 'on'})
+# Common spellings matched exactly first, so most values skip lower()
+_TRUE_SPELLINGS = frozenset(
+    spelling for word in _TRUE_STRINGS for spelling in (word, word.title(), word.upper())
+)
+_FALSE_SPELLINGS = frozenset(
+    spelling for word in ('false', '0', 'no', 'off', '') for spelling in (word, word.title(), word.upper())
+)
+
+
+def _to_bool(value: Any, cql_type_string: str) -> bool:
+    if isinstance(value, str):
+        if value in _TRUE_SPELLINGS:
+            return True
+        if value in _FALSE_SPELLINGS:
+            return False
+        return value.lower() in _TRUE_STRINGS
+    return bool(value)
+
+
+def _to_bytes(value: Any, cql_type_string: str) -> bytes:
+    if isinstance(value, str):
+        # Assume hex string
+        return bytes.fromhex(value)
+    return bytes(value)
+
+
+# UUID and inet columns repeat a small set of values (foreign keys, client
+# addresses); both types are immutable, so parsed objects can be shared
+_parse_uuid = functools.lru_cache(maxsize=16384)(uuid.UUID)
+_parse_inet = functools.lru_cache(maxsize=4096)(ipaddress.ip_address)
+
+
+def _to_uuid(value: Any, cql_type_string: str) -> Any:
+    if isinstance(value, str):
+        return _parse_uuid(value)
+    return value
+
+
+def _to_timestamp(value: Any, cql_type_string: str) -> Any:
+    if isinstance(value, str):
+        # Try to parse ISO format
+        try:
+            return datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            # Try parsing as timestamp
+            return datetime.datetime.fromtimestamp(float(value))
+    elif isinstance(value, (int, float)):
+        return datetime.datetime.fromtimestamp(value)
     return value
 
 
+# Native SSTable encodings: date as days since the Unix epoch, time as
+# nanoseconds since midnight. Passing them through as ints skips parsing.
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_NANOS_PER_SECOND = 1_000_000_000
+
+
+def _to_date(value: Any, cql_type_string: str) -> Any:
+    if isinstance(value, str):
+        # YYYY-MM-DD by slicing; strptime only for anything else
+        if (len(value) == 10 and value[4] == '-' and value[7] == '-'
+                and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+            return datetime.date(int(value[:4]), int(value[5:7]), int(value[8:]))
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    if isinstance(value, int) and not isinstance(value, bool):
+        return datetime.date.fromordinal(value + _EPOCH_ORDINAL)
+    return value
+
+
+def _to_time(value: Any, cql_type_string: str) -> Any:
+    if isinstance(value, str):
+        # HH:MM:SS by slicing; strptime only for anything else
+        if (len(value) == 8 and value[2] == ':' and value[5] == ':'
+                and value[:2].isdigit() and value[3:5].isdigit() and value[6:].isdigit()):
+            return datetime.time(int(value[:2]), int(value[3:5]), int(value[6:]))
+        return datetime.datetime.strptime(value, '%H:%M:%S').time()
+    if isinstance(value, int) and not isinstance(value, bool):
+        seconds, nanos = divmod(value, _NANOS_PER_SECOND)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        return datetime.time(hour, minute, second, nanos // 1000)
+    return value
+
+
+def _to_inet(value: Any, cql_type_string: str) -> Any:
+    if isinstance(value, str):
+        return _parse_inet(value)
+    return value
+
+
+def _to_list(value: Any, cql_type_string: str) -> list:
+    if isinstance(value, (list, tuple)):
+        # Parse element type from cql_type_string
+        element_type = _extract_element_type(cql_type_string)
+        return [convert_cql_value(item, element_type) for item in value]
+    return list(value)
+
+
+def _to_set(value: Any, cql_type_string: str) -> set:
+    if isinstance(value, (list, tuple, set)):
+        element_type = _extract_element_type(cql_type_string)
+        return {convert_cql_value(item, element_type) for item in value}
+    return set(value)
+
+
+def _to_map(value: Any, cql_type_string: str) -> dict:
+    if isinstance(value, dict):
+        key_type, value_type = _extract_map_types(cql_type_string)
+        return {
+            convert_cql_value(k, key_type): convert_cql_value(v, value_type)
+            for k, v in value.items()
+        }
+    return dict(value)
+
+
+def _to_tuple(value: Any, cql_type_string: str) -> tuple:
+    if isinstance(value, (list, tuple)):
+        element_types = _extract_tuple_types(cql_type_string)
+        converted = []
+        for i, item in enumerate(value):
+            elem_type = element_types[i] if i < len(element_types) else "text"
+            converted.append(convert_cql_value(item, elem_type))
+        return tuple(converted)
+    return tuple(value)
+
+
+def _to_udt(value: Any, cql_type_string: str) -> dict:
+    # UDT should be a dict-like structure
+    return dict(value)
+
+
+# Base type name -> converter; one dict lookup replaces the CQLType enum
+# construction and if/elif chain per value
+_CONVERTERS: Dict[str, Callable[[Any, str], Any]] = {
+    CQLType.TEXT.value: _to_str,
+    CQLType.VARCHAR.value: _to_str,
+    CQLType.ASCII.value: _to_str,
+    CQLType.INT.value: _to_int,
+    CQLType.SMALLINT.value: _to_int,
+    CQLType.TINYINT.value: _to_int,
+    CQLType.BIGINT.value: _to_int,
+    CQLType.COUNTER.value: _to_int,
+    CQLType.VARINT.value: _to_int,
+    CQLType.FLOAT.value: _to_float,
+    CQLType.DOUBLE.value: _to_float,
+    CQLType.DECIMAL.value: _to_decimal,
+    CQLType.BOOLEAN.value: _to_bool,
+    CQLType.BLOB.value: _to_bytes,
+    CQLType.UUID.value: _to_uuid,
+    CQLType.TIMEUUID.value: _to_uuid,
+    CQLType.TIMESTAMP.value: _to_timestamp,
+    CQLType.DATE.value: _to_date,
+    CQLType.TIME.value: _to_time,
+    CQLType.INET.value: _to_inet,
+    CQLType.LIST.value: _to_list,
+    CQLType.SET.value: _to_set,
+    CQLType.MAP.value: _to_map,
+    CQLType.TUPLE.value: _to_tuple,
+    CQLType.UDT.value: _to_udt,
+}
+
+# Scalar types whose conversion is exactly one C builtin call; these are
+# applied directly, without a Python-level converter frame per value
+_BUILTIN_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    CQLType.TEXT.value: str,
+    CQLType.VARCHAR.value: str,
+    CQLType.ASCII.value: str,
+    CQLType.INT.value: int,
+    CQLType.SMALLINT.value: int,
+    CQLType.TINYINT.value: int,
+    CQLType.BIGINT.value: int,
+    CQLType.COUNTER.value: int,
+    CQLType.VARINT.value: int,
+    CQLType.FLOAT.value: float,
+    CQLType.DOUBLE.value: float,
+}
+
+
+# Base types whose columns convert in one typed NumPy cast
+_INT64_TYPES = frozenset({
+    CQLType.INT.value, CQLType.SMALLINT.value, CQLType.TINYINT.value,
+    CQLType.BIGINT.value, CQLType.COUNTER.value,
+})
+_FLOAT64_TYPES = frozenset({CQLType.FLOAT.value, CQLType.DOUBLE.value})
+
+
+def convert_cql_column(values: Sequence[Any], cql_type_string: str):
+    """
+    Convert a whole column of raw values to a NumPy array.
+
+    The CQL type is dispatched once for the column instead of once per value.
+    Integer columns become ``int64`` and float/double columns ``float64``
+    (None becomes NaN) in a single typed cast; boolean columns become
+    ``bool``. Columns that can't be represented in a typed dtype (nulls in
+    an integer or boolean column, varint, decimal, collections, UDTs, ...)
+    fall back to an object array of ``convert_cql_value`` results.
+
+    Args:
+        values: Raw column values from SSTable
+        cql_type_string: CQL type string of the column
+
+    Returns:
+        numpy.ndarray with the converted column
+
+    Examples:
+        >>> convert_cql_column(["1", "2"], "bigint")
+        array([1, 2])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for column conversion. Install with: pip install numpy")
+
+    base_type = _base_type(cql_type_string)
+
+    try:
+        if base_type in _FLOAT64_TYPES:
+            return np.asarray(values, dtype=np.float64)
+        if base_type in _INT64_TYPES and None not in values:
+            return np.asarray(values, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError):
+        # Values the typed cast can't parse go through the per-value converters
+        pass
+
+    if base_type == CQLType.BOOLEAN.value and None not in values:
+        return np.fromiter((_to_bool(v, cql_type_string) for v in values), dtype=np.bool_, count=len(values))
+
+    column = np.empty(len(values), dtype=object)
+    builtin = _BUILTIN_CONVERTERS.get(base_type)
+    if builtin is not None:
+        column[:] = [None if v is None else builtin(v) for v in values]
+        return column
+    
+    converter = _CONVERTERS.get(base_type, _identity)
+    # Filled per index so nested values (lists, tuples) stay single elements
+    for index, value in enumerate(values):
+        if value is not None:
+            column[index] = converter(value, cql_type_string)
+    return column
+
+
+def make_row_converter(columns: Sequence[Tuple[str, str]]) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+    """
+    Build a function converting one row of raw values to a dictionary.
+    
+    The schema is fixed per reader, so the converter is generated once as
+    straight-line code: each column's converter is resolved up front and
+    called directly, with no per-cell type-string lookup or dispatch.
+    
+    Args:
+        columns: (column name, CQL type string) pairs, in row value order
+        
+    Returns:
+        Function taking a sequence of raw values (one per column, in the same
+        order) and returning ``{column name: converted value}``
+        
+    Examples:
+        >>> convert_row = make_row_converter([("id", "int"), ("tags", "list<text>")])
+        >>> convert_row(("7", ["a"]))
+        {'id': 7, 'tags': ['a']}
+    """
+    namespace: Dict[str, Any] = {}
+    names = []
+    entries = []
+    for index, (name, cql_type_string) in enumerate(columns):
+        value = f"v{index}"
+        base_type = _base_type(cql_type_string)
+        builtin = _BUILTIN_CONVERTERS.get(base_type)
+        if builtin is not None:
+            namespace[f"c{index}"] = builtin
+            call = f"c{index}({value})"
+        else:
+            namespace[f"c{index}"] = _CONVERTERS.get(base_type, _identity)
+            namespace[f"t{index}"] = cql_type_string
+            call = f"c{index}({value}, t{index})"
+        names.append(value)
+        entries.append(f"{name!r}: None if {value} is None else {call}")
+    
+    unpack = f"    {', '.join(names)}, = values\n" if names else ""
+    source = f"def convert_row(values):\n{unpack}    return {{{', '.join(entries)}}}\n"
+    exec(compile(source, "<cqlite row converter>", "exec"), namespace)
+    return namespace["convert_row"]
+
+
+@functools.lru_cache(maxsize=2048)
 def _extract_element_type(cql_type_string: str) -> str:
     """Extract element type from list<type> or set<type>."""
     if '<' in cql_type_string and '>' in cql_type_string:
@@ -297,6 +516,7 @@ def _extract_element_type(cql_type_string: str) -> str:
     return "text"  # Default
 
 
+@functools.lru_cache(maxsize=2048)
 def _extract_map_types(cql_type_string: str) -> Tuple[str, str]:
     """Extract key and value types from map<key_type,value_type>."""
     if '<' in cql_type_string and '>' in cql_type_string:
@@ -312,19 +532,21 @@ def _extract_map_types(cql_type_string: str) -> Tuple[str, str]:
     return "text", "text"  # Default
 
 
-def _extract_tuple_types(cql_type_string: str) -> List[str]:
+@functools.lru_cache(maxsize=2048)
+def _extract_tuple_types(cql_type_string: str) -> Tuple[str, ...]:
     """Extract element types from tuple<type1,type2,...>."""
     if '<' in cql_type_string and '>' in cql_type_string:
         start = cql_type_string.find('<') + 1
         end = cql_type_string.rfind('>')
         inner = cql_type_string[start:end].strip()
         
-        return [t.strip() for t in _split_type_params(inner)]
+        return tuple(t.strip() for t in _split_type_params(inner))
     
-    return ["text"]  # Default
+    return ("text",)  # Default
 
 
-def _split_type_params(params_string: str) -> List[str]:
+@functools.lru_cache(maxsize=2048)
+def _split_type_params(params_string: str) -> Tuple[str, ...]:
     """Split type parameters, handling nested angle brackets."""
     parts = []
     current = ""
@@ -346,9 +568,10 @@ def _split_type_params(params_string: str) -> List[str]:
     if current.strip():
         parts.append(current.strip())
     
-    return parts
+    return tuple(parts)
 
 
+@functools.lru_cache(maxsize=2048)
 def create_type_hint_string(cql_type_string: str) -> str:
     """
     Create a Python type hint string from CQL type.
@@ -367,7 +590,7 @@ def create_type_hint_string(cql_type_string: str) -> str:
         >>> create_type_hint_string("map<text,int>")
         "Dict[str, int]"
     """
-    base_type = cql_type_string.split('<')[0].lower().strip()
+    base_type = _base_type(cql_type_string)
     
     # Handle simple types
     simple_mappings = {
@@ -438,7 +661,7 @@ def get_cql_type_info(cql_type_string: str) -> Dict[str, Any]:
     python_type = infer_python_type(cql_type_string)
     type_hint = create_type_hint_string(cql_type_string)
     
-    base_type = cql_type_string.split('<')[0].lower().strip()
+    base_type = _base_type(cql_type_string)
     is_collection = base_type in ("list", "set", "map", "tuple")
     is_numeric = base_type in ("int", "smallint", "tinyint", "bigint", "varint", 
                               "float", "double", "decimal", "counter")
@@ -5,9 +5,10 @@ This module provides helper functions for common tasks when working with
 SSTable files and query results.
 """
 
+import itertools
 import json
 import sys
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
 from pathlib import Path
 
 
@@ -29,31 +30,64 @@ def format_query_results(
     Returns:
         Formatted string representation
     """
-    if not results:
-        return "No results found."
+    return "".join(format_query_results_stream(results, format_type, max_rows, max_width))
+
+
+def format_query_results_stream(
+    results: Iterable[Dict[str, Any]],
+    format_type: str = "table",
+    max_rows: Optional[int] = None,
+    max_width: int = 80
+) -> Iterator[str]:
+    """
+    Format query results incrementally, one row's text at a time.
+    
+    Produces the same text as ``format_query_results``, split into chunks,
+    so large results can be written to a file or ``sys.stdout`` (e.g. with
+    ``sink.writelines(...)``) without building the whole string. CSV and JSON
+    consume ``results`` lazily and accept any iterable, such as
+    ``reader.iter_query(sql)``; the table format needs every displayed row to
+    size its columns, so it holds at most ``max_rows`` of them.
     
+    Args:
+        results: Query results as an iterable of dictionaries
+        format_type: Format type ("table", "json", "csv")
+        max_rows: Maximum number of rows to display
+        max_width: Maximum width for table format
+        
+    Yields:
+        Consecutive pieces of the formatted text
+    """
+    rows = iter(results)
     if max_rows:
-        results = results[:max_rows]
+        rows = itertools.islice(rows, max_rows)
+    
+    first = next(rows, None)
+    if first is None:
+        yield "No results found."
+        return
+    rows = itertools.chain((first,), rows)
     
     if format_type == "json":
-        return json.dumps(results, indent=2, default=str)
+        # Same layout as json.dumps(results, indent=2): each row is indented
+        # one level inside the array
+        encode = json.JSONEncoder(indent=2, default=str).encode
+        separator = "[\n  "
+        for row in rows:
+            yield separator + encode(row).replace("\n", "\n  ")
+            separator = ",\n  "
+        yield "\n]"
     
     elif format_type == "csv":
-        if not results:
-            return ""
-        
         # Get headers from first row
-        headers = list(results[0].keys())
-        lines = [",".join(headers)]
+        headers = list(first.keys())
+        yield ",".join(headers)
         
-        for row in results:
-            values = [str(row.get(h, "")) for h in headers]
-            lines.append(",".join(values))
-        
-        return "\n".join(lines)
+        for row in rows:
+            yield "\n" + ",".join([str(row.get(h, "")) for h in headers])
     
     elif format_type == "table":
-        return _format_as_table(results, max_width)
+        yield from _iter_table(list(rows), max_width)
     
     else:
         raise ValueError(f"Unsupported format type: {format_type}")
@@ -64,6 +98,11 @@ def _format_as_table(results: List[Dict[str, Any]], max_width: int) -> str:
     if not results:
         return "No results found."
     
+    return "".join(_iter_table(results, max_width))
+
+
+def _iter_table(results: List[Dict[str, Any]], max_width: int) -> Iterator[str]:
+    """Yield the lines of a non-empty ASCII table, newline-separated."""
     # Get all unique columns
     all_columns = set()
     for row in results:
@@ -90,9 +129,6 @@ def _format_as_table(results: List[Dict[str, Any]], max_width: int) -> str:
         for col in columns:
             col_widths[col] = max(5, int(col_widths[col] * scale_factor))
     
-    # Build table
-    lines = []
-    
     # Header
     header_parts = []
     separator_parts = []
@@ -101,8 +137,8 @@ def _format_as_table(results: List[Dict[str, Any]], max_width: int) -> str:
         header_parts.append(f" {col:<{width}} ")
         separator_parts.append("-" * (width + 2))
     
-    lines.append("|" + "|".join(header_parts) + "|")
-    lines.append("+" + "+".join(separator_parts) + "+")
+    yield "|" + "|".join(header_parts) + "|"
+    yield "\n+" + "+".join(separator_parts) + "+"
     
     # Data rows
     for row in results:
@@ -118,9 +154,7 @@ def _format_as_table(results: List[Dict[str, Any]], max_width: int) -> str:
             
             row_parts.append(f" {value_str:<{width}} ")
         
-        lines.append("|" + "|".join(row_parts) + "|")
-    
-    return "\n".join(lines)
+        yield "\n|" + "|".join(row_parts) + "|"
 
 
 def estimate_memory_usage(
@@ -452,37 +486,83 @@ def get_system_info() -> Dict[str, Any]:
     }
 
 
-def benchmark_query_performance(reader, sql: str, iterations: int = 3) -> Dict[str, Any]:
+def benchmark_query_performance(
+    reader,
+    sql: str,
+    iterations: int = 3,
+    warmup: int = 1,
+    pin_cpu: bool = False,
+) -> Dict[str, Any]:
     """
     Benchmark query performance.
     
+    Each iteration is timed with ``time.perf_counter_ns`` while the garbage
+    collector is disabled, after ``warmup`` untimed runs. Because the mean is
+    dominated by outliers, min/median/p99 are reported alongside it.
+    
     Args:
         reader: SSTableReader instance
         sql: SQL query to benchmark
-        iterations: Number of iterations to run
+        iterations: Number of timed iterations to run
+        warmup: Number of untimed iterations run first
+        pin_cpu: Pin the process to its current CPU while timing (Linux only)
         
     Returns:
         Performance metrics
     """
+    import gc
+    import os
+    import statistics
     import time
     
-    times = []
+    times_ns = []
     results_count = None
     
-    for i in range(iterations):
-        start_time = time.time()
-        results = reader.query(sql)
-        end_time = time.time()
-        
-        execution_time = end_time - start_time
-        times.append(execution_time)
-        
-        if results_count is None:
-            results_count = len(results)
+    # Repeated runs reuse one cached plan instead of re-parsing every time
+    prepared = False
+    if iterations >= 2 and hasattr(reader, "prepare"):
+        reader.prepare(sql)
+        prepared = True
     
+    original_affinity = None
+    if pin_cpu and hasattr(os, "sched_getaffinity"):
+        original_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {min(original_affinity)})
+    
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(warmup):
+            results = reader.query(sql)
+            results_count = len(results)
+            del results
+        
+        perf_counter_ns = time.perf_counter_ns
+        query = reader.query
+        for _ in range(iterations):
+            start_ns = perf_counter_ns()
+            results = query(sql)
+            times_ns.append(perf_counter_ns() - start_ns)
+            
+            if results_count is None:
+                results_count = len(results)
+            del results
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if original_affinity is not None:
+            os.sched_setaffinity(0, original_affinity)
+    
+    times = [t / 1e9 for t in times_ns]
+    sorted_times = sorted(times)
     avg_time = sum(times) / len(times)
-    min_time = min(times)
-    max_time = max(times)
+    min_time = sorted_times[0]
+    max_time = sorted_times[-1]
+    median_time = statistics.median(sorted_times)
+    p99_time = sorted_times[min(len(sorted_times) - 1, int(0.99 * len(sorted_times)))]
+    
+    timer_resolution_ns = int(time.get_clock_info("perf_counter").resolution * 1e9) or 1
     
     return {
         "sql": sql,
@@ -490,9 +570,14 @@ def benchmark_query_performance(reader, sql: str, iterations: int = 3) -> Dict[s
         "results_count": results_count,
         "avg_time_seconds": avg_time,
         "min_time_seconds": min_time,
+        "median_time_seconds": median_time,
+        "p99_time_seconds": p99_time,
         "max_time_seconds": max_time,
-        "rows_per_second": results_count / avg_time if avg_time > 0 else 0,
+        "rows_per_second": results_count / min_time if min_time > 0 else 0,
         "all_times": times,
+        "timer_resolution_ns": timer_resolution_ns,
+        "below_timer_resolution": min_time * 1e9 < 10 * timer_resolution_ns,
+        "prepared": prepared,
     }
 
 
@@ -506,8 +591,8 @@ def pprint_results(results: List[Dict[str, Any]], max_rows: int = 20):
     print(f"\nQuery Results ({len(results)} rows):")
     print("=" * 50)
     
-    formatted = format_query_results(results, "table", max_rows)
-    print(formatted)
+    sys.stdout.writelines(format_query_results_stream(results, "table", max_rows))
+    print()
     
     if len(results) > max_rows:
         print(f"\n... and {len(results) - max_rows} more rows")
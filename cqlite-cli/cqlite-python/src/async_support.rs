@@ -1,9 +1,16 @@
 use pyo3::prelude::*;
+use pyo3::exceptions::PyStopAsyncIteration;
 use pyo3_asyncio::tokio::future_into_py;
 use pyo3::types::{PyDict, PyList};
-use tokio::time::{sleep, Duration};
-use crate::query::{QueryExecutor, ParsedQuery};
-use crate::types::CQLiteRow;
+use futures::stream::{self, StreamExt, TryStreamExt};
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex};
+use std::time::Instant;
+use tokio::task::JoinHandle;
+use tokio::time::Duration;
+use crate::query::{QueryExecutor, ParsedQuery, PlanCache, ScanCursor, PLAN_CACHE_CAPACITY};
+use crate::types::{rows_to_pycolumns, rows_to_pylist, CQLiteRow};
 use crate::errors::QueryError;
 
 /// Async support for CQLite Python bindings
@@ -12,26 +19,95 @@ use crate::errors::QueryError;
 /// memory-efficient processing of large SSTable files through streaming
 /// and concurrent operations.
 
+/// Rows fetched per scan batch in `execute_with_progress`
+const PROGRESS_SCAN_BATCH_ROWS: u32 = 8192;
+/// Emit a progress callback after this many rows...
+const PROGRESS_EMIT_ROWS: usize = 1 << 16;
+/// ...or after this much time, whichever comes first
+const PROGRESS_EMIT_INTERVAL: Duration = Duration::from_millis(50);
+
+/// Run a query on tokio's blocking pool.
+///
+/// SSTable scans issue blocking reads against the Data.db file; running them
+/// inline in an async task would stall the runtime worker (and with it every
+/// other future the asyncio loop is awaiting). Offloading the whole
+/// scan to the blocking pool keeps the async workers free to drive
+/// completions while the reads are in flight.
+async fn run_query_blocking(
+    executor: Arc<QueryExecutor>,
+    mut parsed_query: ParsedQuery,
+    offset: Option<u32>,
+    limit: Option<u32>,
+) -> PyResult<Vec<CQLiteRow>> {
+    if offset.is_some() {
+        parsed_query.offset = offset;
+    }
+    if limit.is_some() {
+        parsed_query.limit = limit;
+    }
+    
+    tokio::task::spawn_blocking(move || executor.execute_query(parsed_query))
+        .await
+        .map_err(|_| QueryError::new_err("Query task failed"))?
+}
+
+/// Resume a query's scan for one chunk on the blocking pool
+///
+/// Returns the chunk's rows and whether the scan is now exhausted.
+fn spawn_chunk_scan(
+    executor: Arc<QueryExecutor>,
+    parsed_query: Arc<ParsedQuery>,
+    cursor: Arc<Mutex<ScanCursor>>,
+    chunk_size: u32,
+) -> JoinHandle<(Vec<CQLiteRow>, bool)> {
+    tokio::task::spawn_blocking(move || {
+        let mut cursor = cursor.lock().unwrap();
+        let rows = executor.next_batch(&parsed_query, &mut cursor, chunk_size);
+        (rows, cursor.is_finished())
+    })
+}
+
 /// Async query iterator for streaming large result sets
+///
+/// Each step yields one chunk of up to `chunk_size` rows: a list of row dicts,
+/// or with `columnar=True` a dict of column name -> list of values. The
+/// chunk is converted to Python objects in one pass, so consumers pay one
+/// await per chunk rather than per row. Chunks continue the scan from a
+/// shared `ScanCursor`, so each source row is read once however many
+/// chunks the result spans.
+///
+/// While the caller processes a chunk, the scan for the next one is already
+/// running on the blocking pool, so SSTable reads overlap with consumer work
+/// instead of starting only when the next chunk is requested. At most one
+/// read-ahead scan is in flight per iterator.
 #[pyclass]
 pub struct AsyncQueryIterator {
     sstable_path: String,
     sql: String,
     chunk_size: u32,
-    current_offset: u32,
-    finished: bool,
+    columnar: bool,
+    finished: Arc<AtomicBool>,
+    executor: Option<Arc<QueryExecutor>>,
+    parsed_query: Option<Arc<ParsedQuery>>,
+    cursor: Option<Arc<Mutex<ScanCursor>>>,
+    read_ahead: Arc<Mutex<Option<JoinHandle<(Vec<CQLiteRow>, bool)>>>>,
 }
 
 #[pymethods]
 impl AsyncQueryIterator {
     #[new]
-    fn new(sstable_path: String, sql: String, chunk_size: u32) -> Self {
+    #[pyo3(signature = (sstable_path, sql, chunk_size, columnar=false))]
+    fn new(sstable_path: String, sql: String, chunk_size: u32, columnar: bool) -> Self {
         AsyncQueryIterator {
             sstable_path,
             sql,
-            chunk_size,
-            current_offset: 0,
-            finished: false,
+            chunk_size: chunk_size.max(1),
+            columnar,
+            finished: Arc::new(AtomicBool::new(false)),
+            executor: None,
+            parsed_query: None,
+            cursor: None,
+            read_ahead: Arc::new(Mutex::new(None)),
         }
     }
     
@@ -42,41 +118,70 @@ impl AsyncQueryIterator {
     
     /// Async next method
     fn __anext__(&mut self, py: Python) -> PyResult<PyObject> {
-        let sstable_path = self.sstable_path.clone();
-        let sql = self.sql.clone();
+        if self.finished.load(Ordering::Acquire) {
+            return Err(PyStopAsyncIteration::new_err("No more items"));
+        }
+        
+        // Open the SSTable and parse the query once, reusing both for every chunk
+        let executor = match &self.executor {
+            Some(executor) => executor.clone(),
+            None => {
+                let executor = Arc::new(QueryExecutor::new(&self.sstable_path)?);
+                self.executor = Some(executor.clone());
+                executor
+            }
+        };
+        let parsed_query = match &self.parsed_query {
+            Some(parsed_query) => parsed_query.clone(),
+            None => {
+                let parsed_query = Arc::new(executor.parse_sql(&self.sql)?);
+                self.parsed_query = Some(parsed_query.clone());
+                parsed_query
+            }
+        };
+        let cursor = self
+            .cursor
+            .get_or_insert_with(|| Arc::new(Mutex::new(ScanCursor::new(&parsed_query))))
+            .clone();
         let chunk_size = self.chunk_size;
-        let current_offset = self.current_offset;
-        let finished = self.finished;
+        let columnar = self.columnar;
+        let finished = self.finished.clone();
+        let read_ahead = self.read_ahead.clone();
         
         future_into_py(py, async move {
-            if finished {
-                return Err(PyStopAsyncIteration::new_err("No more items"));
-            }
-            
-            // Create executor and execute query chunk
-            let executor = QueryExecutor::new(&sstable_path)?;
-            let mut parsed_query = executor.parse_sql(&sql)?;
+            // Take the chunk scanned ahead of time, or scan it now
+            let pending = read_ahead.lock().unwrap().take();
+            let scan = match pending {
+                Some(scan) => scan,
+                None => spawn_chunk_scan(
+                    executor.clone(),
+                    parsed_query.clone(),
+                    cursor.clone(),
+                    chunk_size,
+                ),
+            };
+            let (results, exhausted) = scan
+                .await
+                .map_err(|_| QueryError::new_err("Query task failed"))?;
             
-            // Apply offset and limit for this chunk
-            parsed_query.offset = Some(current_offset);
-            parsed_query.limit = Some(chunk_size);
+            if exhausted {
+                finished.store(true, Ordering::Release);
+            } else {
+                // Start on the next chunk while the caller handles this one
+                *read_ahead.lock().unwrap() =
+                    Some(spawn_chunk_scan(executor, parsed_query, cursor, chunk_size));
+            }
             
-            // Execute query
-            let results = executor.execute_query(parsed_query)?;
+            if results.is_empty() {
+                return Err(PyStopAsyncIteration::new_err("No more items"));
+            }
             
-            // Convert results to Python objects
+            // Convert the whole chunk to Python objects at once
             Python::with_gil(|py| {
-                let py_rows = PyList::empty(py);
-                for row in &results {
-                    py_rows.append(row.to_pydict(py)?)?;
-                }
-                
-                // Check if we're done
-                if results.len() < chunk_size as usize {
-                    // This was the last chunk
-                    Ok(py_rows.into())
+                if columnar {
+                    rows_to_pycolumns(py, &results)
                 } else {
-                    Ok(py_rows.into())
+                    rows_to_pylist(py, &results)
                 }
             })
         })
@@ -95,6 +200,30 @@ impl AsyncQueryIterator {
 pub struct AsyncQueryExecutor {
     sstable_path: String,
     max_concurrent: usize,
+    executor: Mutex<Option<Arc<QueryExecutor>>>,
+    prepared: Mutex<PlanCache>,
+}
+
+impl AsyncQueryExecutor {
+    /// Open the SSTable on first use and share the executor afterwards
+    fn shared_executor(&self) -> PyResult<Arc<QueryExecutor>> {
+        let mut slot = self.executor.lock().unwrap();
+        if let Some(executor) = slot.as_ref() {
+            return Ok(executor.clone());
+        }
+        
+        let executor = Arc::new(QueryExecutor::new(&self.sstable_path)?);
+        *slot = Some(executor.clone());
+        Ok(executor)
+    }
+    
+    /// Get the plan for a statement, from the prepared cache if present
+    fn plan_for(&self, executor: &QueryExecutor, sql: &str) -> PyResult<ParsedQuery> {
+        if let Some(parsed_query) = self.prepared.lock().unwrap().get(sql) {
+            return Ok(parsed_query);
+        }
+        executor.parse_sql(sql)
+    }
 }
 
 #[pymethods]
@@ -104,84 +233,163 @@ impl AsyncQueryExecutor {
         AsyncQueryExecutor {
             sstable_path,
             max_concurrent: max_concurrent.unwrap_or(4),
+            executor: Mutex::new(None),
+            prepared: Mutex::new(PlanCache::new(PLAN_CACHE_CAPACITY)),
         }
     }
     
+    /// Open the SSTable (header, metadata) now instead of on the first query
+    fn open(&self) -> PyResult<()> {
+        self.shared_executor().map(|_| ())
+    }
+    
+    /// Parse and plan a statement once and cache the plan for later executions
+    ///
+    /// At most `PLAN_CACHE_CAPACITY` plans are kept; preparing past that
+    /// evicts the least recently used one, which is simply re-planned on its
+    /// next execution.
+    fn prepare(&self, sql: String) -> PyResult<()> {
+        let executor = self.shared_executor()?;
+        let parsed_query = executor.parse_sql(&sql)?;
+        self.prepared.lock().unwrap().insert(&sql, parsed_query);
+        Ok(())
+    }
+    
+    /// Whether a statement has a cached plan
+    fn is_prepared(&self, sql: String) -> bool {
+        self.prepared.lock().unwrap().contains(&sql)
+    }
+    
+    /// Count the rows a query would return, without materializing them
+    ///
+    /// The statement is parsed and its plan rewritten to a count (see
+    /// `ParsedQuery::into_count`), so any SELECT works regardless of its
+    /// projection or formatting. Rows are counted by a filter-only scan on
+    /// the blocking pool that never projects rows or builds Python objects.
+    fn count_only(&self, py: Python, sql: String) -> PyResult<PyObject> {
+        let executor = self.shared_executor()?;
+        let parsed_query = self.plan_for(&executor, &sql)?.into_count();
+        
+        future_into_py(py, async move {
+            let count = tokio::task::spawn_blocking(move || {
+                executor.count_matching(&parsed_query, None)
+            })
+            .await
+            .map_err(|_| QueryError::new_err("Count task failed"))??;
+            
+            Ok(Python::with_gil(|py| count.into_py(py)))
+        })
+    }
+    
+    /// Check whether a query matches at least one row
+    ///
+    /// The filter-only scan stops at the first match.
+    fn any_match(&self, py: Python, sql: String) -> PyResult<PyObject> {
+        let executor = self.shared_executor()?;
+        let parsed_query = self.plan_for(&executor, &sql)?.into_count();
+        
+        future_into_py(py, async move {
+            let found = tokio::task::spawn_blocking(move || {
+                executor.any_match(&parsed_query)
+            })
+            .await
+            .map_err(|_| QueryError::new_err("Count task failed"))??;
+            
+            Ok(Python::with_gil(|py| found.into_py(py)))
+        })
+    }
+    
     /// Execute multiple queries concurrently
+    ///
+    /// All queries in the batch share a single executor (one open of the
+    /// SSTable), and identical statements are scanned once with the result
+    /// fanned out to every position that asked for it. `max_concurrent` caps
+    /// the number of scans in flight on the blocking pool.
     fn execute_concurrent(&self, py: Python, queries: Vec<String>) -> PyResult<PyObject> {
-        let sstable_path = self.sstable_path.clone();
+        let executor = self.shared_executor()?;
         let max_concurrent = self.max_concurrent;
         
+        // Map each query to the slot of its first occurrence and plan it once
+        let mut unique_plans: Vec<ParsedQuery> = Vec::new();
+        let mut slot_by_sql: HashMap<String, usize> = HashMap::new();
+        let mut slots = Vec::with_capacity(queries.len());
+        for sql in queries {
+            let slot = match slot_by_sql.get(&sql) {
+                Some(&slot) => slot,
+                None => {
+                    unique_plans.push(self.plan_for(&executor, &sql)?);
+                    slot_by_sql.insert(sql, unique_plans.len() - 1);
+                    unique_plans.len() - 1
+                }
+            };
+            slots.push(slot);
+        }
+        
         future_into_py(py, async move {
-            let mut tasks = Vec::new();
+            // Create semaphore to limit concurrent scans
+            let semaphore = Arc::new(tokio::sync::Semaphore::new(max_concurrent));
+            let mut tasks = Vec::with_capacity(unique_plans.len());
             
-            // Create semaphore to limit concurrent queries
-            let semaphore = std::sync::Arc::new(tokio::sync::Semaphore::new(max_concurrent));
-            
-            for sql in queries {
-                let sstable_path = sstable_path.clone();
+            for parsed_query in unique_plans {
+                let executor = executor.clone();
                 let semaphore = semaphore.clone();
                 
                 let task = tokio::spawn(async move {
                     let _permit = semaphore.acquire().await.unwrap();
                     
-                    // Execute query
-                    let executor = QueryExecutor::new(&sstable_path)?;
-                    let parsed_query = executor.parse_sql(&sql)?;
-                    let results = executor.execute_query(parsed_query)?;
-                    
-                    // Convert to Python objects
-                    Python::with_gil(|py| {
-                        let py_rows = PyList::empty(py);
-                        for row in &results {
-                            py_rows.append(row.to_pydict(py)?)?;
-                        }
-                        Ok::<PyObject, PyErr>(py_rows.into())
-                    })
+                    tokio::task::spawn_blocking(move || executor.execute_query(parsed_query))
+                        .await
+                        .map_err(|_| QueryError::new_err("Task execution failed"))?
                 });
                 
                 tasks.push(task);
             }
             
             // Wait for all tasks to complete
-            let mut all_results = Vec::new();
+            let mut unique_results = Vec::with_capacity(tasks.len());
             for task in tasks {
                 match task.await {
-                    Ok(Ok(result)) => all_results.push(result),
+                    Ok(Ok(result)) => unique_results.push(result),
                     Ok(Err(err)) => return Err(err),
                     Err(_) => return Err(QueryError::new_err("Task execution failed")),
                 }
             }
             
+            // Each position gets its own list so callers can mutate results independently
             Python::with_gil(|py| {
-                let py_results = PyList::new(py, all_results);
+                let py_results = PyList::empty(py);
+                for slot in slots {
+                    py_results.append(rows_to_pylist(py, &unique_results[slot])?)?;
+                }
                 Ok(py_results.into())
             })
         })
     }
     
+    /// Execute query
+    fn execute(&self, py: Python, sql: String) -> PyResult<PyObject> {
+        let executor = self.shared_executor()?;
+        let parsed_query = self.plan_for(&executor, &sql)?;
+        
+        future_into_py(py, async move {
+            let results = run_query_blocking(executor, parsed_query, None, None).await?;
+            Python::with_gil(|py| rows_to_pylist(py, &results))
+        })
+    }
+    
     /// Execute query with timeout
     fn execute_with_timeout(&self, py: Python, sql: String, timeout_seconds: f64) -> PyResult<PyObject> {
-        let sstable_path = self.sstable_path.clone();
+        let executor = self.shared_executor()?;
+        let parsed_query = self.plan_for(&executor, &sql)?;
         
         future_into_py(py, async move {
             let timeout_duration = Duration::from_secs_f64(timeout_seconds);
             
-            let query_future = async {
-                let executor = QueryExecutor::new(&sstable_path)?;
-                let parsed_query = executor.parse_sql(&sql)?;
-                executor.execute_query(parsed_query)
-            };
+            let query_future = run_query_blocking(executor, parsed_query, None, None);
             
             match tokio::time::timeout(timeout_duration, query_future).await {
                 Ok(Ok(results)) => {
-                    Python::with_gil(|py| {
-                        let py_rows = PyList::empty(py);
-                        for row in &results {
-                            py_rows.append(row.to_pydict(py)?)?;
-                        }
-                        Ok(py_rows.into())
-                    })
+                    Python::with_gil(|py| rows_to_pylist(py, &results))
                 }
                 Ok(Err(err)) => Err(err),
                 Err(_) => Err(QueryError::new_err(format!(
@@ -191,9 +399,35 @@ impl AsyncQueryExecutor {
         })
     }
     
+    /// Execute query and return the result column-wise
+    ///
+    /// Resolves to a dict of column name -> list of values, built one column
+    /// at a time; no per-row dicts are created.
+    fn execute_columns(&self, py: Python, sql: String) -> PyResult<PyObject> {
+        let executor = self.shared_executor()?;
+        let parsed_query = self.plan_for(&executor, &sql)?;
+        
+        future_into_py(py, async move {
+            let results = run_query_blocking(executor, parsed_query, None, None).await?;
+            Python::with_gil(|py| rows_to_pycolumns(py, &results))
+        })
+    }
+    
     /// Execute query with progress callback
+    ///
+    /// The scan runs in batches on the blocking pool, resuming from one
+    /// `ScanCursor` so every source row is read once. The callback is only
+    /// invoked between batches, once `PROGRESS_EMIT_ROWS` rows have been read
+    /// or `PROGRESS_EMIT_INTERVAL` has elapsed since the last call, whichever
+    /// comes first. The GIL is taken only at emit time, so callback cost stays
+    /// flat no matter how fast rows arrive.
+    ///
+    /// There is no row total to divide by before the scan ends, so the
+    /// reported fraction only advances for a LIMIT query (rows read / limit);
+    /// otherwise it stays at 0.0 and the message carries the running count.
     fn execute_with_progress(&self, py: Python, sql: String, callback: PyObject) -> PyResult<PyObject> {
-        let sstable_path = self.sstable_path.clone();
+        let executor = self.shared_executor()?;
+        let parsed_query = self.plan_for(&executor, &sql)?;
         
         future_into_py(py, async move {
             // Start progress reporting
@@ -201,48 +435,125 @@ impl AsyncQueryExecutor {
                 callback.call1(py, (0.0, "Starting query execution..."))
             })?;
             
-            // Simulate progress updates during query execution
-            for i in 1..=5 {
-                sleep(Duration::from_millis(100)).await;
-                
-                let progress = i as f64 * 0.2;
-                let message = match i {
-                    1 => "Parsing SQL...",
-                    2 => "Opening SSTable...",
-                    3 => "Reading data...",
-                    4 => "Processing results...",
-                    5 => "Finalizing...",
-                    _ => "Working...",
-                };
+            let limit = parsed_query.limit;
+            let cursor = Arc::new(Mutex::new(ScanCursor::new(&parsed_query)));
+            let parsed_query = Arc::new(parsed_query);
+            
+            let mut results = Vec::new();
+            let mut rows_at_last_emit = 0usize;
+            let mut last_emit = Instant::now();
+            
+            loop {
+                let (batch, exhausted) = spawn_chunk_scan(
+                    executor.clone(),
+                    parsed_query.clone(),
+                    cursor.clone(),
+                    PROGRESS_SCAN_BATCH_ROWS,
+                )
+                .await
+                .map_err(|_| QueryError::new_err("Query task failed"))?;
+                results.extend(batch);
+                if exhausted {
+                    break;
+                }
                 
-                Python::with_gil(|py| {
-                    callback.call1(py, (progress, message))
-                })?;
+                if results.len() - rows_at_last_emit >= PROGRESS_EMIT_ROWS
+                    || last_emit.elapsed() >= PROGRESS_EMIT_INTERVAL
+                {
+                    let progress = match limit {
+                        Some(limit) if limit > 0 => (results.len() as f64 / limit as f64).min(0.99),
+                        _ => 0.0,
+                    };
+                    let message = format!("Read {} rows...", results.len());
+                    Python::with_gil(|py| callback.call1(py, (progress, message)))?;
+                    
+                    rows_at_last_emit = results.len();
+                    last_emit = Instant::now();
+                }
             }
             
-            // Execute actual query
-            let executor = QueryExecutor::new(&sstable_path)?;
-            let parsed_query = executor.parse_sql(&sql)?;
-            let results = executor.execute_query(parsed_query)?;
-            
             // Final progress update
             Python::with_gil(|py| {
                 callback.call1(py, (1.0, "Query completed!"))?;
-                
-                let py_rows = PyList::empty(py);
-                for row in &results {
-                    py_rows.append(row.to_pydict(py)?)?;
-                }
-                Ok(py_rows.into())
+                rows_to_pylist(py, &results)
             })
         })
     }
 }
 
+/// An SSTable of a batch, opened on first use and then kept open
+///
+/// Opening lazily means a bad path fails only the calls that reach it,
+/// with that file's error, rather than the construction of the batch.
+struct BatchFile {
+    path: String,
+    executor: Mutex<Option<Arc<QueryExecutor>>>,
+}
+
+impl BatchFile {
+    fn new(path: String) -> Self {
+        BatchFile {
+            path,
+            executor: Mutex::new(None),
+        }
+    }
+    
+    /// The open executor for this file, opening it on the first call
+    fn open(&self) -> PyResult<Arc<QueryExecutor>> {
+        let mut executor = self.executor.lock().unwrap();
+        if let Some(executor) = executor.as_ref() {
+            return Ok(executor.clone());
+        }
+        let opened = Arc::new(QueryExecutor::new(&self.path)?);
+        *executor = Some(opened.clone());
+        Ok(opened)
+    }
+}
+
+/// Run `scan` against every file on the blocking pool
+///
+/// Scans are pulled from a stream with at most `max_concurrent` in flight,
+/// spread across the blocking pool's threads with the GIL released. Only the
+/// in-flight scans exist as tasks, so fanning out over thousands of files
+/// doesn't park a task per file on a semaphore. Results are returned in file
+/// order, and the first failure (including a file that can't be opened)
+/// ends the batch.
+async fn scan_each<T, F>(
+    files: Vec<Arc<BatchFile>>,
+    max_concurrent: usize,
+    scan: F,
+) -> PyResult<Vec<T>>
+where
+    T: Send + 'static,
+    F: Fn(&QueryExecutor) -> PyResult<T> + Send + Sync + 'static,
+{
+    let scan = Arc::new(scan);
+    
+    stream::iter(files)
+        .map(|file| {
+            let scan = scan.clone();
+            async move {
+                tokio::task::spawn_blocking(move || scan(&*file.open()?))
+                    .await
+                    .map_err(|_| QueryError::new_err("Batch processing failed"))?
+            }
+        })
+        .buffered(max_concurrent.max(1))
+        .try_collect()
+        .await
+}
+
 /// Async batch processor for multiple SSTable files
+///
+/// Each file is opened the first time a call scans it, and its executor is
+/// then shared by all later calls. Scans from all files run side by side on
+/// the blocking pool, and `max_concurrent` caps the number of scans in
+/// flight (i.e. outstanding reads), not the number of files.
 #[pyclass]
 pub struct AsyncBatchProcessor {
     sstable_paths: Vec<String>,
+    files: Vec<Arc<BatchFile>>,
+    #[pyo3(get)]
     max_concurrent: usize,
 }
 
@@ -250,61 +561,93 @@ pub struct AsyncBatchProcessor {
 impl AsyncBatchProcessor {
     #[new]
     fn new(sstable_paths: Vec<String>, max_concurrent: Option<usize>) -> Self {
+        let files = sstable_paths
+            .iter()
+            .map(|path| Arc::new(BatchFile::new(path.clone())))
+            .collect();
+        
         AsyncBatchProcessor {
             sstable_paths,
-            max_concurrent: max_concurrent.unwrap_or(4),
+            files,
+            max_concurrent: max_concurrent.unwrap_or(4).max(1),
         }
     }
     
+    /// Paths of the SSTable files handled by this processor
+    #[getter]
+    fn sstable_paths(&self) -> Vec<String> {
+        self.sstable_paths.clone()
+    }
+    
     /// Process same query across multiple SSTable files
     fn process_all(&self, py: Python, sql: String) -> PyResult<PyObject> {
-        let sstable_paths = self.sstable_paths.clone();
+        let files = self.files.clone();
         let max_concurrent = self.max_concurrent;
         
         future_into_py(py, async move {
-            let semaphore = std::sync::Arc::new(tokio::sync::Semaphore::new(max_concurrent));
-            let mut tasks = Vec::new();
+            let per_file = scan_each(files, max_concurrent, move |executor| {
+                let parsed_query = executor.parse_sql(&sql)?;
+                executor.execute_query(parsed_query)
+            }).await?;
             
-            for sstable_path in sstable_paths {
-                let sql = sql.clone();
-                let semaphore = semaphore.clone();
-                
-                let task = tokio::spawn(async move {
-                    let _permit = semaphore.acquire().await.unwrap();
-                    
-                    let executor = QueryExecutor::new(&sstable_path)?;
-                    let parsed_query = executor.parse_sql(&sql)?;
-                    let results = executor.execute_query(parsed_query)?;
-                    
-                    Ok::<Vec<CQLiteRow>, PyErr>(results)
-                });
-                
-                tasks.push(task);
-            }
+            let all_results: Vec<CQLiteRow> = per_file.into_iter().flatten().collect();
+            Python::with_gil(|py| rows_to_pylist(py, &all_results))
+        })
+    }
+    
+    /// Process same query across multiple SSTable files, keeping results per file
+    ///
+    /// Returns one list of rows per SSTable, in the order the paths were given.
+    fn process_each(&self, py: Python, sql: String) -> PyResult<PyObject> {
+        let files = self.files.clone();
+        let max_concurrent = self.max_concurrent;
+        
+        future_into_py(py, async move {
+            let per_file = scan_each(files, max_concurrent, move |executor| {
+                let parsed_query = executor.parse_sql(&sql)?;
+                executor.execute_query(parsed_query)
+            }).await?;
             
-            // Collect all results
-            let mut all_results = Vec::new();
-            for task in tasks {
-                match task.await {
-                    Ok(Ok(results)) => all_results.extend(results),
-                    Ok(Err(err)) => return Err(err),
-                    Err(_) => return Err(QueryError::new_err("Batch processing failed")),
+            Python::with_gil(|py| {
+                let py_results = PyList::empty(py);
+                for rows in &per_file {
+                    py_results.append(rows_to_pylist(py, rows)?)?;
                 }
-            }
+                Ok(py_results.into())
+            })
+        })
+    }
+    
+    /// Process same query across multiple SSTable files, column-wise
+    ///
+    /// Returns one dict of column name -> list of values per SSTable (files
+    /// without matches are skipped), in path order. Each dict maps directly
+    /// onto an Arrow record batch, so the per-file results can be combined
+    /// into one table without building or concatenating row dicts.
+    fn process_all_columns(&self, py: Python, sql: String) -> PyResult<PyObject> {
+        let files = self.files.clone();
+        let max_concurrent = self.max_concurrent;
+        
+        future_into_py(py, async move {
+            let per_file = scan_each(files, max_concurrent, move |executor| {
+                let parsed_query = executor.parse_sql(&sql)?;
+                executor.execute_query(parsed_query)
+            }).await?;
             
             Python::with_gil(|py| {
-                let py_rows = PyList::empty(py);
-                for row in &all_results {
-                    py_rows.append(row.to_pydict(py)?)?;
+                let py_results = PyList::empty(py);
+                for rows in per_file.iter().filter(|rows| !rows.is_empty()) {
+                    py_results.append(rows_to_pycolumns(py, rows)?)?;
                 }
-                Ok(py_rows.into())
+                Ok(py_results.into())
             })
         })
     }
     
     /// Process with aggregation across files
     fn process_with_aggregation(&self, py: Python, sql: String, agg_function: String) -> PyResult<PyObject> {
-        let sstable_paths = self.sstable_paths.clone();
+        let files = self.files.clone();
+        let max_concurrent = self.max_concurrent;
         
         future_into_py(py, async move {
             // This would implement aggregation functions like SUM, COUNT, AVG
@@ -312,14 +655,11 @@ impl AsyncBatchProcessor {
             
             match agg_function.to_lowercase().as_str() {
                 "count" => {
-                    let mut total_count = 0u64;
-                    
-                    for sstable_path in sstable_paths {
-                        let executor = QueryExecutor::new(&sstable_path)?;
+                    let counts = scan_each(files, max_concurrent, move |executor| {
                         let parsed_query = executor.parse_sql(&sql)?;
-                        let count = executor.execute_count(parsed_query)?;
-                        total_count += count;
-                    }
+                        executor.execute_count(parsed_query)
+                    }).await?;
+                    let total_count: u64 = counts.into_iter().sum();
                     
                     Python::with_gil(|py| {
                         let result = PyDict::new(py);
@@ -335,9 +675,6 @@ impl AsyncBatchProcessor {
     }
 }
 
-/// Custom StopAsyncIteration exception for Python
-pyo3::create_exception!(cqlite, PyStopAsyncIteration, pyo3::exceptions::PyStopIteration);
-
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -349,13 +686,14 @@ mod tests {
             "test.db".to_string(),
             "SELECT * FROM users".to_string(),
             1000,
+            false,
         );
         
         assert_eq!(iterator.sstable_path, "test.db");
         assert_eq!(iterator.sql, "SELECT * FROM users");
         assert_eq!(iterator.chunk_size, 1000);
-        assert_eq!(iterator.current_offset, 0);
-        assert!(!iterator.finished);
+        assert!(iterator.cursor.is_none());
+        assert!(!iterator.finished.load(Ordering::Acquire));
     }
     
     #[test]
@@ -365,4 +703,18 @@ mod tests {
         assert_eq!(executor.sstable_path, "test.db");
         assert_eq!(executor.max_concurrent, 8);
     }
+    
+    #[test]
+    fn test_batch_processor_opens_files_lazily() {
+        let paths = vec!["missing-1-Data.db".to_string(), "missing-2-Data.db".to_string()];
+        let processor = AsyncBatchProcessor::new(paths.clone(), None);
+        
+        // A bad path doesn't fail construction, only the scan that opens it
+        assert_eq!(processor.sstable_paths, paths);
+        assert_eq!(processor.max_concurrent, 4);
+        let err = processor.files[1].open().unwrap_err();
+        Python::with_gil(|py| {
+            assert!(err.value(py).to_string().contains("missing-2-Data.db"));
+        });
+    }
 }
\ No newline at end of file
@@ -37,6 +37,16 @@ impl CsvExporter {
         let results_obj = reader.query(py, sql.to_string(), None, None)?;
         let results_list = results_obj.downcast::<PyList>(py)?;
         
+        self.write_rows(py, results_list, output_path)
+    }
+    
+    /// Write already-fetched result rows to a CSV file
+    pub fn write_rows(
+        &self,
+        py: Python,
+        results_list: &PyList,
+        output_path: &str,
+    ) -> PyResult<PyObject> {
         // Create output file
         let file = File::create(output_path)
             .map_err(|e| QueryError::new_err(format!("Failed to create CSV file: {}", e)))?;
@@ -127,8 +137,13 @@ impl ParquetExporter {
     ) -> PyResult<PyObject> {
         // For Parquet export, we'll use pandas + pyarrow
         // First get results as DataFrame
-        let df = reader.query_df(py, sql.to_string())?;
+        let df = reader.query_df(py, sql.to_string(), false, None)?;
         
+        self.write_frame(py, df.as_ref(py), output_path)
+    }
+    
+    /// Write an already-built DataFrame to a Parquet file
+    pub fn write_frame(&self, py: Python, df: &PyAny, output_path: &str) -> PyResult<PyObject> {
         // Use pandas to_parquet method
         let kwargs = PyDict::new(py);
         kwargs.set_item("compression", &self.compression)?;
@@ -183,6 +198,16 @@ impl JsonExporter {
         let results_obj = reader.query(py, sql.to_string(), None, None)?;
         let results_list = results_obj.downcast::<PyList>(py)?;
         
+        self.write_rows(py, results_list, output_path)
+    }
+    
+    /// Write already-fetched result rows to a JSON file
+    pub fn write_rows(
+        &self,
+        py: Python,
+        results_list: &PyList,
+        output_path: &str,
+    ) -> PyResult<PyObject> {
         // Create output file
         let file = File::create(output_path)
             .map_err(|e| QueryError::new_err(format!("Failed to create JSON file: {}", e)))?;
@@ -286,8 +311,13 @@ impl ExcelExporter {
         output_path: &str,
     ) -> PyResult<PyObject> {
         // Get results as DataFrame
-        let df = reader.query_df(py, sql.to_string())?;
+        let df = reader.query_df(py, sql.to_string(), false, None)?;
         
+        self.write_frame(py, df.as_ref(py), output_path)
+    }
+    
+    /// Write an already-built DataFrame to an Excel file
+    pub fn write_frame(&self, py: Python, df: &PyAny, output_path: &str) -> PyResult<PyObject> {
         // Use pandas to_excel method
         let kwargs = PyDict::new(py);
         kwargs.set_item("sheet_name", &self.sheet_name)?;
@@ -325,7 +355,12 @@ impl ExcelExporter {
 pub struct BatchExporter;
 
 impl BatchExporter {
-    /// Export query results to multiple formats simultaneously
+    /// Export query results to multiple formats from a single scan
+    ///
+    /// The query runs once; every format is written from the same result
+    /// rows, and the DataFrame needed by Parquet/Excel is built at most once.
+    /// Each format reports its own success or error, so one failing writer
+    /// doesn't prevent the others.
     pub fn export_multi_format(
         reader: &SSTableReader,
         py: Python,
@@ -333,45 +368,83 @@ impl BatchExporter {
         output_base_path: &str,
         formats: Vec<String>,
     ) -> PyResult<PyObject> {
-        let mut export_results = Vec::new();
+        let summary = PyDict::new(py);
         
-        for format in formats {
+        let results_obj = match reader.query(py, sql.to_string(), None, None) {
+            Ok(obj) => obj,
+            Err(e) => {
+                let message = e.value(py).to_string();
+                for format in &formats {
+                    summary.set_item(format, Self::failure(py, &message)?)?;
+                }
+                return Ok(summary.into());
+            }
+        };
+        let results_list = results_obj.downcast::<PyList>(py)?;
+        let mut frame: Option<PyObject> = None;
+        
+        for format in &formats {
             let output_path = format!("{}.{}", output_base_path, format);
             
             let result = match format.as_str() {
                 "csv" => {
                     let exporter = CsvExporter::new(",".to_string(), true);
-                    exporter.export(reader, py, sql, &output_path)?
+                    exporter.write_rows(py, results_list, &output_path)
                 }
                 "json" => {
                     let exporter = JsonExporter::new("lines".to_string());
-                    exporter.export(reader, py, sql, &output_path)?
+                    exporter.write_rows(py, results_list, &output_path)
                 }
                 "parquet" => {
                     let exporter = ParquetExporter::new("snappy".to_string());
-                    exporter.export(reader, py, sql, &output_path)?
+                    Self::frame(py, results_list, &mut frame)
+                        .and_then(|df| exporter.write_frame(py, df.as_ref(py), &output_path))
                 }
                 "excel" => {
                     let exporter = ExcelExporter::new(None, false);
-                    exporter.export(reader, py, sql, &output_path)?
-                }
-                _ => {
-                    return Err(QueryError::new_err(format!(
-                        "Unsupported export format: {}", format
-                    )));
+                    Self::frame(py, results_list, &mut frame)
+                        .and_then(|df| exporter.write_frame(py, df.as_ref(py), &output_path))
                 }
+                _ => Err(QueryError::new_err(format!("Unsupported format: {}", format))),
             };
             
-            export_results.push(result);
+            let entry = match result {
+                Ok(stats) => {
+                    let entry = PyDict::new(py);
+                    entry.set_item("success", true)?;
+                    entry.set_item("output_path", &output_path)?;
+                    entry.set_item("stats", stats)?;
+                    entry.into()
+                }
+                Err(e) => Self::failure(py, &e.value(py).to_string())?,
+            };
+            summary.set_item(format, entry)?;
         }
         
-        // Return summary of all exports
-        let summary = PyDict::new(py);
-        summary.set_item("exports", PyList::new(py, export_results))?;
-        summary.set_item("total_formats", formats.len())?;
-        
         Ok(summary.into())
     }
+    
+    /// Build the pandas DataFrame for the shared result rows on first use
+    fn frame(py: Python, results_list: &PyList, frame: &mut Option<PyObject>) -> PyResult<PyObject> {
+        if let Some(df) = frame {
+            return Ok(df.clone_ref(py));
+        }
+        
+        let pandas = py.import("pandas")
+            .map_err(|_| QueryError::new_err(
+                "pandas not available. Install with: pip install pandas"
+            ))?;
+        let df: PyObject = pandas.call_method1("DataFrame", (results_list,))?.into();
+        *frame = Some(df.clone_ref(py));
+        Ok(df)
+    }
+    
+    fn failure(py: Python, message: &str) -> PyResult<PyObject> {
+        let entry = PyDict::new(py);
+        entry.set_item("success", false)?;
+        entry.set_item("error", message)?;
+        Ok(entry.into())
+    }
 }
 
 #[cfg(test)]
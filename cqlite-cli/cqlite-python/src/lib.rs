@@ -12,7 +12,8 @@ mod errors;
 mod async_support;
 mod exports;
 
-use reader::SSTableReader;
+use reader::{SSTableReader, SSTableRowIter, SSTableBatchIter};
+use async_support::{AsyncQueryIterator, AsyncQueryExecutor, AsyncBatchProcessor};
 use errors::{CQLiteError, SchemaError, QueryError, SSTableError};
 
 /// CQLite Python module - The world's first Python package for direct SSTable querying!
@@ -32,6 +33,13 @@ use errors::{CQLiteError, SchemaError, QueryError, SSTableError};
 fn _core(_py: Python, m: &PyModule) -> PyResult<()> {
     // Main reader class
     m.add_class::<SSTableReader>()?;
+    m.add_class::<SSTableRowIter>()?;
+    m.add_class::<SSTableBatchIter>()?;
+    
+    // Async query classes (wrapped by cqlite.async_support)
+    m.add_class::<AsyncQueryIterator>()?;
+    m.add_class::<AsyncQueryExecutor>()?;
+    m.add_class::<AsyncBatchProcessor>()?;
     
     // Exception types
     m.add("CQLiteError", _py.get_type::<CQLiteError>())?;
@@ -43,6 +51,7 @@ fn _core(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(discover_sstables, m)?)?;
     m.add_function(wrap_pyfunction!(infer_schema, m)?)?;
     m.add_function(wrap_pyfunction!(validate_sstable, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_sstables, m)?)?;
     
     // Version info
     m.add("__version__", "0.1.0")?;
@@ -65,34 +74,49 @@ fn discover_sstables(py: Python, directory: &str) -> PyResult<PyObject> {
         return Err(PyIOError::new_err(format!("Directory not found: {}", directory)));
     }
     
-    let mut sstables = Vec::new();
-    
-    // Scan for SSTable files (Data.db files)
-    if let Ok(entries) = std::fs::read_dir(path) {
-        for entry in entries.flatten() {
-            let file_path = entry.path();
-            if let Some(file_name) = file_path.file_name() {
-                if let Some(name_str) = file_name.to_str() {
+    // Directory listing and per-file stats don't need the GIL
+    let found = py.allow_threads(|| {
+        let mut candidates = Vec::new();
+        
+        // Scan for SSTable files (Data.db files)
+        if let Ok(entries) = std::fs::read_dir(path) {
+            for entry in entries.flatten() {
+                let file_path = entry.path();
+                if let Some(name_str) = file_path.file_name().and_then(|n| n.to_str()) {
                     if name_str.ends_with("-Data.db") {
-                        let metadata = PyDict::new(py);
-                        metadata.set_item("path", file_path.to_string_lossy().to_string())?;
-                        metadata.set_item("name", name_str)?;
-                        
-                        // Try to extract table name from filename
-                        if let Some(table_name) = extract_table_name(name_str) {
-                            metadata.set_item("table", table_name)?;
-                        }
-                        
-                        // Add file size
-                        if let Ok(meta) = entry.metadata() {
-                            metadata.set_item("size_bytes", meta.len())?;
-                        }
-                        
-                        sstables.push(metadata.into());
+                        let name = name_str.to_string();
+                        candidates.push((file_path, name));
                     }
                 }
             }
         }
+        
+        candidates
+            .into_iter()
+            .map(|(file_path, name)| {
+                let size = std::fs::metadata(&file_path).map(|meta| meta.len()).ok();
+                ((file_path, name), size)
+            })
+            .collect::<Vec<_>>()
+    });
+    
+    let mut sstables = Vec::with_capacity(found.len());
+    for ((file_path, name_str), size) in found {
+        let metadata = PyDict::new(py);
+        metadata.set_item("path", file_path.to_string_lossy().to_string())?;
+        metadata.set_item("name", &name_str)?;
+        
+        // Try to extract table name from filename
+        if let Some(table_name) = extract_table_name(&name_str) {
+            metadata.set_item("table", table_name)?;
+        }
+        
+        // Add file size
+        if let Some(size) = size {
+            metadata.set_item("size_bytes", size)?;
+        }
+        
+        sstables.push(metadata.into());
     }
     
     Ok(PyList::new(py, sstables).into())
@@ -128,16 +152,57 @@ fn infer_schema(py: Python, sstable_path: &str) -> PyResult<PyObject> {
 ///     dict: Validation results
 #[pyfunction]
 fn validate_sstable(py: Python, sstable_path: &str) -> PyResult<PyObject> {
+    let file_size = py.allow_threads(|| check_sstable(sstable_path))
+        .map_err(PyIOError::new_err)?;
+    
+    validation_result(py, Ok(file_size))
+}
+
+/// Validate several SSTable files in one call
+/// 
+/// The file checks run with the GIL released. A missing file is reported as
+/// an invalid result instead of raising, so one bad path doesn't hide the
+/// others.
+/// 
+/// Args:
+///     sstable_paths (List[str]): Paths to SSTable Data.db files
+///     
+/// Returns:
+///     List[dict]: Validation results, in the same order as `sstable_paths`
+#[pyfunction]
+fn validate_sstables(py: Python, sstable_paths: Vec<String>) -> PyResult<PyObject> {
+    let checks: Vec<_> = py.allow_threads(|| sstable_paths.iter().map(|p| check_sstable(p)).collect());
+    
+    let results = checks
+        .into_iter()
+        .map(|check| validation_result(py, check))
+        .collect::<PyResult<Vec<_>>>()?;
+    
+    Ok(PyList::new(py, results).into())
+}
+
+/// Check that an SSTable file exists and return its size
+fn check_sstable(sstable_path: &str) -> Result<u64, String> {
     let path = Path::new(sstable_path);
     if !path.exists() {
-        return Err(PyIOError::new_err(format!("SSTable not found: {}", sstable_path)));
+        return Err(format!("SSTable not found: {}", sstable_path));
     }
     
+    Ok(path.metadata().map(|m| m.len()).unwrap_or(0))
+}
+
+/// Build the validation dict for one file check
+fn validation_result(py: Python, check: Result<u64, String>) -> PyResult<PyObject> {
+    let (valid, errors, file_size) = match check {
+        Ok(file_size) => (true, Vec::new(), file_size),
+        Err(message) => (false, vec![message], 0),
+    };
+    
     let result = PyDict::new(py);
-    result.set_item("valid", true)?;
-    result.set_item("errors", PyList::empty(py))?;
+    result.set_item("valid", valid)?;
+    result.set_item("errors", PyList::new(py, errors))?;
     result.set_item("warnings", PyList::empty(py))?;
-    result.set_item("file_size", path.metadata().map(|m| m.len()).unwrap_or(0))?;
+    result.set_item("file_size", file_size)?;
     
     Ok(result.into())
 }
@@ -1,7 +1,8 @@
 use crate::errors::{QueryError, SSTableError};
 use crate::types::{CQLiteRow, CQLValue};
 use pyo3::PyResult;
-use std::collections::HashMap;
+use std::cmp::Ordering;
+use std::collections::{HashMap, HashSet, VecDeque};
 
 /// Query execution engine for SSTable files
 /// 
@@ -19,6 +20,39 @@ pub struct ParsedQuery {
     pub order_by: Option<Vec<OrderByColumn>>,
 }
 
+impl ParsedQuery {
+    /// Columns the scan has to decode for this query, or None for all of them
+    ///
+    /// That is the projection plus any column the WHERE clause reads.
+    pub fn scan_columns(&self) -> Option<HashSet<&str>> {
+        if self.select_columns.iter().any(|c| c == "*") {
+            return None;
+        }
+        
+        let mut columns = self.filter_columns();
+        columns.extend(self.select_columns.iter().map(String::as_str));
+        Some(columns)
+    }
+    
+    /// Rewrite this plan to count its rows instead of returning them
+    ///
+    /// The projection and ORDER BY don't affect how many rows match, so they
+    /// are dropped; WHERE, LIMIT and OFFSET are kept since they do.
+    pub fn into_count(mut self) -> ParsedQuery {
+        self.select_columns = vec!["*".to_string()];
+        self.order_by = None;
+        self
+    }
+    
+    /// Columns read by the WHERE clause
+    pub fn filter_columns(&self) -> HashSet<&str> {
+        self.where_clause
+            .iter()
+            .flat_map(|w| w.conditions.iter().map(|c| c.column.as_str()))
+            .collect()
+    }
+}
+
 #[derive(Debug)]
 pub struct WhereClause {
     pub conditions: Vec<Condition>,
@@ -53,6 +87,414 @@ pub enum ComparisonOperator {
     ContainsKey,
 }
 
+/// Rows per block read by the scan and handed to the block filter
+const FILTER_BLOCK_ROWS: usize = 256;
+
+/// Blocks smaller than this are filtered row-at-a-time; per-condition passes
+/// don't pay for themselves on a handful of rows
+const FILTER_BATCH_THRESHOLD: usize = 100;
+
+/// Number of rows in the (mock) SSTable scan
+const MOCK_ROW_COUNT: i32 = 10;
+
+impl WhereClause {
+    /// Evaluate the WHERE clause against a single row
+    pub fn matches(&self, row: &CQLiteRow) -> bool {
+        match self.operator {
+            LogicalOperator::And => self.conditions.iter().all(|c| c.matches(row)),
+            LogicalOperator::Or => self.conditions.iter().any(|c| c.matches(row)),
+        }
+    }
+    
+    /// Reorder AND conditions so the cheapest, most selective ones run first
+    ///
+    /// Evaluation short-circuits on the first false condition, so putting an
+    /// equality on a fixed-width value ahead of a range or LIKE skips the
+    /// expensive tests for most rows. The sort is stable, and OR clauses are
+    /// left untouched.
+    pub fn order_by_cost(&mut self) {
+        if matches!(self.operator, LogicalOperator::And) {
+            self.conditions.sort_by_key(Condition::evaluation_cost);
+        }
+    }
+}
+
+impl Condition {
+    /// Relative cost/selectivity rank used to order AND conditions (lower first)
+    ///
+    /// Equality on fixed-width values < equality on text < IN < ranges <
+    /// negations < pattern and collection matching.
+    pub fn evaluation_cost(&self) -> u8 {
+        match self.operator {
+            ComparisonOperator::Equal => match self.value {
+                CQLValue::Text(_) => 1,
+                _ => 0,
+            },
+            ComparisonOperator::In => 2,
+            ComparisonOperator::LessThan
+            | ComparisonOperator::LessThanOrEqual
+            | ComparisonOperator::GreaterThan
+            | ComparisonOperator::GreaterThanOrEqual => 3,
+            ComparisonOperator::NotEqual | ComparisonOperator::NotIn => 4,
+            ComparisonOperator::Like
+            | ComparisonOperator::Contains
+            | ComparisonOperator::ContainsKey => 5,
+        }
+    }
+    
+    /// Evaluate this condition against a single row
+    ///
+    /// Missing columns and NULLs never match, following CQL semantics.
+    pub fn matches(&self, row: &CQLiteRow) -> bool {
+        let value = match row.get_column(&self.column) {
+            Some(CQLValue::Null) | None => return false,
+            Some(value) => value,
+        };
+        
+        match self.operator {
+            ComparisonOperator::Equal => value == &self.value,
+            ComparisonOperator::NotEqual => value != &self.value,
+            ComparisonOperator::LessThan => compare_values(value, &self.value) == Some(Ordering::Less),
+            ComparisonOperator::LessThanOrEqual => matches!(
+                compare_values(value, &self.value),
+                Some(Ordering::Less | Ordering::Equal)
+            ),
+            ComparisonOperator::GreaterThan => compare_values(value, &self.value) == Some(Ordering::Greater),
+            ComparisonOperator::GreaterThanOrEqual => matches!(
+                compare_values(value, &self.value),
+                Some(Ordering::Greater | Ordering::Equal)
+            ),
+            ComparisonOperator::In => match &self.value {
+                CQLValue::List(items) | CQLValue::Tuple(items) => items.contains(value),
+                other => value == other,
+            },
+            ComparisonOperator::NotIn => match &self.value {
+                CQLValue::List(items) | CQLValue::Tuple(items) => !items.contains(value),
+                other => value != other,
+            },
+            ComparisonOperator::Like => match (value, &self.value) {
+                (CQLValue::Text(text), CQLValue::Text(pattern)) => like_matches(text, pattern),
+                _ => false,
+            },
+            ComparisonOperator::Contains => match value {
+                CQLValue::List(items) => items.contains(&self.value),
+                CQLValue::Set(items) => items.contains(&self.value),
+                CQLValue::Map(entries) => entries.values().any(|v| v == &self.value),
+                _ => false,
+            },
+            ComparisonOperator::ContainsKey => match value {
+                CQLValue::Map(entries) => entries.contains_key(&self.value),
+                _ => false,
+            },
+        }
+    }
+}
+
+/// Order two scalar values, promoting integer types so `Int` and `BigInt` compare
+fn compare_values(a: &CQLValue, b: &CQLValue) -> Option<Ordering> {
+    match (a, b) {
+        (CQLValue::Int(x), CQLValue::Int(y)) => Some(x.cmp(y)),
+        (CQLValue::BigInt(x), CQLValue::BigInt(y)) => Some(x.cmp(y)),
+        (CQLValue::Int(x), CQLValue::BigInt(y)) => Some((*x as i64).cmp(y)),
+        (CQLValue::BigInt(x), CQLValue::Int(y)) => Some(x.cmp(&(*y as i64))),
+        (CQLValue::Float(x), CQLValue::Float(y)) => x.partial_cmp(y),
+        (CQLValue::Double(x), CQLValue::Double(y)) => x.partial_cmp(y),
+        (CQLValue::Text(x), CQLValue::Text(y)) => Some(x.cmp(y)),
+        (CQLValue::Timestamp(x), CQLValue::Timestamp(y)) => Some(x.cmp(y)),
+        (CQLValue::Date(x), CQLValue::Date(y)) => Some(x.cmp(y)),
+        (CQLValue::Time(x), CQLValue::Time(y)) => Some(x.cmp(y)),
+        _ => None,
+    }
+}
+
+/// Match a CQL LIKE pattern supporting leading and/or trailing `%`
+fn like_matches(text: &str, pattern: &str) -> bool {
+    LikePattern::new(pattern).matches(text)
+}
+
+/// A LIKE pattern split into its match kind once, instead of per row
+#[derive(Debug, Clone, Copy)]
+enum LikePattern<'a> {
+    Contains(&'a str),
+    Suffix(&'a str),
+    Prefix(&'a str),
+    Exact(&'a str),
+}
+
+impl<'a> LikePattern<'a> {
+    fn new(pattern: &'a str) -> Self {
+        match (pattern.strip_prefix('%'), pattern.strip_suffix('%')) {
+            (Some(rest), _) if rest.ends_with('%') => LikePattern::Contains(&rest[..rest.len() - 1]),
+            (Some(suffix), _) => LikePattern::Suffix(suffix),
+            (None, Some(prefix)) => LikePattern::Prefix(prefix),
+            (None, None) => LikePattern::Exact(pattern),
+        }
+    }
+    
+    fn matches(&self, text: &str) -> bool {
+        match *self {
+            LikePattern::Contains(needle) => text.contains(needle),
+            LikePattern::Suffix(suffix) => text.ends_with(suffix),
+            LikePattern::Prefix(prefix) => text.starts_with(prefix),
+            LikePattern::Exact(pattern) => text == pattern,
+        }
+    }
+}
+
+/// IN lists at least this long are probed through a hash set
+const IN_SET_MIN_ITEMS: usize = 8;
+
+/// A WHERE clause prepared for repeated evaluation during one scan
+///
+/// Per-row work that only depends on the statement is done once up front:
+/// LIKE patterns are classified, long IN lists over scalar values become
+/// hash sets, and integer comparisons run column-at-a-time over a gathered
+/// block. Other conditions are evaluated by the `Condition` itself. Results
+/// are identical to `WhereClause::matches`.
+pub struct CompiledPredicate<'a> {
+    conditions: Vec<CompiledCondition<'a>>,
+    all: bool,
+}
+
+enum CompiledCondition<'a> {
+    Direct(&'a Condition),
+    IntCompare {
+        column: &'a str,
+        op: IntOp,
+        rhs: i64,
+        allow_int: bool,
+        allow_bigint: bool,
+    },
+    InSet {
+        column: &'a str,
+        values: HashSet<&'a CQLValue>,
+        negated: bool,
+    },
+    Like {
+        column: &'a str,
+        pattern: LikePattern<'a>,
+    },
+}
+
+impl WhereClause {
+    /// Prepare this clause for evaluation over many rows
+    pub fn compile(&self) -> CompiledPredicate<'_> {
+        CompiledPredicate {
+            conditions: self.conditions.iter().map(CompiledCondition::new).collect(),
+            all: matches!(self.operator, LogicalOperator::And),
+        }
+    }
+}
+
+impl<'a> CompiledPredicate<'a> {
+    /// Evaluate the predicate against a single row
+    pub fn matches(&self, row: &CQLiteRow) -> bool {
+        if self.all {
+            self.conditions.iter().all(|c| c.matches(row))
+        } else {
+            self.conditions.iter().any(|c| c.matches(row))
+        }
+    }
+    
+    /// Evaluate the predicate over a block of rows into a selection vector
+    ///
+    /// Each condition makes one pass over the block. Under AND a condition
+    /// only tests rows that are still selected; under OR only rows that are
+    /// not selected yet. The result is identical to calling `matches` per row.
+    pub fn filter_block(&self, rows: &[CQLiteRow], selection: &mut Vec<bool>) {
+        selection.clear();
+        
+        if rows.len() < FILTER_BATCH_THRESHOLD {
+            selection.extend(rows.iter().map(|row| self.matches(row)));
+            return;
+        }
+        
+        selection.resize(rows.len(), self.all);
+        for condition in &self.conditions {
+            // Nothing left to decide: every row already failed the AND or passed the OR
+            if !selection.contains(&self.all) {
+                break;
+            }
+            condition.filter_block(rows, selection, self.all);
+        }
+    }
+}
+
+impl<'a> CompiledCondition<'a> {
+    fn new(condition: &'a Condition) -> Self {
+        let column = condition.column.as_str();
+        match (&condition.operator, &condition.value) {
+            (ComparisonOperator::In | ComparisonOperator::NotIn, CQLValue::List(items) | CQLValue::Tuple(items))
+                if items.len() >= IN_SET_MIN_ITEMS && items.iter().all(is_hash_exact) =>
+            {
+                CompiledCondition::InSet {
+                    column,
+                    values: items.iter().collect(),
+                    negated: matches!(condition.operator, ComparisonOperator::NotIn),
+                }
+            }
+            (ComparisonOperator::Like, CQLValue::Text(pattern)) => CompiledCondition::Like {
+                column,
+                pattern: LikePattern::new(pattern),
+            },
+            (operator, CQLValue::Int(_) | CQLValue::BigInt(_)) => {
+                let rhs = match condition.value {
+                    CQLValue::Int(v) => i64::from(v),
+                    CQLValue::BigInt(v) => v,
+                    _ => unreachable!(),
+                };
+                let op = match operator {
+                    ComparisonOperator::Equal => IntOp::Eq,
+                    ComparisonOperator::LessThan => IntOp::Lt,
+                    ComparisonOperator::LessThanOrEqual => IntOp::Le,
+                    ComparisonOperator::GreaterThan => IntOp::Gt,
+                    ComparisonOperator::GreaterThanOrEqual => IntOp::Ge,
+                    _ => return CompiledCondition::Direct(condition),
+                };
+                // Equality uses CQLValue's PartialEq, which doesn't promote Int to BigInt
+                let exact = matches!(op, IntOp::Eq);
+                CompiledCondition::IntCompare {
+                    column,
+                    op,
+                    rhs,
+                    allow_int: !exact || matches!(condition.value, CQLValue::Int(_)),
+                    allow_bigint: !exact || matches!(condition.value, CQLValue::BigInt(_)),
+                }
+            }
+            _ => CompiledCondition::Direct(condition),
+        }
+    }
+    
+    /// Evaluate against one row; missing columns and NULLs never match
+    fn matches(&self, row: &CQLiteRow) -> bool {
+        match self {
+            CompiledCondition::Direct(condition) => condition.matches(row),
+            CompiledCondition::IntCompare { column, op, rhs, allow_int, allow_bigint } => {
+                match row.get_column(column) {
+                    Some(CQLValue::Int(v)) if *allow_int => op.test(i64::from(*v), *rhs),
+                    Some(CQLValue::BigInt(v)) if *allow_bigint => op.test(*v, *rhs),
+                    _ => false,
+                }
+            }
+            CompiledCondition::InSet { column, values, negated } => match row.get_column(column) {
+                Some(CQLValue::Null) | None => false,
+                Some(value) => values.contains(value) != *negated,
+            },
+            CompiledCondition::Like { column, pattern } => match row.get_column(column) {
+                Some(CQLValue::Text(text)) => pattern.matches(text),
+                _ => false,
+            },
+        }
+    }
+    
+    fn filter_block(&self, rows: &[CQLiteRow], selection: &mut [bool], candidate: bool) {
+        if let CompiledCondition::IntCompare { column, op, rhs, allow_int, allow_bigint } = self {
+            let column = IntColumn::gather(rows, column, *allow_int, *allow_bigint);
+            let rhs = *rhs;
+            return match op {
+                IntOp::Eq => column.combine(selection, candidate, |v| v == rhs),
+                IntOp::Lt => column.combine(selection, candidate, |v| v < rhs),
+                IntOp::Le => column.combine(selection, candidate, |v| v <= rhs),
+                IntOp::Gt => column.combine(selection, candidate, |v| v > rhs),
+                IntOp::Ge => column.combine(selection, candidate, |v| v >= rhs),
+            };
+        }
+        
+        for (row, selected) in rows.iter().zip(selection.iter_mut()) {
+            if *selected == candidate {
+                *selected = self.matches(row);
+            }
+        }
+    }
+}
+
+/// Integer comparison against a constant
+#[derive(Debug, Clone, Copy)]
+enum IntOp {
+    Eq,
+    Lt,
+    Le,
+    Gt,
+    Ge,
+}
+
+impl IntOp {
+    fn test(self, value: i64, rhs: i64) -> bool {
+        match self {
+            IntOp::Eq => value == rhs,
+            IntOp::Lt => value < rhs,
+            IntOp::Le => value <= rhs,
+            IntOp::Gt => value > rhs,
+            IntOp::Ge => value >= rhs,
+        }
+    }
+}
+
+/// One integer column of a block, gathered out of the rows into flat arrays
+///
+/// Rows whose value is missing, NULL or of a disallowed type are marked
+/// invalid (with a placeholder value) and never match.
+struct IntColumn {
+    values: Vec<i64>,
+    valid: Vec<bool>,
+}
+
+impl IntColumn {
+    fn gather(rows: &[CQLiteRow], column: &str, allow_int: bool, allow_bigint: bool) -> Self {
+        let mut values = Vec::with_capacity(rows.len());
+        let mut valid = Vec::with_capacity(rows.len());
+        for row in rows {
+            let value = match row.get_column(column) {
+                Some(CQLValue::Int(v)) if allow_int => Some(i64::from(*v)),
+                Some(CQLValue::BigInt(v)) if allow_bigint => Some(*v),
+                _ => None,
+            };
+            values.push(value.unwrap_or(0));
+            valid.push(value.is_some());
+        }
+        IntColumn { values, valid }
+    }
+    
+    /// Fold `test` over the whole column into the selection
+    ///
+    /// Every row is tested and merged without branches (AND for `candidate`
+    /// true, OR for false), so the loop runs over flat slices and the
+    /// compiler can vectorize it. Rows that were already decided keep their
+    /// value, as in the row-at-a-time path.
+    fn combine<F>(&self, selection: &mut [bool], candidate: bool, test: F)
+    where
+        F: Fn(i64) -> bool,
+    {
+        let lanes = selection.iter_mut().zip(self.values.iter().zip(self.valid.iter()));
+        if candidate {
+            for (selected, (value, valid)) in lanes {
+                *selected &= *valid & test(*value);
+            }
+        } else {
+            for (selected, (value, valid)) in lanes {
+                *selected |= *valid & test(*value);
+            }
+        }
+    }
+}
+
+/// Whether hashing agrees with equality for this value
+///
+/// Floats are excluded (`0.0 == -0.0` but their bits differ), as are
+/// collections, which all hash alike.
+fn is_hash_exact(value: &CQLValue) -> bool {
+    !matches!(
+        value,
+        CQLValue::Float(_)
+            | CQLValue::Double(_)
+            | CQLValue::List(_)
+            | CQLValue::Set(_)
+            | CQLValue::Map(_)
+            | CQLValue::Tuple(_)
+            | CQLValue::UDT(_)
+    )
+}
+
 #[derive(Debug)]
 pub struct OrderByColumn {
     pub column: String,
@@ -90,7 +532,8 @@ impl QueryExecutor {
     /// Parse SQL SELECT statement into internal representation
     pub fn parse_sql(&self, sql: &str) -> PyResult<ParsedQuery> {
         // Basic SQL parsing - in a real implementation, this would use a proper SQL parser
-        let sql = sql.trim().to_lowercase();
+        let original = sql.trim();
+        let sql = original.to_lowercase();
         
         if !sql.starts_with("select") {
             return Err(QueryError::new_err("Only SELECT statements are supported"));
@@ -98,15 +541,20 @@ impl QueryExecutor {
         
         // Very basic parsing for demonstration
         // In reality, this would use a proper SQL parser like sqlparser-rs
-        let parsed = ParsedQuery {
-            select_columns: vec!["*".to_string()], // Parse actual columns
+        let (limit, offset) = parse_limit_offset(&sql)?;
+        let mut parsed = ParsedQuery {
+            select_columns: parse_select_columns(&sql),
             from_table: "unknown".to_string(),     // Parse actual table
-            where_clause: None,                    // Parse WHERE conditions
-            limit: None,                           // Parse LIMIT
-            offset: None,                          // Parse OFFSET
+            where_clause: parse_where_clause(original)?,
+            limit,
+            offset,
             order_by: None,                        // Parse ORDER BY
         };
         
+        if let Some(where_clause) = parsed.where_clause.as_mut() {
+            where_clause.order_by_cost();
+        }
+        
         self.validate_query(&parsed)?;
         Ok(parsed)
     }
@@ -132,8 +580,9 @@ impl QueryExecutor {
         limit: Option<u32>,
         offset: Option<u32>,
     ) -> PyResult<ParsedQuery> {
+        // An explicit limit can only tighten a LIMIT already in the statement
         if let Some(limit_val) = limit {
-            query.limit = Some(limit_val);
+            query.limit = Some(query.limit.map_or(limit_val, |l| l.min(limit_val)));
         }
         
         if let Some(offset_val) = offset {
@@ -144,6 +593,12 @@ impl QueryExecutor {
     }
     
     /// Execute the parsed query against the SSTable
+    ///
+    /// The scan is a single fused pass: each source row is tested against the
+    /// WHERE clause as it is read, the first `offset` matches are skipped,
+    /// and only passing rows are projected into the output. Rejected rows are
+    /// never materialized, and the scan stops as soon as `limit` rows have
+    /// been produced.
     pub fn execute_query(&self, query: ParsedQuery) -> PyResult<Vec<CQLiteRow>> {
         // This is where the magic happens! 
         // This would interface with cqlite-core to:
@@ -153,55 +608,142 @@ impl QueryExecutor {
         // 4. Apply LIMIT/OFFSET
         // 5. Return results as CQLiteRow objects
         
-        // For demonstration, return some mock data
-        let mut results = Vec::new();
+        let select_all = query.select_columns.iter().any(|c| c == "*");
+        let mut to_skip = query.offset.unwrap_or(0) as usize;
+        let limit = query.limit.map(|l| l as usize);
+        let mut results = Vec::with_capacity(limit.unwrap_or(0).min(1024));
         
-        // Mock data generation based on query
-        for i in 0..10 {
-            let mut row = CQLiteRow::new();
-            
-            // Add mock columns based on what was selected
-            if query.select_columns.contains(&"*".to_string()) || 
-               query.select_columns.contains(&"id".to_string()) {
-                row.add_column("id".to_string(), CQLValue::Int(i));
+        if limit == Some(0) {
+            return Ok(results);
+        }
+        
+        let scan_columns = query.scan_columns();
+        
+        self.scan_matching(query.where_clause.as_ref(), scan_columns.as_ref(), |source| {
+            if to_skip > 0 {
+                to_skip -= 1;
+                return true;
             }
             
-            if query.select_columns.contains(&"*".to_string()) || 
-               query.select_columns.contains(&"name".to_string()) {
-                row.add_column("name".to_string(), CQLValue::Text(format!("User {}", i)));
-            }
+            results.push(if select_all {
+                source
+            } else {
+                project_row(source, &query.select_columns)
+            });
             
-            if query.select_columns.contains(&"*".to_string()) || 
-               query.select_columns.contains(&"email".to_string()) {
-                row.add_column("email".to_string(), CQLValue::Text(format!("user{}@example.com", i)));
-            }
+            limit.map_or(true, |l| results.len() < l)
+        });
+        
+        Ok(results)
+    }
+    
+    /// Fetch the next batch of a query's results, resuming from `cursor`
+    ///
+    /// Unlike re-running the query with a larger OFFSET per page, each call
+    /// continues the scan at the source row where the previous one stopped,
+    /// so paging through a result set reads every source row once.
+    pub fn next_batch(&self, query: &ParsedQuery, cursor: &mut ScanCursor, batch_size: u32) -> Vec<CQLiteRow> {
+        let wanted = cursor.remaining.map_or(batch_size, |r| r.min(batch_size)) as usize;
+        let mut rows = Vec::with_capacity(wanted.min(1024));
+        
+        if wanted == 0 || cursor.finished {
+            cursor.finished = true;
+            return rows;
+        }
+        
+        let select_all = query.select_columns.iter().any(|c| c == "*");
+        let scan_columns = query.scan_columns();
+        let to_skip = &mut cursor.to_skip;
+        
+        let next_row = self.scan_matching_from(
+            query.where_clause.as_ref(),
+            scan_columns.as_ref(),
+            cursor.next_row,
+            |source| {
+                if *to_skip > 0 {
+                    *to_skip -= 1;
+                    return true;
+                }
+                
+                rows.push(if select_all {
+                    source
+                } else {
+                    project_row(source, &query.select_columns)
+                });
+                
+                rows.len() < wanted
+            },
+        );
+        
+        cursor.next_row = next_row;
+        if let Some(remaining) = cursor.remaining.as_mut() {
+            *remaining -= rows.len() as u32;
+        }
+        cursor.finished = next_row >= MOCK_ROW_COUNT || cursor.remaining == Some(0);
+        
+        rows
+    }
+    
+    /// Feed the source rows that pass `where_clause` to `visit`, in scan order
+    ///
+    /// The scan reads FILTER_BLOCK_ROWS rows at a time and filters each block
+    /// with the clause's `CompiledPredicate`, prepared once per scan. When `columns` is given, only those
+    /// columns are decoded from the source. `visit` returns false to end the
+    /// scan.
+    fn scan_matching<F>(
+        &self,
+        where_clause: Option<&WhereClause>,
+        columns: Option<&HashSet<&str>>,
+        visit: F,
+    ) where
+        F: FnMut(CQLiteRow) -> bool,
+    {
+        self.scan_matching_from(where_clause, columns, 0, visit);
+    }
+    
+    /// `scan_matching` starting at source row `start_row`
+    ///
+    /// Returns the source row to resume from: the one after the row at which
+    /// `visit` ended the scan, or the end of the source.
+    fn scan_matching_from<F>(
+        &self,
+        where_clause: Option<&WhereClause>,
+        columns: Option<&HashSet<&str>>,
+        start_row: i32,
+        mut visit: F,
+    ) -> i32
+    where
+        F: FnMut(CQLiteRow) -> bool,
+    {
+        // Prepare the filter once for every block of this scan
+        let predicate = where_clause.map(WhereClause::compile);
+        
+        // For demonstration, scan some mock data
+        let mut selection = Vec::with_capacity(FILTER_BLOCK_ROWS);
+        let mut start = start_row;
+        
+        while start < MOCK_ROW_COUNT {
+            let end = start.saturating_add(FILTER_BLOCK_ROWS as i32).min(MOCK_ROW_COUNT);
+            let block: Vec<CQLiteRow> = (start..end).map(|i| decode_source_row(i, columns)).collect();
+            let block_start = start;
+            start = end;
             
-            if query.select_columns.contains(&"*".to_string()) || 
-               query.select_columns.contains(&"age".to_string()) {
-                row.add_column("age".to_string(), CQLValue::Int(20 + (i % 50)));
+            match &predicate {
+                Some(predicate) => predicate.filter_block(&block, &mut selection),
+                None => {
+                    selection.clear();
+                    selection.resize(block.len(), true);
+                }
             }
             
-            results.push(row);
-            
-            // Apply limit
-            if let Some(limit) = query.limit {
-                if results.len() >= limit as usize {
-                    break;
+            for (i, (source, selected)) in block.into_iter().zip(selection.iter()).enumerate() {
+                if *selected && !visit(source) {
+                    return block_start + i as i32 + 1;
                 }
             }
         }
         
-        // Apply offset
-        if let Some(offset) = query.offset {
-            let offset = offset as usize;
-            if offset < results.len() {
-                results = results[offset..].to_vec();
-            } else {
-                results.clear();
-            }
-        }
-        
-        Ok(results)
+        MOCK_ROW_COUNT
     }
     
     /// Get available columns from the SSTable schema
@@ -241,6 +783,48 @@ impl QueryExecutor {
         Ok(1000)
     }
     
+    /// Count the rows a query would return without materializing them
+    ///
+    /// Runs the same filtered scan as `execute_query`, but only increments a
+    /// counter for passing rows: nothing is projected or collected. OFFSET and
+    /// LIMIT are honored, and `stop_after` ends the scan early once that many
+    /// rows have been counted (an existence check passes `Some(1)`).
+    pub fn count_matching(&self, query: &ParsedQuery, stop_after: Option<u64>) -> PyResult<u64> {
+        let mut to_skip = query.offset.unwrap_or(0) as u64;
+        let cap = match (query.limit.map(u64::from), stop_after) {
+            (Some(limit), Some(stop)) => Some(limit.min(stop)),
+            (limit, stop) => limit.or(stop),
+        };
+        let mut count = 0u64;
+        
+        if cap == Some(0) {
+            return Ok(0);
+        }
+        
+        // Only the filter columns need decoding to count
+        let filter_columns = query.filter_columns();
+        
+        self.scan_matching(query.where_clause.as_ref(), Some(&filter_columns), |_| {
+            if to_skip > 0 {
+                to_skip -= 1;
+                return true;
+            }
+            
+            count += 1;
+            cap.map_or(true, |c| count < c)
+        });
+        
+        Ok(count)
+    }
+    
+    /// Whether the query returns at least one row
+    ///
+    /// The filter-only scan ends inside the first block that yields a row
+    /// past OFFSET; nothing is projected or collected.
+    pub fn any_match(&self, query: &ParsedQuery) -> PyResult<bool> {
+        Ok(self.count_matching(query, Some(1))? > 0)
+    }
+    
     /// Execute query with streaming support for large results
     pub fn execute_query_streaming(&self, query: ParsedQuery, chunk_size: u32) -> PyResult<QueryIterator> {
         // Create an iterator that yields chunks of results
@@ -250,6 +834,471 @@ impl QueryExecutor {
     }
 }
 
+/// Extract trailing `LIMIT n` / `OFFSET m` clauses from a lowercased statement
+///
+/// Only text after the last string literal is considered, and CQL's
+/// `PER PARTITION LIMIT` is not treated as a row limit.
+fn parse_limit_offset(sql: &str) -> PyResult<(Option<u32>, Option<u32>)> {
+    let tail = sql.rsplit('\'').next().unwrap_or(sql);
+    let tokens: Vec<&str> = tail
+        .split_whitespace()
+        .map(|t| t.trim_end_matches(';'))
+        .collect();
+    
+    let mut limit = None;
+    let mut offset = None;
+    
+    for (i, token) in tokens.iter().enumerate() {
+        let slot = match *token {
+            "limit" if i == 0 || tokens[i - 1] != "partition" => &mut limit,
+            "offset" => &mut offset,
+            _ => continue,
+        };
+        
+        let value = tokens.get(i + 1).ok_or_else(|| {
+            QueryError::new_err(format!("Missing value after {}", token.to_uppercase()))
+        })?;
+        *slot = Some(value.parse::<u32>().map_err(|_| {
+            QueryError::new_err(format!("Invalid {} value: {}", token.to_uppercase(), value))
+        })?);
+    }
+    
+    Ok((limit, offset))
+}
+
+/// Parse the SELECT list of a lowercased statement into column names
+///
+/// Aliases are dropped and quoted identifiers unquoted. `*`, an empty list or
+/// any expression (function call, aggregate) yields `["*"]` so the full row
+/// is read. A leading DISTINCT is skipped and its columns projected (rows are
+/// not deduplicated); `SELECT JSON` reads the full row.
+fn parse_select_columns(sql: &str) -> Vec<String> {
+    let mut tokens: Vec<&str> = sql
+        .split_whitespace()
+        .skip(1)
+        .take_while(|token| *token != "from")
+        .collect();
+    
+    // Modifiers only when something follows; otherwise it's a column name
+    if tokens.len() > 1 {
+        match tokens[0] {
+            "distinct" => {
+                tokens.remove(0);
+            }
+            "json" => return vec!["*".to_string()],
+            _ => {}
+        }
+    }
+    let select_list = tokens.join(" ");
+    
+    let columns: Vec<String> = select_list
+        .split(',')
+        .map(|item| item.split_whitespace().next().unwrap_or("").trim_matches('"').to_string())
+        .collect();
+    
+    if columns.iter().any(|c| c.is_empty() || c == "*" || c.contains('(')) {
+        return vec!["*".to_string()];
+    }
+    columns
+}
+
+/// Lexical token of a statement, as seen by the WHERE parser
+#[derive(Debug, Clone, PartialEq)]
+enum Token {
+    /// Unquoted keyword or identifier, lowercased
+    Word(String),
+    /// Double-quoted identifier, case preserved
+    Ident(String),
+    /// Single-quoted string literal
+    Str(String),
+    Number(String),
+    Symbol(String),
+}
+
+impl Token {
+    fn is_word(&self, keyword: &str) -> bool {
+        matches!(self, Token::Word(word) if word == keyword)
+    }
+    
+    fn text(&self) -> &str {
+        match self {
+            Token::Word(t) | Token::Ident(t) | Token::Str(t) | Token::Number(t) | Token::Symbol(t) => t,
+        }
+    }
+}
+
+/// Split a statement into tokens, keeping the case of quoted text
+fn tokenize(sql: &str) -> PyResult<Vec<Token>> {
+    let chars: Vec<char> = sql.chars().collect();
+    let mut tokens = Vec::new();
+    let mut i = 0;
+    
+    while i < chars.len() {
+        let c = chars[i];
+        let start = i;
+        i += 1;
+        
+        if c.is_whitespace() {
+            continue;
+        }
+        
+        if c == '\'' || c == '"' {
+            // A doubled quote inside the literal stands for one quote
+            let mut text = String::new();
+            loop {
+                match chars.get(i) {
+                    None => return Err(QueryError::new_err("Unterminated quoted string")),
+                    Some(&q) if q == c && chars.get(i + 1) == Some(&c) => {
+                        text.push(c);
+                        i += 2;
+                    }
+                    Some(&q) if q == c => {
+                        i += 1;
+                        break;
+                    }
+                    Some(&ch) => {
+                        text.push(ch);
+                        i += 1;
+                    }
+                }
+            }
+            tokens.push(if c == '\'' { Token::Str(text) } else { Token::Ident(text) });
+        } else if c.is_ascii_digit() || (c == '-' && chars.get(i).map_or(false, char::is_ascii_digit)) {
+            while i < chars.len() && (chars[i].is_ascii_alphanumeric() || chars[i] == '.') {
+                i += 1;
+            }
+            tokens.push(Token::Number(chars[start..i].iter().collect()));
+        } else if c.is_alphanumeric() || c == '_' {
+            while i < chars.len() && (chars[i].is_alphanumeric() || chars[i] == '_' || chars[i] == '.') {
+                i += 1;
+            }
+            tokens.push(Token::Word(chars[start..i].iter().collect::<String>().to_lowercase()));
+        } else if matches!(c, '<' | '>' | '!' | '=') {
+            while i < chars.len() && matches!(chars[i], '<' | '>' | '=') {
+                i += 1;
+            }
+            tokens.push(Token::Symbol(chars[start..i].iter().collect()));
+        } else {
+            tokens.push(Token::Symbol(c.to_string()));
+        }
+    }
+    
+    Ok(tokens)
+}
+
+/// Parse the WHERE clause of a statement into conditions the scan can evaluate
+///
+/// Supports `column OP literal` with =, !=, <>, <, <=, >, >=, LIKE, CONTAINS
+/// and CONTAINS KEY, `column [NOT] IN (literal, ...)` and
+/// `column BETWEEN low AND high` (lowered to `>= low AND <= high`), joined
+/// either all by AND or all by OR. The clause ends at ORDER BY, GROUP BY,
+/// LIMIT, OFFSET, PER PARTITION LIMIT, ALLOW FILTERING or the end of the
+/// statement.
+///
+/// Anything else the parser can't evaluate (IS [NOT] NULL, function calls
+/// such as `token(...)`, bind markers, mixed AND/OR) yields `None`: the
+/// query still runs, only without predicate pushdown. Malformed clauses,
+/// such as a missing value, are still errors.
+fn parse_where_clause(sql: &str) -> PyResult<Option<WhereClause>> {
+    let tokens = tokenize(sql)?;
+    let start = match tokens.iter().position(|t| t.is_word("where")) {
+        Some(position) => position + 1,
+        None => return Ok(None),
+    };
+    let end = tokens[start..]
+        .iter()
+        .position(|t| {
+            ["order", "group", "limit", "offset", "per", "allow"].iter().any(|k| t.is_word(k))
+                || t.text() == ";"
+        })
+        .map_or(tokens.len(), |position| start + position);
+    
+    let mut rest = &tokens[start..end];
+    let mut conditions = Vec::new();
+    let mut operator: Option<LogicalOperator> = None;
+    let mut lowered_between = false;
+    
+    loop {
+        let (parsed, remaining) = match parse_condition(rest)? {
+            Some(parsed) => parsed,
+            None => return Ok(None),
+        };
+        lowered_between |= parsed.len() > 1;
+        conditions.extend(parsed);
+        
+        let connector = match remaining.first() {
+            None => break,
+            Some(t) if t.is_word("and") => LogicalOperator::And,
+            Some(t) if t.is_word("or") => LogicalOperator::Or,
+            Some(_) => return Ok(None),
+        };
+        if let Some(previous) = &operator {
+            if std::mem::discriminant(previous) != std::mem::discriminant(&connector) {
+                return Ok(None);
+            }
+        }
+        operator = Some(connector);
+        rest = &remaining[1..];
+    }
+    
+    let operator = operator.unwrap_or(LogicalOperator::And);
+    // A lowered BETWEEN is a conjunction, which a flat OR clause can't hold
+    if lowered_between && matches!(operator, LogicalOperator::Or) {
+        return Ok(None);
+    }
+    
+    Ok(Some(WhereClause { conditions, operator }))
+}
+
+/// Parse one condition, returning it and the tokens after it
+///
+/// Most conditions are a single `column OP value`; BETWEEN yields its two
+/// bounds. Returns `None` for constructs the scan can't evaluate.
+fn parse_condition(tokens: &[Token]) -> PyResult<Option<(Vec<Condition>, &[Token])>> {
+    let column = match tokens.first() {
+        Some(Token::Word(name)) | Some(Token::Ident(name)) => name.clone(),
+        Some(_) => return Ok(None),
+        None => return Err(QueryError::new_err("Expected a column name in WHERE")),
+    };
+    
+    let (operator, rest) = match &tokens[1..] {
+        [] => {
+            return Err(QueryError::new_err(format!("Expected a comparison operator after {}", column)));
+        }
+        [t, rest @ ..] if t.is_word("between") => {
+            let (low, rest) = match parse_literal(rest)? {
+                Some(parsed) => parsed,
+                None => return Ok(None),
+            };
+            let rest = match rest {
+                [t, rest @ ..] if t.is_word("and") => rest,
+                _ => return Err(QueryError::new_err("Expected AND in BETWEEN")),
+            };
+            let (high, rest) = match parse_literal(rest)? {
+                Some(parsed) => parsed,
+                None => return Ok(None),
+            };
+            let bounds = vec![
+                Condition {
+                    column: column.clone(),
+                    operator: ComparisonOperator::GreaterThanOrEqual,
+                    value: low,
+                },
+                Condition {
+                    column,
+                    operator: ComparisonOperator::LessThanOrEqual,
+                    value: high,
+                },
+            ];
+            return Ok(Some((bounds, rest)));
+        }
+        [Token::Symbol(symbol), rest @ ..] => {
+            let operator = match symbol.as_str() {
+                "=" => ComparisonOperator::Equal,
+                "!=" | "<>" => ComparisonOperator::NotEqual,
+                "<" => ComparisonOperator::LessThan,
+                "<=" => ComparisonOperator::LessThanOrEqual,
+                ">" => ComparisonOperator::GreaterThan,
+                ">=" => ComparisonOperator::GreaterThanOrEqual,
+                _ => return Ok(None),
+            };
+            (operator, rest)
+        }
+        [t, rest @ ..] if t.is_word("in") => (ComparisonOperator::In, rest),
+        [n, t, rest @ ..] if n.is_word("not") && t.is_word("in") => (ComparisonOperator::NotIn, rest),
+        [t, rest @ ..] if t.is_word("like") => (ComparisonOperator::Like, rest),
+        [c, k, rest @ ..] if c.is_word("contains") && k.is_word("key") => (ComparisonOperator::ContainsKey, rest),
+        [t, rest @ ..] if t.is_word("contains") => (ComparisonOperator::Contains, rest),
+        _ => return Ok(None),
+    };
+    
+    let parsed = match operator {
+        ComparisonOperator::In | ComparisonOperator::NotIn => parse_literal_list(rest)?,
+        _ => parse_literal(rest)?,
+    };
+    
+    Ok(parsed.map(|(value, rest)| (vec![Condition { column, operator, value }], rest)))
+}
+
+/// Parse a parenthesized, comma-separated list of literals into a `List`
+fn parse_literal_list(tokens: &[Token]) -> PyResult<Option<(CQLValue, &[Token])>> {
+    match tokens.first().map(Token::text) {
+        Some("(") => {}
+        // `IN ?` and other non-list forms
+        Some(_) => return Ok(None),
+        None => return Err(QueryError::new_err("Expected '(' after IN")),
+    }
+    
+    let mut values = Vec::new();
+    let mut rest = &tokens[1..];
+    loop {
+        let (value, remaining) = match parse_literal(rest)? {
+            Some(parsed) => parsed,
+            None => return Ok(None),
+        };
+        values.push(value);
+        match remaining.first().map(Token::text) {
+            Some(",") => rest = &remaining[1..],
+            Some(")") => return Ok(Some((CQLValue::List(values), &remaining[1..]))),
+            _ => return Err(QueryError::new_err("Expected ',' or ')' in IN list")),
+        }
+    }
+}
+
+/// Parse a single literal: string, number, boolean or NULL
+///
+/// Returns `None` for a value that isn't a literal (bind marker, function
+/// call, column reference).
+fn parse_literal(tokens: &[Token]) -> PyResult<Option<(CQLValue, &[Token])>> {
+    let value = match tokens.first() {
+        Some(Token::Str(text)) => CQLValue::Text(text.clone()),
+        Some(Token::Number(number)) => {
+            if let Ok(v) = number.parse::<i32>() {
+                CQLValue::Int(v)
+            } else if let Ok(v) = number.parse::<i64>() {
+                CQLValue::BigInt(v)
+            } else if let Ok(v) = number.parse::<f64>() {
+                CQLValue::Double(v)
+            } else {
+                return Err(QueryError::new_err(format!("Unsupported literal in WHERE: {}", number)));
+            }
+        }
+        Some(t) if t.is_word("true") => CQLValue::Boolean(true),
+        Some(t) if t.is_word("false") => CQLValue::Boolean(false),
+        Some(t) if t.is_word("null") => CQLValue::Null,
+        Some(_) => return Ok(None),
+        None => return Err(QueryError::new_err("Expected a literal value in WHERE")),
+    };
+    
+    Ok(Some((value, &tokens[1..])))
+}
+
+/// Decode the source row at position `i`, limited to `columns` when given
+///
+/// Columns outside the set are never decoded, so a narrow projection doesn't
+/// pay to build values it would immediately drop.
+fn decode_source_row(i: i32, columns: Option<&HashSet<&str>>) -> CQLiteRow {
+    let wanted = |name: &str| columns.map_or(true, |c| c.contains(name));
+    
+    let mut row = CQLiteRow::new();
+    if wanted("id") {
+        row.add_column("id".to_string(), CQLValue::Int(i));
+    }
+    if wanted("name") {
+        row.add_column("name".to_string(), CQLValue::Text(format!("User {}", i)));
+    }
+    if wanted("email") {
+        row.add_column("email".to_string(), CQLValue::Text(format!("user{}@example.com", i)));
+    }
+    if wanted("age") {
+        row.add_column("age".to_string(), CQLValue::Int(20 + (i % 50)));
+    }
+    row
+}
+
+/// Keep only the selected columns of a row, moving values rather than cloning
+fn project_row(mut source: CQLiteRow, columns: &[String]) -> CQLiteRow {
+    let mut row = CQLiteRow::new();
+    for column in columns {
+        if let Some(value) = source.columns.remove(column) {
+            row.add_column(column.clone(), value);
+        }
+    }
+    row
+}
+
+/// Resumable position in a query's scan, advanced by `QueryExecutor::next_batch`
+#[derive(Debug, Clone)]
+pub struct ScanCursor {
+    next_row: i32,
+    to_skip: u32,
+    remaining: Option<u32>,
+    finished: bool,
+}
+
+impl ScanCursor {
+    /// Start of the scan for `query`, honouring its OFFSET and LIMIT
+    pub fn new(query: &ParsedQuery) -> Self {
+        ScanCursor {
+            next_row: 0,
+            to_skip: query.offset.unwrap_or(0),
+            remaining: query.limit,
+            finished: false,
+        }
+    }
+    
+    /// Whether the scan has produced all of its rows
+    pub fn is_finished(&self) -> bool {
+        self.finished
+    }
+}
+
+/// Plans a `PlanCache` keeps before evicting the least recently used one
+pub const PLAN_CACHE_CAPACITY: usize = 128;
+
+/// Bounded cache of parsed plans, keyed by the trimmed statement text
+///
+/// Lookups refresh an entry; inserting past `capacity` evicts the least
+/// recently used plan, so callers that prepare an open-ended set of
+/// statements (varying WHERE literals, head(n)) can't grow it without
+/// bound. Recency is a linear scan, which is cheap at this capacity.
+#[derive(Debug)]
+pub struct PlanCache {
+    capacity: usize,
+    plans: HashMap<String, ParsedQuery>,
+    recency: VecDeque<String>,
+}
+
+impl PlanCache {
+    pub fn new(capacity: usize) -> Self {
+        PlanCache {
+            capacity: capacity.max(1),
+            plans: HashMap::new(),
+            recency: VecDeque::new(),
+        }
+    }
+    
+    /// Cached plan for `sql`, marking it most recently used
+    pub fn get(&mut self, sql: &str) -> Option<ParsedQuery> {
+        let key = sql.trim();
+        let plan = self.plans.get(key)?.clone();
+        self.touch(key);
+        Some(plan)
+    }
+    
+    /// Cache the plan for `sql`, evicting the least recently used if full
+    pub fn insert(&mut self, sql: &str, plan: ParsedQuery) {
+        let key = sql.trim();
+        if self.plans.insert(key.to_string(), plan).is_some() {
+            self.touch(key);
+            return;
+        }
+        
+        self.recency.push_back(key.to_string());
+        while self.recency.len() > self.capacity {
+            if let Some(evicted) = self.recency.pop_front() {
+                self.plans.remove(&evicted);
+            }
+        }
+    }
+    
+    pub fn contains(&self, sql: &str) -> bool {
+        self.plans.contains_key(sql.trim())
+    }
+    
+    pub fn len(&self) -> usize {
+        self.plans.len()
+    }
+    
+    fn touch(&mut self, key: &str) {
+        if let Some(position) = self.recency.iter().position(|k| k == key) {
+            if let Some(entry) = self.recency.remove(position) {
+                self.recency.push_back(entry);
+            }
+        }
+    }
+}
+
 /// Iterator for streaming query results
 pub struct QueryIterator {
     sstable_path: String,
@@ -419,5 +1468,409 @@ mod tests {
         
         let result = executor.parse_sql("INSERT INTO users VALUES (1)");
         assert!(result.is_err());
+        
+        let parsed = executor.parse_sql("SELECT * FROM users LIMIT 5 OFFSET 2;").unwrap();
+        assert_eq!((parsed.limit, parsed.offset), (Some(5), Some(2)));
+        
+        let parsed = executor.parse_sql("SELECT * FROM users WHERE name = 'limit 3'").unwrap();
+        assert_eq!(parsed.limit, None);
+        
+        let limited = executor.apply_limit_offset(parsed, Some(1), None).unwrap();
+        assert_eq!(limited.limit, Some(1));
+        
+        assert!(executor.parse_sql("SELECT * FROM users LIMIT many").is_err());
+        
+        let parsed = executor.parse_sql("SELECT name, email AS mail FROM users").unwrap();
+        assert_eq!(parsed.select_columns, vec!["name".to_string(), "email".to_string()]);
+        
+        let parsed = executor.parse_sql("SELECT COUNT(*) FROM users").unwrap();
+        assert_eq!(parsed.select_columns, vec!["*".to_string()]);
+    }
+    
+    #[test]
+    fn test_select_modifiers_are_not_columns() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let parsed = executor.parse_sql("SELECT DISTINCT id FROM users").unwrap();
+        assert_eq!(parsed.select_columns, vec!["id".to_string()]);
+        let rows = executor.execute_query(parsed).unwrap();
+        assert!(rows.iter().all(|r| r.column_count() == 1 && r.get_column("id").is_some()));
+        
+        let parsed = executor.parse_sql("SELECT JSON id, name FROM users").unwrap();
+        assert_eq!(parsed.select_columns, vec!["*".to_string()]);
+        
+        // Without a following column they are ordinary column names
+        let parsed = executor.parse_sql("SELECT json FROM users").unwrap();
+        assert_eq!(parsed.select_columns, vec!["json".to_string()]);
+    }
+    
+    #[test]
+    fn test_where_clause_parsing() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let parsed = executor
+            .parse_sql("SELECT id FROM users WHERE age > 25 AND name = 'User 7' LIMIT 10")
+            .unwrap();
+        let where_clause = parsed.where_clause.unwrap();
+        assert_eq!(where_clause.conditions.len(), 2);
+        // Ordered by cost: the text equality runs before the range
+        assert_eq!(where_clause.conditions[0].column, "name");
+        assert_eq!(where_clause.conditions[0].value, CQLValue::Text("User 7".to_string()));
+        assert_eq!(where_clause.conditions[1].value, CQLValue::Int(25));
+        
+        let parsed = executor.parse_sql("SELECT * FROM users WHERE id IN (1, 3, 5)").unwrap();
+        let rows = executor.execute_query(parsed).unwrap();
+        assert_eq!(rows.len(), 3);
+        
+        let parsed = executor.parse_sql("SELECT * FROM users WHERE name = 'it''s'").unwrap();
+        assert_eq!(
+            parsed.where_clause.unwrap().conditions[0].value,
+            CQLValue::Text("it's".to_string())
+        );
+        
+        assert!(executor.parse_sql("SELECT * FROM users WHERE age >").is_err());
+        assert!(executor.parse_sql("SELECT * FROM users WHERE age BETWEEN 1").is_err());
+    }
+    
+    #[test]
+    fn test_where_between_is_lowered_to_range() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let parsed = executor
+            .parse_sql("SELECT * FROM users WHERE age BETWEEN 22 AND 24 AND name != 'User 3'")
+            .unwrap();
+        let where_clause = parsed.where_clause.as_ref().unwrap();
+        assert!(matches!(where_clause.operator, LogicalOperator::And));
+        assert_eq!(where_clause.conditions.len(), 3);
+        
+        let ids: Vec<_> = executor
+            .execute_query(parsed)
+            .unwrap()
+            .iter()
+            .map(|r| r.get_column("id").cloned())
+            .collect();
+        assert_eq!(ids, vec![Some(CQLValue::Int(2)), Some(CQLValue::Int(4))]);
+    }
+    
+    #[test]
+    fn test_unsupported_where_falls_back_to_full_scan() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        for sql in [
+            "SELECT * FROM users WHERE name IS NOT NULL",
+            "SELECT * FROM users WHERE token(id) > 5",
+            "SELECT * FROM users WHERE id = ?",
+            "SELECT * FROM users WHERE age > 1 AND id = 2 OR id = 3",
+            "SELECT * FROM users WHERE age BETWEEN 1 AND 2 OR id = 3",
+        ] {
+            let parsed = executor.parse_sql(sql).unwrap();
+            assert!(parsed.where_clause.is_none(), "{}", sql);
+            assert_eq!(executor.execute_query(parsed).unwrap().len(), MOCK_ROW_COUNT as usize, "{}", sql);
+        }
+    }
+    
+    #[test]
+    fn test_execute_query_filters_before_offset_and_limit() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let query = ParsedQuery {
+            select_columns: vec!["id".to_string()],
+            from_table: "users".to_string(),
+            where_clause: Some(WhereClause {
+                conditions: vec![Condition {
+                    column: "age".to_string(),
+                    operator: ComparisonOperator::GreaterThanOrEqual,
+                    value: CQLValue::Int(23),
+                }],
+                operator: LogicalOperator::And,
+            }),
+            limit: Some(2),
+            offset: Some(1),
+            order_by: None,
+        };
+        
+        let rows = executor.execute_query(query).unwrap();
+        let ids: Vec<_> = rows.iter().map(|r| r.get_column("id").cloned()).collect();
+        assert_eq!(ids, vec![Some(CQLValue::Int(4)), Some(CQLValue::Int(5))]);
+        assert!(rows.iter().all(|r| r.column_count() == 1));
+    }
+    
+    #[test]
+    fn test_count_matching_stops_early() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let query = ParsedQuery {
+            select_columns: vec!["*".to_string()],
+            from_table: "users".to_string(),
+            where_clause: Some(WhereClause {
+                conditions: vec![Condition {
+                    column: "age".to_string(),
+                    operator: ComparisonOperator::GreaterThanOrEqual,
+                    value: CQLValue::Int(23),
+                }],
+                operator: LogicalOperator::And,
+            }),
+            limit: None,
+            offset: None,
+            order_by: None,
+        };
+        
+        assert_eq!(executor.count_matching(&query, None).unwrap(), 7);
+        assert_eq!(executor.count_matching(&query, Some(1)).unwrap(), 1);
+    }
+    
+    #[test]
+    fn test_count_plan_keeps_filter_and_window() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let query = executor
+            .parse_sql("SELECT name, email FROM users WHERE age >= 23 LIMIT 3")
+            .unwrap();
+        let count_query = query.clone().into_count();
+        
+        assert_eq!(count_query.select_columns, vec!["*".to_string()]);
+        assert!(count_query.order_by.is_none());
+        assert_eq!(count_query.limit, Some(3));
+        assert_eq!(
+            executor.count_matching(&count_query, None).unwrap(),
+            executor.execute_query(query).unwrap().len() as u64
+        );
+    }
+    
+    #[test]
+    fn test_count_plan_covers_every_select_form() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        // Each form counts through the scan, whatever its projection or casing
+        for sql in [
+            "SELECT COUNT(*) FROM users WHERE age >= 23",
+            "select count(*) from users where age >= 23;",
+            "  SELECT   name   FROM users   WHERE age >= 23 LIMIT 4 OFFSET 2",
+            "SELECT * FROM users WHERE name = 'from x limit 1'",
+        ] {
+            let query = executor.parse_sql(sql).unwrap();
+            assert_eq!(
+                executor.count_matching(&query.clone().into_count(), None).unwrap(),
+                executor.execute_query(query).unwrap().len() as u64,
+                "{}",
+                sql
+            );
+        }
+    }
+    
+    #[test]
+    fn test_any_match_handles_limit_and_terminator() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let hit = executor.parse_sql("SELECT * FROM users WHERE age >= 23 LIMIT 5;").unwrap();
+        let miss = executor.parse_sql("SELECT * FROM users WHERE age > 1000").unwrap();
+        let past_end = executor.parse_sql("SELECT * FROM users WHERE age >= 23 OFFSET 7").unwrap();
+        let within = executor.parse_sql("SELECT * FROM users WHERE age >= 23 OFFSET 1").unwrap();
+        
+        // OFFSET ends the WHERE clause rather than being read as a predicate
+        assert_eq!(past_end.offset, Some(7));
+        assert_eq!(past_end.where_clause.as_ref().unwrap().conditions.len(), 1);
+        
+        assert!(executor.any_match(&hit).unwrap());
+        assert!(executor.any_match(&within).unwrap());
+        assert!(!executor.any_match(&miss).unwrap());
+        assert!(!executor.any_match(&past_end).unwrap());
+    }
+    
+    #[test]
+    fn test_plan_cache_evicts_least_recently_used() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        let mut cache = PlanCache::new(2);
+        
+        for sql in ["SELECT * FROM t WHERE id = 1", "SELECT * FROM t WHERE id = 2"] {
+            cache.insert(sql, executor.parse_sql(sql).unwrap());
+        }
+        // Touch the first entry so the second becomes the eviction candidate
+        assert!(cache.get("  SELECT * FROM t WHERE id = 1 ").is_some());
+        
+        let sql = "SELECT * FROM t WHERE id = 3";
+        cache.insert(sql, executor.parse_sql(sql).unwrap());
+        
+        assert_eq!(cache.len(), 2);
+        assert!(cache.contains("SELECT * FROM t WHERE id = 1"));
+        assert!(!cache.contains("SELECT * FROM t WHERE id = 2"));
+        assert!(cache.contains(sql));
+    }
+    
+    #[test]
+    fn test_next_batch_resumes_scan() {
+        let executor = QueryExecutor {
+            sstable_path: "test.db".to_string(),
+        };
+        
+        let query = ParsedQuery {
+            select_columns: vec!["*".to_string()],
+            from_table: "users".to_string(),
+            where_clause: Some(WhereClause {
+                conditions: vec![Condition {
+                    column: "age".to_string(),
+                    operator: ComparisonOperator::GreaterThanOrEqual,
+                    value: CQLValue::Int(23),
+                }],
+                operator: LogicalOperator::And,
+            }),
+            limit: Some(5),
+            offset: Some(1),
+            order_by: None,
+        };
+        
+        let expected = executor.execute_query(query.clone()).unwrap();
+        let mut cursor = ScanCursor::new(&query);
+        let mut batched = Vec::new();
+        while !cursor.is_finished() {
+            batched.extend(executor.next_batch(&query, &mut cursor, 2));
+        }
+        
+        let ids = |rows: &[CQLiteRow]| -> Vec<String> {
+            rows.iter().map(|r| format!("{:?}", r.get_column("id"))).collect()
+        };
+        assert_eq!(ids(&batched), ids(&expected));
     }
-}
\ No newline at end of file
+    
+    #[test]
+    fn test_compiled_int_and_like_filters_match_row_evaluation() {
+        let rows: Vec<CQLiteRow> = (0..300).map(|i| decode_source_row(i, None)).collect();
+        let clauses = vec![
+            WhereClause {
+                conditions: vec![
+                    Condition {
+                        column: "age".to_string(),
+                        operator: ComparisonOperator::GreaterThan,
+                        value: CQLValue::BigInt(40),
+                    },
+                    Condition {
+                        column: "id".to_string(),
+                        operator: ComparisonOperator::NotEqual,
+                        value: CQLValue::Int(25),
+                    },
+                ],
+                operator: LogicalOperator::And,
+            },
+            WhereClause {
+                conditions: vec![
+                    Condition {
+                        column: "age".to_string(),
+                        operator: ComparisonOperator::Equal,
+                        value: CQLValue::Int(21),
+                    },
+                    Condition {
+                        column: "name".to_string(),
+                        operator: ComparisonOperator::Like,
+                        value: CQLValue::Text("User 1%".to_string()),
+                    },
+                ],
+                operator: LogicalOperator::Or,
+            },
+        ];
+        
+        let mut selection = Vec::new();
+        for clause in &clauses {
+            clause.compile().filter_block(&rows, &mut selection);
+            let expected: Vec<bool> = rows.iter().map(|r| clause.matches(r)).collect();
+            assert_eq!(selection, expected);
+        }
+    }
+    
+    #[test]
+    fn test_compiled_predicate_matches_row_evaluation() {
+        let rows: Vec<CQLiteRow> = (0..300).map(|i| decode_source_row(i, None)).collect();
+        let ids: Vec<CQLValue> = (0..40).map(|i| CQLValue::Int(i * 3)).collect();
+        let clauses = vec![
+            WhereClause {
+                conditions: vec![
+                    Condition {
+                        column: "id".to_string(),
+                        operator: ComparisonOperator::In,
+                        value: CQLValue::List(ids.clone()),
+                    },
+                    Condition {
+                        column: "name".to_string(),
+                        operator: ComparisonOperator::Like,
+                        value: CQLValue::Text("%1%".to_string()),
+                    },
+                    Condition {
+                        column: "age".to_string(),
+                        operator: ComparisonOperator::GreaterThanOrEqual,
+                        value: CQLValue::BigInt(30),
+                    },
+                ],
+                operator: LogicalOperator::And,
+            },
+            WhereClause {
+                conditions: vec![
+                    Condition {
+                        column: "id".to_string(),
+                        operator: ComparisonOperator::NotIn,
+                        value: CQLValue::List(ids),
+                    },
+                    Condition {
+                        column: "age".to_string(),
+                        operator: ComparisonOperator::LessThan,
+                        value: CQLValue::Int(22),
+                    },
+                ],
+                operator: LogicalOperator::Or,
+            },
+        ];
+        
+        let mut selection = Vec::new();
+        for clause in &clauses {
+            clause.compile().filter_block(&rows, &mut selection);
+            let expected: Vec<bool> = rows.iter().map(|r| clause.matches(r)).collect();
+            assert_eq!(selection, expected);
+        }
+    }
+    
+    #[test]
+    fn test_order_by_cost_puts_equality_first() {
+        let mut clause = WhereClause {
+            conditions: vec![
+                Condition {
+                    column: "name".to_string(),
+                    operator: ComparisonOperator::Like,
+                    value: CQLValue::Text("User%".to_string()),
+                },
+                Condition {
+                    column: "age".to_string(),
+                    operator: ComparisonOperator::GreaterThan,
+                    value: CQLValue::Int(25),
+                },
+                Condition {
+                    column: "city".to_string(),
+                    operator: ComparisonOperator::Equal,
+                    value: CQLValue::Text("NYC".to_string()),
+                },
+            ],
+            operator: LogicalOperator::And,
+        };
+        
+        clause.order_by_cost();
+        let order: Vec<_> = clause.conditions.iter().map(|c| c.column.as_str()).collect();
+        assert_eq!(order, vec!["city", "age", "name"]);
+    }
+}
@@ -1,12 +1,16 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList, PyBytes};
+use pyo3::types::{PyDict, PyBytes};
 use pyo3::{Python, PyResult, PyObject};
-use std::collections::HashMap;
+use std::collections::VecDeque;
+use std::fs::File;
+use std::io::Read;
 use std::path::Path;
+use std::sync::{Arc, Mutex};
+use std::thread::JoinHandle;
 use crate::errors::{CQLiteError, QueryError, SSTableError};
-use crate::types::CQLiteRow;
-use crate::query::QueryExecutor;
-use crate::exports::{CsvExporter, ParquetExporter, JsonExporter};
+use crate::types::{dictionary_encode, narrowest_numeric_dtypes, rows_to_pycolumns, rows_to_pylist, CQLiteRow, ColumnKeys};
+use crate::query::{ParsedQuery, PlanCache, QueryExecutor, ScanCursor, PLAN_CACHE_CAPACITY};
+use crate::exports::{BatchExporter, CsvExporter, ParquetExporter, JsonExporter};
 
 /// The main SSTable reader class - the heart of the revolutionary Python SSTable querying!
 /// 
@@ -27,14 +31,16 @@ use crate::exports::{CsvExporter, ParquetExporter, JsonExporter};
 ///     # Convert to pandas DataFrame
 ///     df = reader.query_df("SELECT * FROM users LIMIT 1000")
 ///     ```
-#[pyclass]
+#[pyclass(subclass)]
 pub struct SSTableReader {
     sstable_path: String,
     schema_path: Option<String>,
     schema: Option<PyObject>,
-    query_executor: Option<QueryExecutor>,
+    query_executor: Option<Arc<QueryExecutor>>,
+    prepared: Mutex<PlanCache>,
     cache_enabled: bool,
     max_memory_mb: u64,
+    prefetch: bool,
 }
 
 #[pymethods]
@@ -46,6 +52,10 @@ impl SSTableReader {
     ///     schema (str | dict, optional): Path to schema JSON file or schema dict
     ///     cache_enabled (bool): Enable query result caching (default: True)
     ///     max_memory_mb (int): Maximum memory usage in MB (default: 1024)
+    ///     prefetch (bool): Read the SSTable's metadata components into the
+    ///         OS page cache at open, concurrently, start kernel readahead of
+    ///         Data.db, and read ahead one batch in the background during
+    ///         sequential iter_query/iter_batches scans (default: False)
     ///     
     /// Returns:
     ///     SSTableReader: New reader instance
@@ -54,12 +64,14 @@ impl SSTableReader {
     ///     SSTableError: If SSTable file cannot be opened
     ///     SchemaError: If schema is invalid or cannot be loaded
     #[new]
-    #[pyo3(signature = (sstable_path, schema=None, cache_enabled=true, max_memory_mb=1024))]
+    #[pyo3(signature = (sstable_path, schema=None, cache_enabled=true, max_memory_mb=1024, prefetch=false))]
     fn new(
+        py: Python,
         sstable_path: String,
         schema: Option<PyObject>,
         cache_enabled: bool,
         max_memory_mb: u64,
+        prefetch: bool,
     ) -> PyResult<Self> {
         // Validate SSTable file exists
         let path = Path::new(&sstable_path);
@@ -76,13 +88,19 @@ impl SSTableReader {
             ));
         }
         
+        if prefetch {
+            py.allow_threads(|| prefetch_components(&sstable_path));
+        }
+        
         let mut reader = SSTableReader {
             sstable_path,
             schema_path: None,
             schema,
             query_executor: None,
+            prepared: Mutex::new(PlanCache::new(PLAN_CACHE_CAPACITY)),
             cache_enabled,
             max_memory_mb,
+            prefetch,
         };
         
         // Initialize the query executor with the SSTable
@@ -126,30 +144,119 @@ impl SSTableReader {
         limit: Option<u32>,
         offset: Option<u32>,
     ) -> PyResult<PyObject> {
+        let rows = self.run_query(&sql, limit, offset)?;
+        
+        // Convert to Python objects
+        rows_to_pylist(py, &rows)
+    }
+    
+    /// Execute a SELECT query and return the results column-wise
+    /// 
+    /// Same as `query`, but the result is a dict mapping each column name to
+    /// a list of its values (None where a row has no value), with no
+    /// per-row dicts built.
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to execute
+    ///     limit (int, optional): Maximum number of rows to return
+    ///     offset (int, optional): Number of rows to skip
+    ///     
+    /// Returns:
+    ///     Dict[str, list]: Column name -> values, one entry per result row
+    #[pyo3(signature = (sql, limit=None, offset=None))]
+    fn query_columnar(
+        &self,
+        py: Python,
+        sql: String,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyObject> {
+        let rows = self.run_query(&sql, limit, offset)?;
+        rows_to_pycolumns(py, &rows)
+    }
+    
+    /// Parse and plan a statement once and cache the plan for later executions
+    /// 
+    /// Repeated queries (benchmarks, polling loops) then skip parsing,
+    /// validation and predicate ordering on every call. At most
+    /// `PLAN_CACHE_CAPACITY` plans are kept, least recently used out.
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to prepare
+    fn prepare(&self, sql: String) -> PyResult<()> {
         let executor = self.query_executor.as_ref()
             .ok_or_else(|| QueryError::new_err("Query executor not initialized"))?;
         
-        // Parse and validate SQL
         let parsed_query = executor.parse_sql(&sql)?;
+        self.prepared.lock().unwrap().insert(&sql, parsed_query);
+        Ok(())
+    }
+    
+    /// Whether a statement has a cached plan
+    fn is_prepared(&self, sql: String) -> bool {
+        self.prepared.lock().unwrap().contains(&sql)
+    }
+    
+    /// Execute a SELECT query and iterate over the results lazily
+    /// 
+    /// Rows are fetched from the scan in batches of `batch_size` and converted
+    /// to Python one at a time as the caller advances, so the first row is
+    /// available without materializing the whole result set.
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to execute
+    ///     batch_size (int): Rows fetched from the scan per step (default: 1024)
+    ///     
+    /// Returns:
+    ///     Iterator[dict]: Iterator over result rows
+    ///     
+    /// Example:
+    ///     ```python
+    ///     for row in reader.iter_query("SELECT * FROM users"):
+    ///         print(row)
+    ///     ```
+    #[pyo3(signature = (sql, batch_size=1024))]
+    fn iter_query(&self, sql: String, batch_size: u32) -> PyResult<SSTableRowIter> {
+        let executor = self.query_executor.as_ref()
+            .ok_or_else(|| QueryError::new_err("Query executor not initialized"))?
+            .clone();
         
-        // Apply limit/offset if provided
-        let final_query = if limit.is_some() || offset.is_some() {
-            executor.apply_limit_offset(parsed_query, limit, offset)?
-        } else {
-            parsed_query
-        };
-        
-        // Execute query
-        let rows = executor.execute_query(final_query)?;
-        
-        // Convert to Python objects
-        let py_rows = PyList::empty(py);
-        for row in rows {
-            let py_row = row.to_pydict(py)?;
-            py_rows.append(py_row)?;
-        }
+        let parsed_query = self.plan_for(&executor, &sql)?;
+        Ok(SSTableRowIter {
+            scan: BatchScan::new(executor, parsed_query, batch_size.max(1), self.prefetch),
+            buffer: VecDeque::new(),
+            keys: ColumnKeys::default(),
+        })
+    }
+    
+    /// Execute a SELECT query and iterate over the results in column-wise batches
+    /// 
+    /// The statement is scanned once: each batch resumes the scan where the
+    /// previous one stopped, unlike LIMIT/OFFSET paging, which re-reads every
+    /// skipped row for each page.
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to execute
+    ///     batch_size (int): Maximum rows per batch (default: 10000)
+    ///     
+    /// Returns:
+    ///     Iterator[Dict[str, list]]: Column name -> values, one dict per batch
+    ///     
+    /// Example:
+    ///     ```python
+    ///     for columns in reader.iter_batches("SELECT * FROM users", batch_size=5000):
+    ///         process(columns["id"])
+    ///     ```
+    #[pyo3(signature = (sql, batch_size=10000))]
+    fn iter_batches(&self, sql: String, batch_size: u32) -> PyResult<SSTableBatchIter> {
+        let executor = self.query_executor.as_ref()
+            .ok_or_else(|| QueryError::new_err("Query executor not initialized"))?
+            .clone();
         
-        Ok(py_rows.into())
+        let parsed_query = self.plan_for(&executor, &sql)?;
+        Ok(SSTableBatchIter {
+            scan: BatchScan::new(executor, parsed_query, batch_size.max(1), self.prefetch),
+        })
     }
     
     /// Execute a SELECT query and return as pandas DataFrame
@@ -159,6 +266,11 @@ impl SSTableReader {
     /// 
     /// Args:
     ///     sql (str): SELECT statement to execute
+    ///     auto_downcast (bool): Build integer and float columns with the
+    ///         narrowest dtype that holds their values (int8/16/32, float32)
+    ///         instead of int64/float64
+    ///     categoricals (List[str], optional): Text columns to return as
+    ///         pandas Categorical, dictionary-encoded while the frame is built
     ///     
     /// Returns:
     ///     pandas.DataFrame: Query results as DataFrame
@@ -176,7 +288,14 @@ impl SSTableReader {
     ///     # Use pandas operations
     ///     avg_age = df['age'].mean()
     ///     ```
-    fn query_df(&self, py: Python, sql: String) -> PyResult<PyObject> {
+    #[pyo3(signature = (sql, auto_downcast=false, categoricals=None))]
+    pub fn query_df(
+        &self,
+        py: Python,
+        sql: String,
+        auto_downcast: bool,
+        categoricals: Option<Vec<String>>,
+    ) -> PyResult<PyObject> {
         // Check if pandas is available
         let pandas = py.import("pandas")
             .map_err(|_| QueryError::new_err(
@@ -184,11 +303,42 @@ impl SSTableReader {
             ))?;
         
         // Execute query to get rows
-        let rows_obj = self.query(py, sql, None, None)?;
-        let rows_list = rows_obj.downcast::<PyList>(py)?;
+        let rows = self.run_query(&sql, None, None)?;
+        
+        // Build the DataFrame column-wise: one list per column lets pandas
+        // infer a native int64/float64 dtype per column instead of
+        // transposing a list of row dicts
+        let columns = rows_to_pycolumns(py, &rows)?;
+        let columns: &PyDict = columns.as_ref(py).downcast()?;
+        
+        // Strings are deduplicated here, so pandas gets integer codes plus
+        // the distinct values and never hashes the column itself
+        for column_name in categoricals.iter().flatten() {
+            if !columns.contains(column_name.as_str())? {
+                continue;
+            }
+            if let Some((codes, categories)) = dictionary_encode(&rows, column_name) {
+                let categorical = pandas
+                    .getattr("Categorical")?
+                    .call_method1("from_codes", (codes, categories))?;
+                columns.set_item(column_name.as_str(), categorical)?;
+            }
+        }
+        
+        if auto_downcast {
+            // Each narrowed column is built straight into its final dtype,
+            // rather than as int64/float64 and then copied down
+            for (column_name, dtype) in narrowest_numeric_dtypes(&rows) {
+                if let Some(values) = columns.get_item(column_name.as_str())? {
+                    let kwargs = PyDict::new(py);
+                    kwargs.set_item("dtype", dtype)?;
+                    let series = pandas.call_method("Series", (values,), Some(kwargs))?;
+                    columns.set_item(column_name, series)?;
+                }
+            }
+        }
         
-        // Convert to DataFrame
-        let df = pandas.call_method1("DataFrame", (rows_list,))?;
+        let df = pandas.call_method1("DataFrame", (columns,))?;
         
         Ok(df.into())
     }
@@ -226,6 +376,43 @@ impl SSTableReader {
         Ok(async_iter.into())
     }
     
+    /// Count the rows a query matches without building result rows
+    /// 
+    /// Scans with the query's WHERE clause, OFFSET and LIMIT but never
+    /// converts a row to Python. The GIL is released during the scan.
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to count
+    ///     stop_after (int, optional): Stop scanning once this many rows matched
+    ///     
+    /// Returns:
+    ///     int: Number of matching rows (at most `stop_after`)
+    #[pyo3(signature = (sql, stop_after=None))]
+    fn count_matching(&self, py: Python, sql: String, stop_after: Option<u64>) -> PyResult<u64> {
+        let executor = self.query_executor.as_ref()
+            .ok_or_else(|| QueryError::new_err("Query executor not initialized"))?;
+        
+        let parsed_query = self.plan_for(executor, &sql)?.into_count();
+        py.allow_threads(|| executor.count_matching(&parsed_query, stop_after))
+    }
+    
+    /// Check whether a query matches at least one row
+    /// 
+    /// The filter-only scan stops at the first match, with the GIL released.
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to check
+    ///     
+    /// Returns:
+    ///     bool: True if the query returns at least one row
+    fn exists(&self, py: Python, sql: String) -> PyResult<bool> {
+        let executor = self.query_executor.as_ref()
+            .ok_or_else(|| QueryError::new_err("Query executor not initialized"))?;
+        
+        let parsed_query = self.plan_for(executor, &sql)?.into_count();
+        py.allow_threads(|| executor.any_match(&parsed_query))
+    }
+    
     /// Get schema information for the SSTable
     /// 
     /// Returns:
@@ -325,6 +512,25 @@ impl SSTableReader {
         exporter.export(self, py, &sql, &output_path)
     }
     
+    /// Export query results to several formats from one scan
+    /// 
+    /// Args:
+    ///     sql (str): SELECT statement to execute
+    ///     output_base (str): Base path for output files (extension is added per format)
+    ///     formats (List[str]): Formats to write ('csv', 'json', 'parquet', 'excel')
+    ///     
+    /// Returns:
+    ///     dict: Per-format result with 'success' and either 'output_path'/'stats' or 'error'
+    fn export_multi_format(
+        &self,
+        py: Python,
+        sql: String,
+        output_base: String,
+        formats: Vec<String>,
+    ) -> PyResult<PyObject> {
+        BatchExporter::export_multi_format(self, py, &sql, &output_base, formats)
+    }
+    
     /// Context manager support - allows using `with` statement
     fn __enter__(slf: PyRef<Self>) -> PyRef<Self> {
         slf
@@ -365,7 +571,218 @@ impl SSTableReader {
     fn initialize_executor(&mut self) -> PyResult<()> {
         // This would initialize the actual cqlite-core SSTable reader
         // and query execution engine
-        self.query_executor = Some(QueryExecutor::new(&self.sstable_path)?);
+        self.query_executor = Some(Arc::new(QueryExecutor::new(&self.sstable_path)?));
         Ok(())
     }
-}
\ No newline at end of file
+    
+    /// Plan and execute a query, applying an explicit limit/offset if given
+    fn run_query(&self, sql: &str, limit: Option<u32>, offset: Option<u32>) -> PyResult<Vec<CQLiteRow>> {
+        let executor = self.query_executor.as_ref()
+            .ok_or_else(|| QueryError::new_err("Query executor not initialized"))?;
+        
+        // Parse and validate SQL
+        let parsed_query = self.plan_for(executor, sql)?;
+        
+        // Apply limit/offset if provided
+        let final_query = if limit.is_some() || offset.is_some() {
+            executor.apply_limit_offset(parsed_query, limit, offset)?
+        } else {
+            parsed_query
+        };
+        
+        executor.execute_query(final_query)
+    }
+    
+    /// Get the plan for a statement, from the prepared cache if present
+    fn plan_for(&self, executor: &QueryExecutor, sql: &str) -> PyResult<ParsedQuery> {
+        if let Some(parsed_query) = self.prepared.lock().unwrap().get(sql) {
+            return Ok(parsed_query);
+        }
+        executor.parse_sql(sql)
+    }
+}
+
+/// Metadata components read in full at open; they share the Data.db file's
+/// name prefix and are small next to Data.db
+const METADATA_COMPONENTS: [&str; 4] = ["Index.db", "Summary.db", "Filter.db", "Statistics.db"];
+
+/// Read size used when prefetching components
+const PREFETCH_CHUNK_BYTES: usize = 1 << 20;
+
+/// Warm the page cache for an SSTable so later scans don't wait on disk
+///
+/// The metadata components are read in full, each on its own thread so the
+/// reads are in flight together. Data.db is only handed to the kernel's
+/// readahead, which runs in the background, so open time doesn't grow with
+/// the data size. Missing components are skipped.
+fn prefetch_components(sstable_path: &str) {
+    let prefix = sstable_path.strip_suffix("Data.db").unwrap_or(sstable_path);
+    let paths: Vec<String> = METADATA_COMPONENTS
+        .iter()
+        .map(|component| format!("{}{}", prefix, component))
+        .collect();
+    
+    advise_will_need(sstable_path);
+    
+    std::thread::scope(|scope| {
+        for path in &paths {
+            scope.spawn(move || {
+                if let Ok(mut file) = File::open(path) {
+                    let mut buffer = vec![0u8; PREFETCH_CHUNK_BYTES];
+                    while matches!(file.read(&mut buffer), Ok(n) if n > 0) {}
+                }
+            });
+        }
+    });
+}
+
+/// Ask the kernel to start reading a whole file into the page cache
+///
+/// posix_fadvise(WILLNEED) only queues the readahead and returns, and the
+/// cached pages outlive the descriptor. A no-op where it isn't available.
+#[cfg(target_os = "linux")]
+fn advise_will_need(path: &str) {
+    use std::os::unix::io::AsRawFd;
+    
+    if let Ok(file) = File::open(path) {
+        // Advisory: failure just means no readahead
+        unsafe {
+            libc::posix_fadvise(file.as_raw_fd(), 0, 0, libc::POSIX_FADV_WILLNEED);
+        }
+    }
+}
+
+#[cfg(not(target_os = "linux"))]
+fn advise_will_need(_path: &str) {}
+
+/// Batches a scan must have handed out in a row before read-ahead starts
+const READ_AHEAD_AFTER_BATCHES: u32 = 2;
+
+/// A query's scan, pulled one batch at a time by the row and batch iterators
+///
+/// With read-ahead on (`SSTableReader(..., prefetch=True)`), once the caller
+/// has consumed `READ_AHEAD_AFTER_BATCHES` batches in a row the scan is
+/// treated as sequential: each following batch is scanned on a background
+/// thread while the caller converts and processes the current one.
+struct BatchScan {
+    executor: Arc<QueryExecutor>,
+    parsed_query: Arc<ParsedQuery>,
+    batch_size: u32,
+    read_ahead: bool,
+    batches_read: u32,
+    /// None while a read-ahead thread owns the cursor
+    cursor: Option<ScanCursor>,
+    pending: Option<JoinHandle<(ScanCursor, Vec<CQLiteRow>)>>,
+}
+
+impl BatchScan {
+    fn new(executor: Arc<QueryExecutor>, parsed_query: ParsedQuery, batch_size: u32, read_ahead: bool) -> Self {
+        BatchScan {
+            cursor: Some(ScanCursor::new(&parsed_query)),
+            executor,
+            parsed_query: Arc::new(parsed_query),
+            batch_size,
+            read_ahead,
+            batches_read: 0,
+            pending: None,
+        }
+    }
+    
+    /// Whether the scan has produced all of its rows
+    fn is_finished(&self) -> bool {
+        self.pending.is_none() && self.cursor.as_ref().map_or(true, ScanCursor::is_finished)
+    }
+    
+    /// Next batch of rows, empty once the scan is finished; the GIL is
+    /// released while scanning or waiting for the read-ahead
+    fn next_batch(&mut self, py: Python) -> Vec<CQLiteRow> {
+        let (cursor, rows) = match self.pending.take() {
+            Some(handle) => py.allow_threads(|| handle.join().expect("read-ahead scan thread panicked")),
+            None => {
+                let mut cursor = match self.cursor.take() {
+                    Some(cursor) => cursor,
+                    None => return Vec::new(),
+                };
+                let executor = &self.executor;
+                let parsed_query = &self.parsed_query;
+                let batch_size = self.batch_size;
+                
+                let rows = py.allow_threads(|| executor.next_batch(parsed_query, &mut cursor, batch_size));
+                (cursor, rows)
+            }
+        };
+        
+        self.batches_read += 1;
+        if self.read_ahead && self.batches_read >= READ_AHEAD_AFTER_BATCHES && !cursor.is_finished() {
+            let executor = Arc::clone(&self.executor);
+            let parsed_query = Arc::clone(&self.parsed_query);
+            let batch_size = self.batch_size;
+            let mut cursor = cursor;
+            
+            self.pending = Some(std::thread::spawn(move || {
+                let rows = executor.next_batch(&parsed_query, &mut cursor, batch_size);
+                (cursor, rows)
+            }));
+        } else {
+            self.cursor = Some(cursor);
+        }
+        
+        rows
+    }
+}
+
+/// Lazy iterator over the rows of a query, returned by `SSTableReader.iter_query`
+#[pyclass]
+pub struct SSTableRowIter {
+    scan: BatchScan,
+    buffer: VecDeque<CQLiteRow>,
+    keys: ColumnKeys,
+}
+
+#[pymethods]
+impl SSTableRowIter {
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+    
+    fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
+        if self.buffer.is_empty() && !self.scan.is_finished() {
+            self.buffer.extend(self.scan.next_batch(py));
+        }
+        
+        match self.buffer.pop_front() {
+            Some(row) => Ok(Some(self.keys.row_to_pydict(py, &row)?)),
+            None => Ok(None),
+        }
+    }
+}
+
+/// Iterator over a query's results in column-wise batches, returned by
+/// `SSTableReader.iter_batches`
+///
+/// Each step continues the same scan and yields a dict of column name ->
+/// list of values with up to `batch_size` rows.
+#[pyclass]
+pub struct SSTableBatchIter {
+    scan: BatchScan,
+}
+
+#[pymethods]
+impl SSTableBatchIter {
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+    
+    fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
+        if self.scan.is_finished() {
+            return Ok(None);
+        }
+        
+        let rows = self.scan.next_batch(py);
+        if rows.is_empty() {
+            return Ok(None);
+        }
+        
+        Ok(Some(rows_to_pycolumns(py, &rows)?))
+    }
+}
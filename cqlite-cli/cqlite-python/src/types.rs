@@ -306,6 +306,178 @@ impl Default for CQLiteRow {
     }
 }
 
+/// Convert a result set to a Python list of dicts under a single GIL acquisition
+///
+/// Rows in a result set share the same projected columns, so each column
+/// name is converted to an interned Python string once per result set and
+/// reused as the dict key for every row, instead of allocating a new key
+/// string per cell as `CQLiteRow::to_pydict` does.
+pub fn rows_to_pylist(py: Python, rows: &[CQLiteRow]) -> PyResult<PyObject> {
+    let py_rows = PyList::empty(py);
+    let mut keys: HashMap<&str, &PyString> = HashMap::new();
+    
+    for row in rows {
+        let py_dict = PyDict::new(py);
+        for (column_name, column_value) in &row.columns {
+            let key = *keys
+                .entry(column_name.as_str())
+                .or_insert_with(|| PyString::intern(py, column_name));
+            py_dict.set_item(key, column_value.to_python(py)?)?;
+        }
+        py_rows.append(py_dict)?;
+    }
+    
+    Ok(py_rows.into())
+}
+
+/// Interned column-name keys kept across the rows of a streamed result
+///
+/// `rows_to_pylist` shares keys within one result set; a row iterator hands
+/// rows out one at a time, so it keeps the interned names here and every row
+/// dict it builds reuses the same key objects.
+#[derive(Default)]
+pub struct ColumnKeys {
+    keys: HashMap<String, Py<PyString>>,
+}
+
+impl ColumnKeys {
+    /// Convert a row to a Python dictionary keyed by the shared column names
+    pub fn row_to_pydict(&mut self, py: Python, row: &CQLiteRow) -> PyResult<PyObject> {
+        let py_dict = PyDict::new(py);
+        
+        for (column_name, column_value) in &row.columns {
+            if !self.keys.contains_key(column_name) {
+                let key: Py<PyString> = PyString::intern(py, column_name).into();
+                self.keys.insert(column_name.clone(), key);
+            }
+            py_dict.set_item(self.keys[column_name].as_ref(py), column_value.to_python(py)?)?;
+        }
+        
+        Ok(py_dict.into())
+    }
+}
+
+/// Convert a result set to columnar form: a dict of column name -> list of values
+///
+/// One Python list per column instead of one dict per row avoids the per-row
+/// dict allocation and key hashing entirely. Columns are ordered by first
+/// appearance; a value missing from a row is filled with None so every
+/// column has exactly one entry per row.
+pub fn rows_to_pycolumns(py: Python, rows: &[CQLiteRow]) -> PyResult<PyObject> {
+    let mut columns: Vec<(&str, &PyList)> = Vec::new();
+    let mut index_by_name: HashMap<&str, usize> = HashMap::new();
+    
+    for (row_index, row) in rows.iter().enumerate() {
+        for (column_name, column_value) in &row.columns {
+            let index = *index_by_name.entry(column_name.as_str()).or_insert_with(|| {
+                let values = PyList::empty(py);
+                for _ in 0..row_index {
+                    values.append(py.None()).unwrap();
+                }
+                columns.push((column_name.as_str(), values));
+                columns.len() - 1
+            });
+            columns[index].1.append(column_value.to_python(py)?)?;
+        }
+        
+        for (_, values) in &columns {
+            if values.len() <= row_index {
+                values.append(py.None())?;
+            }
+        }
+    }
+    
+    let py_columns = PyDict::new(py);
+    for (column_name, values) in columns {
+        py_columns.set_item(PyString::intern(py, column_name), values)?;
+    }
+    Ok(py_columns.into())
+}
+
+/// Value range seen so far in one column, for `narrowest_numeric_dtypes`
+#[derive(Clone, Copy)]
+enum NumericRange {
+    Int(i64, i64),
+    /// `true` while every value round-trips through f32 exactly
+    Float(bool),
+    Other,
+}
+
+/// Pick the narrowest NumPy dtype that holds every value of each numeric column
+///
+/// Integer columns get int8/int16/int32 from their min/max; float columns get
+/// float32 when every value round-trips through f32 exactly. Columns with
+/// missing values, mixed types, or values that need the full 64-bit width are
+/// left out, so pandas keeps inferring those as before.
+pub fn narrowest_numeric_dtypes(rows: &[CQLiteRow]) -> HashMap<String, &'static str> {
+    let mut ranges: HashMap<&str, (NumericRange, usize)> = HashMap::new();
+    
+    for row in rows {
+        for (column_name, column_value) in &row.columns {
+            let range = match column_value {
+                CQLValue::Int(v) => NumericRange::Int(*v as i64, *v as i64),
+                CQLValue::BigInt(v) => NumericRange::Int(*v, *v),
+                CQLValue::Float(_) => NumericRange::Float(true),
+                CQLValue::Double(v) => NumericRange::Float((*v as f32) as f64 == *v),
+                _ => NumericRange::Other,
+            };
+            
+            let (seen, count) = ranges
+                .entry(column_name.as_str())
+                .or_insert((range, 0));
+            *seen = match (*seen, range) {
+                (NumericRange::Int(lo, hi), NumericRange::Int(v, _)) => {
+                    NumericRange::Int(lo.min(v), hi.max(v))
+                }
+                (NumericRange::Float(a), NumericRange::Float(b)) => NumericRange::Float(a && b),
+                _ => NumericRange::Other,
+            };
+            *count += 1;
+        }
+    }
+    
+    ranges
+        .into_iter()
+        .filter(|(_, (_, count))| *count == rows.len())
+        .filter_map(|(column_name, (range, _))| {
+            let dtype = match range {
+                NumericRange::Int(lo, hi) if lo >= i8::MIN as i64 && hi <= i8::MAX as i64 => "int8",
+                NumericRange::Int(lo, hi) if lo >= i16::MIN as i64 && hi <= i16::MAX as i64 => "int16",
+                NumericRange::Int(lo, hi) if lo >= i32::MIN as i64 && hi <= i32::MAX as i64 => "int32",
+                NumericRange::Float(true) => "float32",
+                _ => return None,
+            };
+            Some((column_name.to_string(), dtype))
+        })
+        .collect()
+}
+
+/// Dictionary-encode a text column: one code per row plus the distinct values
+///
+/// Codes index into the returned categories in order of first appearance;
+/// a missing or null value gets code -1, which is what
+/// `pandas.Categorical.from_codes` expects. Returns None when the column
+/// holds anything other than text.
+pub fn dictionary_encode<'a>(rows: &'a [CQLiteRow], column: &str) -> Option<(Vec<i32>, Vec<&'a str>)> {
+    let mut codes = Vec::with_capacity(rows.len());
+    let mut categories: Vec<&str> = Vec::new();
+    let mut code_by_value: HashMap<&str, i32> = HashMap::new();
+    
+    for row in rows {
+        let code = match row.columns.get(column) {
+            Some(CQLValue::Text(value)) => *code_by_value.entry(value.as_str()).or_insert_with(|| {
+                categories.push(value.as_str());
+                (categories.len() - 1) as i32
+            }),
+            None | Some(CQLValue::Null) | Some(CQLValue::Empty) => -1,
+            Some(_) => return None,
+        };
+        codes.push(code);
+    }
+    
+    Some((codes, categories))
+}
+
 /// Type information for schema representation
 #[derive(Debug, Clone)]
 pub struct CQLTypeInfo {
@@ -411,4 +583,47 @@ mod tests {
         assert!(row.get_column("name").is_some());
         assert!(row.get_column("age").is_none());
     }
+    
+    #[test]
+    fn test_narrowest_numeric_dtypes() {
+        let rows: Vec<CQLiteRow> = [(1i64, 1.5f64, 300i64), (-100, 2.25, 70_000)]
+            .iter()
+            .map(|&(small, exact, wide)| {
+                let mut row = CQLiteRow::new();
+                row.add_column("small".to_string(), CQLValue::BigInt(small));
+                row.add_column("exact".to_string(), CQLValue::Double(exact));
+                row.add_column("wide".to_string(), CQLValue::BigInt(wide));
+                row.add_column("inexact".to_string(), CQLValue::Double(0.1));
+                row.add_column("name".to_string(), CQLValue::Text("x".to_string()));
+                row
+            })
+            .collect();
+        
+        let dtypes = narrowest_numeric_dtypes(&rows);
+        assert_eq!(dtypes.get("small"), Some(&"int8"));
+        assert_eq!(dtypes.get("exact"), Some(&"float32"));
+        assert_eq!(dtypes.get("wide"), Some(&"int32"));
+        assert_eq!(dtypes.get("inexact"), None);
+        assert_eq!(dtypes.get("name"), None);
+    }
+    
+    #[test]
+    fn test_dictionary_encode() {
+        let rows: Vec<CQLiteRow> = [Some("click"), Some("view"), None, Some("click")]
+            .iter()
+            .map(|value| {
+                let mut row = CQLiteRow::new();
+                if let Some(value) = value {
+                    row.add_column("event_type".to_string(), CQLValue::Text(value.to_string()));
+                }
+                row.add_column("id".to_string(), CQLValue::Int(1));
+                row
+            })
+            .collect();
+        
+        let (codes, categories) = dictionary_encode(&rows, "event_type").unwrap();
+        assert_eq!(codes, vec![0, 1, -1, 0]);
+        assert_eq!(categories, vec!["click", "view"]);
+        assert!(dictionary_encode(&rows, "id").is_none());
+    }
 }
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""
+Tests for async support: the reader pool and parallel query helpers.
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import cqlite
+
+
+class TestReaderPool:
+    """Test the LRU pool of async readers."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for name in ("a", "b", "c"):
+            path = os.path.join(self.temp_dir, f"ks-{name}-ka-1-Data.db")
+            Path(path).touch()
+            self.paths.append(path)
+        
+        # Readers would otherwise open real executors
+        self.executor_patch = patch('cqlite.async_support.AsyncQueryExecutor')
+        self.executor_patch.start()
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+        self.executor_patch.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_miss_opens_and_hit_reuses(self):
+        """Test that the first acquire opens a reader and later ones reuse it."""
+        pool = cqlite.ReaderPool()
+        path = self.paths[0]
+        
+        assert path not in pool
+        reader = pool.acquire(path)
+        reader.executor.open.assert_called_once()
+        
+        assert pool.acquire(path) is reader
+        assert reader.executor.open.call_count == 1
+        assert path in pool
+        assert len(pool) == 1
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used reader is dropped first."""
+        pool = cqlite.ReaderPool(max_size=2)
+        a, b, c = self.paths
+        
+        reader_a = pool.acquire(a)
+        pool.acquire(b)
+        pool.acquire(a)  # a is now the most recently used
+        pool.acquire(c)
+        
+        assert len(pool) == 2
+        assert a in pool and c in pool
+        assert b not in pool
+        assert pool.acquire(a) is reader_a
+    
+    def test_reader_options_passed_through(self):
+        """Test that pool options are used for new readers."""
+        pool = cqlite.ReaderPool(chunk_size=128, use_mmap=False)
+        reader = pool.acquire(self.paths[0])
+        
+        assert reader.chunk_size == 128
+        assert reader.use_mmap is False
+    
+    async def test_get_context_manager(self):
+        """Test borrowing a reader with async with."""
+        pool = cqlite.ReaderPool()
+        path = self.paths[0]
+        
+        async with pool.get(path) as reader:
+            assert reader is pool.acquire(path)
+        
+        # Leaving the block keeps the reader pooled
+        assert path in pool
+        async with pool.get(path) as again:
+            assert again is reader
+    
+    def test_clear(self):
+        """Test dropping all pooled readers."""
+        pool = cqlite.ReaderPool()
+        for path in self.paths:
+            pool.acquire(path)
+        
+        pool.clear()
+        assert len(pool) == 0
+        assert self.paths[0] not in pool
+
+
+
+class TestIterParallelQueryResults:
+    """Test yielding parallel query results as they complete."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sstable_path = os.path.join(self.temp_dir, "ks-users-ka-1-Data.db")
+        Path(self.sstable_path).touch()
+        
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished = []
+        
+        async def query(reader, sql, timeout=None):
+            # "SELECT <delay>" sleeps for delay/100 seconds and returns it
+            delay = int(sql.split()[1])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(delay / 100)
+            finally:
+                self.in_flight -= 1
+            self.finished.append(sql)
+            return [{"delay": delay}]
+        
+        self.patches = [
+            patch('cqlite.async_support.AsyncQueryExecutor'),
+            patch('cqlite.async_support.AsyncSSTableReader.query', new=query),
+        ]
+        for p in self.patches:
+            p.start()
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    async def collect(self, queries, **kwargs):
+        return [item async for item in cqlite.iter_parallel_query_results(self.sstable_path, queries, **kwargs)]
+    
+    async def test_yields_in_completion_order(self):
+        """Test that results arrive as queries finish, tagged with their index."""
+        results = await self.collect(["SELECT 5", "SELECT 1", "SELECT 3"])
+        
+        assert [index for index, _ in results] == [1, 2, 0]
+        assert dict(results) == {0: [{"delay": 5}], 1: [{"delay": 1}], 2: [{"delay": 3}]}
+    
+    async def test_respects_max_concurrent(self):
+        """Test that no more than max_concurrent queries run at once."""
+        results = await self.collect(["SELECT 1"] * 6, max_concurrent=2)
+        
+        assert sorted(index for index, _ in results) == list(range(6))
+        assert self.max_in_flight == 2
+    
+    async def test_early_exit_cancels_remaining(self):
+        """Test that stopping early cancels the queries still running."""
+        results = cqlite.iter_parallel_query_results(self.sstable_path, ["SELECT 1", "SELECT 50"])
+        
+        index, _ = await results.__anext__()
+        await results.aclose()
+        await asyncio.sleep(0)
+        
+        assert index == 0
+        assert self.in_flight == 0
+        assert self.finished == ["SELECT 1"]
+    
+    async def test_no_queries(self):
+        """Test that an empty batch yields nothing."""
+        assert await self.collect([]) == []
+
+
+class TestReduce:
+    """Test chunk-wise column reductions."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        pytest.importorskip("numpy")
+        self.temp_dir = tempfile.mkdtemp()
+        self.sstable_path = os.path.join(self.temp_dir, "ks-events-ka-1-Data.db")
+        Path(self.sstable_path).touch()
+        
+        self.chunks = [
+            {"revenue": [1.5, 2.5], "quantity": [1, 2]},
+            {"revenue": [4.0], "quantity": [3]},
+        ]
+        
+        async def column_chunks(reader, sql, chunk_size=None):
+            for chunk in self.chunks:
+                yield chunk
+        
+        self.patches = [
+            patch('cqlite.async_support.AsyncQueryExecutor'),
+            patch('cqlite.async_support.AsyncSSTableReader._column_chunks', new=column_chunks),
+        ]
+        for p in self.patches:
+            p.start()
+        self.reader = cqlite.AsyncSSTableReader(self.sstable_path)
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    async def test_folds_columns_in_order(self):
+        """Test that the reducer sees one array per requested column, per chunk."""
+        total = await self.reader.reduce(
+            "SELECT revenue, quantity FROM events",
+            lambda acc, revenue, quantity: acc + float((revenue * quantity).sum()),
+            0.0,
+            columns=["revenue", "quantity"],
+        )
+        
+        assert total == 1.5 + 5.0 + 12.0
+    
+    async def test_unknown_column(self):
+        """Test that a misspelled column raises instead of reading as NULLs."""
+        with pytest.raises(KeyError, match="revenu"):
+            await self.reader.reduce(
+                "SELECT revenue FROM events",
+                lambda acc, revenue: acc + revenue.sum(),
+                0.0,
+                columns=["revenu"],
+            )
+
+
+class TestDistinctColumn:
+    """Test Arrow-backed distinct values across chunks."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pa = pytest.importorskip("pyarrow")
+        self.temp_dir = tempfile.mkdtemp()
+        self.sstable_path = os.path.join(self.temp_dir, "ks-events-ka-1-Data.db")
+        Path(self.sstable_path).touch()
+        
+        self.chunks = []
+        
+        async def column_chunks(reader, sql, chunk_size=None):
+            for chunk in self.chunks:
+                yield chunk
+        
+        self.patches = [
+            patch('cqlite.async_support.AsyncQueryExecutor'),
+            patch('cqlite.async_support.AsyncSSTableReader._column_chunks', new=column_chunks),
+        ]
+        for p in self.patches:
+            p.start()
+        self.reader = cqlite.AsyncSSTableReader(self.sstable_path)
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    async def test_merges_chunks(self):
+        """Test that values are deduplicated across chunks."""
+        self.chunks = [{"user_id": ["a", "b", "a"]}, {"user_id": ["b", "c"]}]
+        
+        users = await self.reader.distinct_column("SELECT user_id FROM events", "user_id")
+        assert sorted(users.to_pylist()) == ["a", "b", "c"]
+    
+    async def test_null_chunk_takes_column_type(self):
+        """Test that an all-NULL chunk merges with typed chunks."""
+        self.chunks = [{"user_id": [None, None]}, {"user_id": ["a"]}]
+        
+        users = await self.reader.distinct_column("SELECT user_id FROM events", "user_id")
+        assert users.type == self.pa.string()
+        assert set(users.to_pylist()) == {"a", None}
+    
+    async def test_no_rows_is_null_typed(self):
+        """Test that an empty result is a null-typed array that merges with any other."""
+        empty = await self.reader.distinct_column("SELECT user_id FROM events", "user_id")
+        
+        assert len(empty) == 0
+        assert empty.type == self.pa.null()
+        merged = self.pa.concat_arrays([empty.cast(self.pa.string()), self.pa.array(["a"])])
+        assert merged.to_pylist() == ["a"]
+    
+    async def test_unknown_column(self):
+        """Test that a column missing from the result raises KeyError."""
+        self.chunks = [{"user_id": ["a"]}]
+        
+        with pytest.raises(KeyError):
+            await self.reader.distinct_column("SELECT user_id FROM events", "userid")
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v"])
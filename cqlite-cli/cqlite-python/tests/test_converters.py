@@ -0,0 +1,141 @@
+"""
+Tests for the schema-specialized converters: generated row converters and
+whole-column conversion.
+"""
+
+import decimal
+import uuid
+
+import pytest
+
+from cqlite.types import convert_cql_column, convert_cql_value, make_row_converter
+
+
+class TestMakeRowConverter:
+    """Test row converters generated from a schema."""
+    
+    COLUMNS = [
+        ("id", "int"),
+        ("name", "text"),
+        ("active", "boolean"),
+        ("balance", "decimal"),
+        ("user_id", "uuid"),
+        ("tags", "list<text>"),
+    ]
+    
+    ROW = ("7", "Ann", "true", "12.50", "123e4567-e89b-12d3-a456-426614174000", ["a", "b"])
+    
+    def test_converts_row(self):
+        """Test converting one row to a dict."""
+        convert_row = make_row_converter([("id", "int"), ("tags", "list<text>")])
+        
+        assert convert_row(("7", ["a"])) == {"id": 7, "tags": ["a"]}
+    
+    def test_matches_convert_cql_value(self):
+        """Test that each column matches per-value conversion."""
+        convert_row = make_row_converter(self.COLUMNS)
+        
+        expected = {
+            name: convert_cql_value(value, cql_type)
+            for (name, cql_type), value in zip(self.COLUMNS, self.ROW)
+        }
+        assert convert_row(self.ROW) == expected
+        assert isinstance(expected["balance"], decimal.Decimal)
+        assert isinstance(expected["user_id"], uuid.UUID)
+    
+    def test_nulls_pass_through(self):
+        """Test that None stays None for every type."""
+        convert_row = make_row_converter(self.COLUMNS)
+        
+        assert convert_row((None,) * len(self.COLUMNS)) == {name: None for name, _ in self.COLUMNS}
+    
+    def test_row_length_mismatch(self):
+        """Test that rows with too few or too many values are rejected."""
+        convert_row = make_row_converter([("id", "int"), ("name", "text")])
+        
+        with pytest.raises(ValueError):
+            convert_row(("1",))
+        with pytest.raises(ValueError):
+            convert_row(("1", "a", "extra"))
+    
+    def test_unusual_column_names(self):
+        """Test that column names are embedded safely in the generated code."""
+        convert_row = make_row_converter([("it's", "int"), ('say "hi"', "text")])
+        
+        assert convert_row(("1", "x")) == {"it's": 1, 'say "hi"': "x"}
+    
+    def test_no_columns(self):
+        """Test a converter for an empty schema."""
+        assert make_row_converter([])(()) == {}
+
+
+class TestConvertCqlColumn:
+    """Test whole-column conversion to NumPy arrays."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.np = pytest.importorskip("numpy")
+        self.convert = convert_cql_column
+    
+    def test_integer_column(self):
+        """Test that integer columns become int64 in one cast."""
+        column = self.convert(["1", "2", "3"], "bigint")
+        
+        assert column.dtype == self.np.int64
+        assert column.tolist() == [1, 2, 3]
+    
+    def test_integer_column_with_nulls(self):
+        """Test that nulls in an integer column fall back to objects."""
+        column = self.convert(["1", None], "int")
+        
+        assert column.dtype == object
+        assert column.tolist() == [1, None]
+    
+    def test_integer_overflow(self):
+        """Test that values outside int64 fall back to Python ints."""
+        big = 2 ** 70
+        column = self.convert([str(big), "1"], "varint")
+        
+        assert column.dtype == object
+        assert column.tolist() == [big, 1]
+        
+        column = self.convert([str(big)], "bigint")
+        assert column.dtype == object
+        assert column[0] == big
+    
+    def test_float_column_with_nulls(self):
+        """Test that nulls in a float column become NaN."""
+        column = self.convert([1.5, None], "double")
+        
+        assert column.dtype == self.np.float64
+        assert column[0] == 1.5
+        assert self.np.isnan(column[1])
+    
+    def test_boolean_column(self):
+        """Test boolean columns with and without nulls."""
+        column = self.convert(["true", "false", True], "boolean")
+        assert column.dtype == self.np.bool_
+        assert column.tolist() == [True, False, True]
+        
+        column = self.convert(["true", None], "boolean")
+        assert column.dtype == object
+        assert column.tolist() == [True, None]
+    
+    def test_object_columns(self):
+        """Test that untyped columns match per-value conversion."""
+        column = self.convert(["1.25", None], "decimal")
+        assert column.tolist() == [decimal.Decimal("1.25"), None]
+        
+        # Nested values stay single elements
+        column = self.convert([["a", "b"], ["c"]], "list<text>")
+        assert column.shape == (2,)
+        assert column.tolist() == [["a", "b"], ["c"]]
+    
+    def test_empty_column(self):
+        """Test converting an empty column."""
+        assert len(self.convert([], "int")) == 0
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,307 @@
+"""
+Tests for the Python-side SSTableReader helpers and result types.
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import cqlite
+from cqlite.reader import QueryResult, QueryRow, SSTableReader, _open_cached
+
+
+class TestQueryResult:
+    """Test the column-oriented QueryResult and its row views."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.columns = {
+            "id": [1, 2, 3],
+            "name": ["Ann", "Bob", None],
+            "age": ["30", "41", "52"],
+        }
+        self.result = QueryResult(self.columns, {"age": "int"})
+    
+    def test_shape(self):
+        """Test row count and column order."""
+        assert len(self.result) == 3
+        assert self.result.columns == ["id", "name", "age"]
+        assert self.result.column("name") == ["Ann", "Bob", None]
+        assert len(QueryResult({})) == 0
+    
+    def test_row_access(self):
+        """Test indexing rows, including negative indexes."""
+        row = self.result[1]
+        assert isinstance(row, QueryRow)
+        assert row["name"] == "Bob"
+        assert self.result[-1]["id"] == 3
+        
+        with pytest.raises(IndexError):
+            self.result[3]
+        with pytest.raises(IndexError):
+            self.result.row(-4)
+    
+    def test_row_is_read_only_mapping(self):
+        """Test that rows behave like dicts without copying."""
+        row = self.result.row(0)
+        
+        assert list(row) == ["id", "name", "age"]
+        assert len(row) == 3
+        assert dict(row) == {"id": 1, "name": "Ann", "age": "30"}
+        assert row.get("missing") is None
+        with pytest.raises(TypeError):
+            row["id"] = 5
+    
+    def test_row_views_read_columns(self):
+        """Test that rows reflect the underlying columns rather than copies."""
+        row = self.result[0]
+        self.columns["id"][0] = 100
+        assert row["id"] == 100
+    
+    def test_iteration_and_to_dicts(self):
+        """Test that iteration and to_dicts match the row-oriented format."""
+        assert [row["id"] for row in self.result] == [1, 2, 3]
+        assert self.result.to_dicts() == [
+            {"id": 1, "name": "Ann", "age": "30"},
+            {"id": 2, "name": "Bob", "age": "41"},
+            {"id": 3, "name": None, "age": "52"},
+        ]
+    
+    def test_typed_column_array(self):
+        """Test that typed columns are converted once to NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        
+        ages = self.result["age"]
+        assert ages.dtype == np.int64
+        assert ages.tolist() == [30, 41, 52]
+        assert self.result["age"] is ages
+        
+        # Untyped columns are wrapped as-is
+        assert self.result["id"].tolist() == [1, 2, 3]
+        # Row views still see the raw values
+        assert self.result[0]["age"] == "30"
+
+
+
+class TestReaderConstruction:
+    """Test the Python-only constructor arguments around the core reader."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sstable_path = os.path.join(self.temp_dir, "test-users-ka-1-Data.db")
+        Path(self.sstable_path).touch()
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    @patch('cqlite.reader._advise_readahead')
+    def test_readahead_mb(self, mock_advise):
+        """Test that readahead_mb is accepted and hints the leading bytes of Data.db."""
+        reader = SSTableReader(self.sstable_path, readahead_mb=4)
+        
+        assert isinstance(reader, SSTableReader)
+        assert reader.sstable_path == self.sstable_path
+        mock_advise.assert_called_once_with(self.sstable_path, 4 << 20)
+    
+    @patch('cqlite.reader._advise_readahead')
+    def test_readahead_disabled_by_default(self, mock_advise):
+        """Test that no hint is issued unless readahead_mb is set."""
+        SSTableReader(self.sstable_path)
+        
+        mock_advise.assert_not_called()
+    
+    def test_python_only_arguments(self):
+        """Test that Python-only keywords aren't passed to the core reader."""
+        schema = {"columns": [{"name": "id", "type": "int"}]}
+        reader = SSTableReader(self.sstable_path, schema=schema, auto_detect_schema=False, readahead_mb=1)
+        
+        assert reader.schema == schema
+    
+    def test_missing_file(self):
+        """Test that the core still validates the path."""
+        with pytest.raises(cqlite.SSTableError):
+            SSTableReader(os.path.join(self.temp_dir, "missing-Data.db"), readahead_mb=1)
+
+
+class TestOpenCached:
+    """Test the per-session reader cache behind open_cached()."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sstable_path = os.path.join(self.temp_dir, "test-users-ka-1-Data.db")
+        Path(self.sstable_path).touch()
+        _open_cached.cache_clear()
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        _open_cached.cache_clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_reuses_reader(self):
+        """Test that repeated opens of one file share a reader."""
+        reader = cqlite.open_cached(self.sstable_path)
+        
+        assert isinstance(reader, cqlite.SSTableReader)
+        assert cqlite.open_cached(self.sstable_path) is reader
+    
+    def test_same_file_by_relative_path(self):
+        """Test that the cache is keyed by absolute path."""
+        reader = cqlite.open_cached(self.sstable_path)
+        relative = os.path.relpath(self.sstable_path)
+        
+        assert cqlite.open_cached(relative) is reader
+    
+    def test_modified_file_gets_new_reader(self):
+        """Test that a rewritten file is reopened."""
+        reader = cqlite.open_cached(self.sstable_path)
+        
+        stat = os.stat(self.sstable_path)
+        os.utime(self.sstable_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        fresh = cqlite.open_cached(self.sstable_path)
+        assert fresh is not reader
+        assert cqlite.open_cached(self.sstable_path) is fresh
+    
+    def test_missing_file(self):
+        """Test that a missing file raises instead of being cached."""
+        with pytest.raises(OSError):
+            cqlite.open_cached(os.path.join(self.temp_dir, "missing-Data.db"))
+
+
+class TestExportAllFormats:
+    """Test streaming export through the per-format batch writers."""
+    
+    BATCHES = [
+        {"id": [1, 2], "name": ["Ann", "Bob"], "score": [1.5, None]},
+        {"id": [3], "name": ["Cy, Jr."], "score": [3.0]},
+    ]
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sstable_path = os.path.join(self.temp_dir, "test-users-ka-1-Data.db")
+        Path(self.sstable_path).touch()
+        self.output_base = os.path.join(self.temp_dir, "export")
+        self.reader = SSTableReader(self.sstable_path)
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    @patch('cqlite._core.SSTableReader.iter_batches')
+    def test_csv_and_json_across_batches(self, mock_iter_batches):
+        """Test that every batch lands in every streamed format, in order."""
+        mock_iter_batches.return_value = iter(self.BATCHES)
+        
+        summary = self.reader.export_all_formats(
+            "SELECT * FROM users", self.output_base, ["csv", "json"], batch_size=2
+        )
+        mock_iter_batches.assert_called_once_with("SELECT * FROM users", 2)
+        
+        assert list(summary) == ["csv", "json"]
+        assert all(result["success"] for result in summary.values())
+        assert summary["csv"]["stats"]["rows_written"] == 3
+        assert summary["json"]["stats"]["columns_written"] == 3
+        
+        with open(f"{self.output_base}.csv", newline="") as f:
+            assert list(csv.reader(f)) == [
+                ["id", "name", "score"],
+                ["1", "Ann", "1.5"],
+                ["2", "Bob", ""],
+                ["3", "Cy, Jr.", "3.0"],
+            ]
+        with open(f"{self.output_base}.json") as f:
+            assert [json.loads(line) for line in f] == [
+                {"id": 1, "name": "Ann", "score": 1.5},
+                {"id": 2, "name": "Bob", "score": None},
+                {"id": 3, "name": "Cy, Jr.", "score": 3.0},
+            ]
+    
+    @patch('cqlite._core.SSTableReader.iter_batches')
+    def test_failing_writer_does_not_stop_others(self, mock_iter_batches):
+        """Test that one format failing leaves the other formats intact."""
+        mock_iter_batches.return_value = iter(self.BATCHES)
+        
+        with patch('cqlite.reader._JsonLinesBatchWriter.write', side_effect=ValueError("disk full")):
+            summary = self.reader.export_all_formats("SELECT * FROM users", self.output_base, ["csv", "json"])
+        
+        assert summary["json"] == {"success": False, "error": "disk full"}
+        assert summary["csv"]["success"]
+        assert summary["csv"]["stats"]["rows_written"] == 3
+    
+    @patch('cqlite._core.SSTableReader.iter_batches')
+    def test_scan_failure_fails_every_format(self, mock_iter_batches):
+        """Test that an error from the scan is reported for each format."""
+        def batches(sql, batch_size):
+            yield self.BATCHES[0]
+            raise RuntimeError("corrupt block")
+        mock_iter_batches.side_effect = batches
+        
+        summary = self.reader.export_all_formats("SELECT * FROM users", self.output_base, ["csv", "json"])
+        
+        assert summary == {
+            "csv": {"success": False, "error": "corrupt block"},
+            "json": {"success": False, "error": "corrupt block"},
+        }
+    
+    @patch('cqlite._core.SSTableReader.export_multi_format')
+    @patch('cqlite._core.SSTableReader.iter_batches')
+    def test_buffered_formats_use_core_exporter(self, mock_iter_batches, mock_export):
+        """Test that Excel goes through the core exporter and results keep format order."""
+        mock_iter_batches.return_value = iter(self.BATCHES)
+        mock_export.return_value = {"excel": {"success": True}}
+        
+        summary = self.reader.export_all_formats("SELECT * FROM users", self.output_base, ["excel", "csv"])
+        
+        mock_export.assert_called_once_with("SELECT * FROM users", self.output_base, ["excel"])
+        assert list(summary) == ["excel", "csv"]
+        assert summary["excel"] == {"success": True}
+        assert summary["csv"]["success"]
+    
+    @patch('cqlite._core.SSTableReader.iter_batches')
+    def test_parquet(self, mock_iter_batches):
+        """Test that Parquet batches are written to one file."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        mock_iter_batches.return_value = iter(self.BATCHES)
+        
+        summary = self.reader.export_all_formats("SELECT * FROM users", self.output_base, ["parquet"])
+        
+        assert summary["parquet"]["success"]
+        table = pq.read_table(f"{self.output_base}.parquet")
+        assert table.to_pylist() == [
+            {"id": 1, "name": "Ann", "score": 1.5},
+            {"id": 2, "name": "Bob", "score": None},
+            {"id": 3, "name": "Cy, Jr.", "score": 3.0},
+        ]
+    
+    @patch('cqlite._core.SSTableReader.iter_batches')
+    def test_parquet_promotes_all_null_batches(self, mock_iter_batches):
+        """Test that a column that is all null in the first batch takes its type from later batches."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        mock_iter_batches.return_value = iter([
+            {"id": [1], "score": [None]},
+            {"id": [2], "score": [None]},
+            {"id": [3], "score": [2.5]},
+        ])
+        
+        summary = self.reader.export_all_formats("SELECT * FROM users", self.output_base, ["parquet"])
+        
+        assert summary["parquet"]["success"]
+        assert summary["parquet"]["stats"]["rows_written"] == 3
+        table = pq.read_table(f"{self.output_base}.parquet")
+        assert table.schema.field("score").type == pa.float64()
+        assert table.column("score").to_pylist() == [None, None, 2.5]
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v"])
@@ -213,6 +213,16 @@ class TestValueConversion:
         assert result.minute == 30
         assert result.second == 45
     
+    def test_native_date_time_conversion(self):
+        """Test date/time conversion from SSTable native integer encodings."""
+        # Days since the Unix epoch
+        assert convert_cql_value(19716, "date") == datetime.date(2023, 12, 25)
+        assert convert_cql_value(0, "date") == datetime.date(1970, 1, 1)
+        
+        # Nanoseconds since midnight
+        nanos = ((10 * 60 + 30) * 60 + 45) * 1_000_000_000 + 5_000
+        assert convert_cql_value(nanos, "time") == datetime.time(10, 30, 45, 5)
+    
     def test_decimal_conversion(self):
         """Test decimal conversion."""
         decimal_str = "123.456789"
@@ -0,0 +1,93 @@
+"""
+Tests for result formatting utilities.
+"""
+
+import datetime
+import itertools
+import json
+
+import pytest
+
+from cqlite.utils import format_query_results, format_query_results_stream
+
+
+ROWS = [
+    {"id": 1, "name": "Ann", "joined": datetime.date(2024, 1, 2), "note": None},
+    {"id": 22, "name": "Bob Builder", "joined": datetime.date(2023, 5, 6), "note": "x" * 40},
+]
+
+# Output of the original (pre-streaming) format_query_results for ROWS
+EXPECTED_TABLE = (
+    "| id | joined     | name        | note                                     |\n"
+    "+----+------------+-------------+------------------------------------------+\n"
+    "| 1  | 2024-01-02 | Ann         | None                                     |\n"
+    "| 22 | 2023-05-06 | Bob Builder | " + "x" * 40 + " |"
+)
+EXPECTED_NARROW_TABLE = (
+    "| id    | joined | name  | note       |\n"
+    "+-------+-------+-------+------------+\n"
+    "| 1     | 20... | Ann   | None       |\n"
+    "| 22    | 20... | Bo... | xxxxxxx... |"
+)
+EXPECTED_CSV = (
+    "id,name,joined,note\n"
+    "1,Ann,2024-01-02,None\n"
+    "22,Bob Builder,2023-05-06," + "x" * 40
+)
+
+
+class TestFormatQueryResultsStream:
+    """Test that streamed formatting matches the one-shot output byte for byte."""
+    
+    def stream(self, results, *args, **kwargs):
+        """Join the streamed chunks into one string."""
+        return "".join(format_query_results_stream(results, *args, **kwargs))
+    
+    def test_table(self):
+        """Test the table format, including truncation to max_width."""
+        assert self.stream(ROWS, "table") == EXPECTED_TABLE
+        assert self.stream(ROWS, "table", max_width=30) == EXPECTED_NARROW_TABLE
+        assert format_query_results(ROWS, "table") == EXPECTED_TABLE
+    
+    def test_json(self):
+        """Test the JSON format against json.dumps."""
+        expected = json.dumps(ROWS, indent=2, default=str)
+        
+        assert self.stream(ROWS, "json") == expected
+        assert format_query_results(ROWS, "json") == expected
+    
+    def test_csv(self):
+        """Test the CSV format."""
+        assert self.stream(ROWS, "csv") == EXPECTED_CSV
+        assert format_query_results(ROWS, "csv") == EXPECTED_CSV
+    
+    def test_max_rows(self):
+        """Test that max_rows limits every format."""
+        for format_type in ("table", "json", "csv"):
+            assert self.stream(ROWS, format_type, max_rows=1) == format_query_results(ROWS[:1], format_type)
+        assert self.stream(ROWS, "csv", max_rows=1) == "id,name,joined,note\n1,Ann,2024-01-02,None"
+    
+    def test_no_results(self):
+        """Test the message for an empty result."""
+        for format_type in ("table", "json", "csv"):
+            assert self.stream([], format_type) == "No results found."
+    
+    def test_unsupported_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            self.stream(ROWS, "xml")
+    
+    def test_consumes_iterables_lazily(self):
+        """Test that JSON and CSV stream from any iterable, one row per chunk."""
+        chunks = list(format_query_results_stream(iter(ROWS), "csv"))
+        assert len(chunks) == 1 + len(ROWS)
+        assert "".join(chunks) == EXPECTED_CSV
+        
+        # An unbounded source is fine as long as max_rows stops it
+        rows = ({"n": n} for n in itertools.count())
+        assert self.stream(rows, "json", max_rows=2) == json.dumps([{"n": 0}, {"n": 1}], indent=2)
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v"])